@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+from typing import Dict, List
+
+import path_util  # noqa: F401
+
+from hummingbot import init_logging
+from hummingbot.client.config.config_helpers import load_client_config_map_from_file
+from hummingbot.core.market_data_daemon import MarketDataDaemon
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Publishes order books in shared memory for the bots of this host.")
+        self.add_argument("markets",
+                          type=str,
+                          nargs="+",
+                          help="Connector and trading pairs to publish, e.g. binance:BTC-USDT,ETH-USDT")
+        self.add_argument("--depth",
+                          type=int,
+                          default=20,
+                          help="Number of levels published on each side of the order books.")
+        self.add_argument("--publish-interval",
+                          type=float,
+                          default=0.005,
+                          help="Seconds between the checks for updated order books.")
+
+
+def parse_markets(markets: List[str]) -> Dict[str, List[str]]:
+    parsed: Dict[str, List[str]] = {}
+    for market in markets:
+        connector_name, trading_pairs = market.split(":", 1)
+        parsed.setdefault(connector_name, []).extend(pair for pair in trading_pairs.split(",") if pair)
+    return parsed
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    client_config_map = load_client_config_map_from_file()
+    init_logging("hummingbot_logs.yml", client_config_map, strategy_file_path="market_data_daemon")
+    daemon = MarketDataDaemon(parse_markets(args.markets), depth=args.depth, publish_interval=args.publish_interval)
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -47,11 +47,9 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
-            joined_df = pd.concat([bids, asks], axis=1)
+            bids, asks = order_book.top_levels(lines)
+            joined_df = pd.DataFrame({"bid_price": bids[:, 0], "bid_volume": bids[:, 1],
+                                      "ask_price": asks[:, 0], "ask_volume": asks[:, 1]}).dropna(how="all")
             text_lines = [
                 "    " + line
                 for line in format_df_for_printout(joined_df, self.client_config_map.tables_format).split("\n")
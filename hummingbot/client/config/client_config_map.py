@@ -104,6 +104,12 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         ge=2,
         json_schema_extra={"prompt": lambda cm: "Set the order book collection depth (Default=20)"},
     )
+    market_data_collection_files: bool = Field(
+        default=False,
+        description="Capture the order books and public trades to compressed files in data/market_data, "
+                    "loadable by the backtesting data provider, instead of the database",
+        json_schema_extra={"prompt": lambda cm: "Capture market data to compressed files instead of the database?"},
+    )
     model_config = ConfigDict(title="market_data_collection")
 
 
@@ -218,6 +224,13 @@ class PaperTradeConfigMap(BaseClientModel):
             "e.g. {\"ETH\": 10, \"USDC\": 50000})"
         )},
     )
+    paper_trade_queue_position_fills: bool = Field(
+        default=False,
+        json_schema_extra={"prompt": lambda cm: (
+            "Fill paper trade limit orders only once the order book volume queued ahead of them is exhausted "
+            "(Yes/No)?"
+        )},
+    )
 
     @field_validator("paper_trade_account_balance", mode="before")
     @classmethod
@@ -269,6 +282,12 @@ class AutofillImportEnum(str, ClientConfigEnum):
 
 
 class DBMode(BaseClientModel, ABC):
+    db_write_behind: bool = Field(
+        default=False,
+        description="Write orders and trades to the database from a background thread instead of the main loop",
+        json_schema_extra={"prompt": lambda cm: "Write orders and trades to the database from a background thread?"},
+    )
+
     @abstractmethod
     def get_url(self, db_path: str) -> str:
         ...
@@ -806,6 +825,31 @@ class ClientConfigMap(BaseClientModel):
         )},
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    order_book_worker_processes: int = Field(
+        default=0,
+        ge=0,
+        description="Number of worker processes maintaining the order books of each spot connector, the trading pairs"
+                    "\nare split between them. With 0 the order books are maintained by the main process.",
+        json_schema_extra={"prompt": lambda cm: (
+            "How many worker processes should maintain the order books of each connector? (Enter 0 to disable)"
+        )},
+    )
+    coalesce_order_book_diffs: bool = Field(
+        default=False,
+        description="Merge the diffs pending for a trading pair and apply them to its order book at once, when the"
+                    "\norder books are maintained by the main process.",
+        json_schema_extra={"prompt": lambda cm: (
+            "Would you like to merge the pending order book diffs before applying them? (Yes/No)"
+        )},
+    )
+    shared_memory_order_books: bool = Field(
+        default=False,
+        description="Read the order books of the spot connectors from the market data daemon of the host"
+                    "\n(bin/hummingbot_market_data_daemon.py) instead of opening their own exchange streams.",
+        json_schema_extra={"prompt": lambda cm: (
+            "Would you like to read the order books from the market data daemon? (Yes/No)"
+        )},
+    )
     model_config = ConfigDict(title="client_config_map")
 
     @field_validator("kill_switch_mode", mode="before")
@@ -842,7 +886,7 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(f"The value must be one of {', '.join(list(AutofillImportEnum))}.")
         return v
 
-    @field_validator("send_error_logs", "fetch_pairs_from_all_exchanges", mode="before")
+    @field_validator("send_error_logs", "fetch_pairs_from_all_exchanges", "shared_memory_order_books", mode="before")
     @classmethod
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union, Optional
+from typing import Dict, Iterable, List, Set, Tuple, TYPE_CHECKING, Union, Optional
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -192,6 +192,15 @@ cdef class ConnectorBase(NetworkIterator):
     def tracking_states(self) -> Dict[str, any]:
         return {}
 
+    def tracking_states_for_orders(self, client_order_ids: Iterable[str]) -> Optional[Dict[str, any]]:
+        """
+        Returns the tracking states of the given orders only, skipping the orders no longer tracked. Connectors able to
+        serialize a single order override this, so the markets recorder can save only the orders that changed.
+        :param client_order_ids: the ids of the orders to serialize
+        :return: the states by order id, or None if the connector can only serialize all of them with `tracking_states`
+        """
+        return None
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         """
         Restores the tracking states from a previously saved state.
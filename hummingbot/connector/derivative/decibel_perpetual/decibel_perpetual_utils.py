@@ -22,7 +22,7 @@ def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
 
 
 class DecibelPerpetualConfigMap(BaseConnectorConfigMap):
-    connector: str = Field(default="decibel_perpetual", const=True, client_data=None)
+    connector: str = Field(default="decibel_perpetual", client_data=None)
     decibel_perpetual_api_key: SecretStr = Field(
         default=...,
         client_data=ClientFieldData(
@@ -16,8 +16,9 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
         raise Exception(f"Connector {connector_name} OrderBookTracker class not found ({exception})")
 
 
-def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
+def create_paper_trade_market(exchange_name: str, trading_pairs: List[str], queue_position_fills: bool = False):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
     return PaperTradeExchange(tracker,
                               get_connector_class(exchange_name),
-                              exchange_name=exchange_name)
+                              exchange_name=exchange_name,
+                              queue_position_fills=queue_position_fills)
@@ -17,6 +17,15 @@ ctypedef cpp_set[CPPLimitOrder].iterator SingleTradingPairLimitOrdersIterator
 ctypedef cpp_set[CPPLimitOrder].reverse_iterator SingleTradingPairLimitOrdersRIterator
 ctypedef cpp_set[CPPOrderExpirationEntry] LimitOrderExpirationSet
 ctypedef cpp_set[CPPOrderExpirationEntry].iterator LimitOrderExpirationSetIterator
+ctypedef unordered_map[string, double] CheckedPrices
+
+
+cdef struct QueuePosition:
+    double price
+    double amount_ahead
+
+
+ctypedef unordered_map[string, QueuePosition] QueuePositions
 
 cdef class QuantizationParams:
     cdef:
@@ -31,6 +40,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
         LimitOrders _ask_limit_orders
+        CheckedPrices _bid_limit_orders_checked_prices
+        CheckedPrices _ask_limit_orders_checked_prices
+        bint _queue_position_fills
+        QueuePositions _queue_positions
         bint _paper_trade_market_initialized
         dict _trading_pairs
         object _queued_orders
@@ -75,7 +88,21 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrders *limit_orders_map_ptr,
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
+    cdef c_add_queue_position(self, bint is_buy, str trading_pair, string cpp_order_id, object price)
+    cdef c_remove_queue_position(self, const CPPLimitOrder *cpp_limit_order_ptr)
+    cdef c_update_queue_positions(self,
+                                  bint is_buy,
+                                  str trading_pair,
+                                  SingleTradingPairLimitOrders *orders_collection_ptr,
+                                  double worst_price)
+    cdef double c_get_amount_ahead(self, const CPPLimitOrder *cpp_limit_order_ptr)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_match_trade_to_queue_positions(self,
+                                          bint is_maker_buy,
+                                          LimitOrders *limit_orders_map_ptr,
+                                          LimitOrdersIterator *map_it_ptr,
+                                          double trade_price,
+                                          double trade_amount)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
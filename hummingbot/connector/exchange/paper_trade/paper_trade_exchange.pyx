@@ -50,6 +50,7 @@ if TYPE_CHECKING:
 
 ptm_logger = None
 s_decimal_0 = Decimal(0)
+NaN = float("nan")
 
 
 cdef class QuantizationParams:
@@ -158,7 +159,12 @@ cdef class PaperTradeExchange(ExchangeBase):
         exchange_name: str,
         balance_asset_limit: Optional[Dict[str, Dict[str, Decimal]]] = None,
         rate_limits_share_pct: Decimal = Decimal("100"),
+        queue_position_fills: bool = False,
     ):
+        """
+        :param queue_position_fills: fill the resting limit orders only once the volume ahead of them at their price
+        level, in the order book, is exhausted by trades and cancels, instead of as soon as a trade reaches their price
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         super().__init__(balance_asset_limit, rate_limits_share_pct)
         self._set_order_book_tracker(order_book_tracker)
@@ -169,6 +175,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._paper_trade_market_initialized = False
         self._trading_pairs = {}
         self._queued_orders = deque()
+        self._queue_position_fills = queue_position_fills
         self._quantization_params = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
@@ -196,6 +203,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 self.ORDER_BOOK_TRADE_EVENT_TAG,
                 self._order_book_trade_listener
             )
+        self._paper_trade_market_initialized = True
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -234,7 +242,6 @@ cdef class PaperTradeExchange(ExchangeBase):
         if all(self.status_dict.values()):
             if not self._paper_trade_market_initialized:
                 self.init_paper_trade_market()
-                self._paper_trade_market_initialized = True
             return True
         else:
             return False
@@ -275,6 +282,21 @@ cdef class PaperTradeExchange(ExchangeBase):
 
         return retval
 
+    @property
+    def queue_positions(self) -> Dict[str, float]:
+        """
+        Order book volume ahead of each resting limit order at its price level, by client order id, when the orders are
+        filled on their queue position. The orders are moved up their queues when a trade or the opposite top of book
+        reaches their price, so the volume of the orders further away may be out of date.
+        """
+        cdef:
+            QueuePositions.iterator it = self._queue_positions.begin()
+            dict retval = {}
+        while it != self._queue_positions.end():
+            retval[deref(it).first.decode("utf8")] = max(deref(it).second.amount_ahead, 0)
+            inc(it)
+        return retval
+
     @property
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
@@ -358,6 +380,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            if self._queue_position_fills:
+                self.c_update_queue_positions(True,
+                                              trading_pair_str,
+                                              limit_orders_collection_ptr,
+                                              float(quantized_price))
+                self.c_add_queue_position(True, trading_pair_str, cpp_order_id, quantized_price)
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -371,6 +399,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._bid_limit_orders_checked_prices.erase(cpp_trading_pair_str)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -418,6 +447,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            if self._queue_position_fills:
+                self.c_update_queue_positions(False,
+                                              trading_pair_str,
+                                              limit_orders_collection_ptr,
+                                              float(quantized_price))
+                self.c_add_queue_position(False, trading_pair_str, cpp_order_id, quantized_price)
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -431,6 +466,7 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            self._ask_limit_orders_checked_prices.erase(cpp_trading_pair_str)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -630,6 +666,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._queue_position_fills:
+                self.c_remove_queue_position(address(deref(orders_it)))
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -841,35 +879,73 @@ cdef class PaperTradeExchange(ExchangeBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        The pair is skipped without any Decimal arithmetic when none of its orders crossed the opposite side at the
+        last check and the opposite side only moved away from them since, i.e. the ask did not go down (or the bid up).
+        The quantized price the orders are compared to can't get closer to them in that case.
+
+        When the orders are filled on their queue position, the orders priced at the opposite top of book are only
+        filled once there's no volume left ahead of them at their price level, the orders beyond it are filled anyway.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
         """
         cdef:
-            str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            string cpp_trading_pair = deref(deref(map_it_ptr)).first
+            str trading_pair = cpp_trading_pair.decode("utf8")
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            CheckedPrices *checked_prices_ptr = (address(self._bid_limit_orders_checked_prices)
+                                                 if is_buy
+                                                 else address(self._ask_limit_orders_checked_prices))
+            CheckedPrices.iterator checked_it = checked_prices_ptr.find(cpp_trading_pair)
+            double opposite_top_price
+            object opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            bint crossed = False
+
+        try:
+            opposite_top_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            return
+        if checked_it != checked_prices_ptr.end():
+            if is_buy and opposite_top_price >= deref(checked_it).second:
+                return
+            if not is_buy and opposite_top_price <= deref(checked_it).second:
+                return
+        opposite_order_book_price = self.c_quantize_order_price(trading_pair, Decimal(str(opposite_top_price)))
+        if self._queue_position_fills:
+            self.c_update_queue_positions(is_buy, trading_pair, orders_collection_ptr, float(opposite_order_book_price))
 
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                crossed = True
+                if (not self._queue_position_fills
+                        or opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice()
+                        or self.c_get_amount_ahead(cpp_limit_order_ptr) <= 0):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+                crossed = True
+                if (not self._queue_position_fills
+                        or opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice()
+                        or self.c_get_amount_ahead(cpp_limit_order_ptr) <= 0):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        if not crossed:
+            deref(checked_prices_ptr)[cpp_trading_pair] = opposite_top_price
         for orders_it in process_order_its:
             self.c_process_limit_order(is_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
 
@@ -891,6 +967,87 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef c_add_queue_position(self, bint is_buy, str trading_pair, string cpp_order_id, object price):
+        """
+        Starts tracking the queue position of a new limit order, behind all the volume of its price level in the order
+        book, and watches the level to move the order up the queue when the level shrinks.
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double level_price = float(price)
+        order_book.c_watch_level(is_buy, level_price)
+        self._queue_positions[cpp_order_id] = QueuePosition(level_price,
+                                                            order_book.c_get_level_amount(is_buy, level_price))
+
+    cdef c_remove_queue_position(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        cdef:
+            QueuePositions.iterator it = self._queue_positions.find(cpp_limit_order_ptr.getClientOrderID())
+            OrderBook order_book
+        if it == self._queue_positions.end():
+            return
+        order_book = self.c_get_order_book(cpp_limit_order_ptr.getTradingPair().decode("utf8"))
+        order_book.c_unwatch_level(cpp_limit_order_ptr.getIsBuy(), deref(it).second.price)
+        self._queue_positions.erase(it)
+
+    cdef c_update_queue_positions(self,
+                                  bint is_buy,
+                                  str trading_pair,
+                                  SingleTradingPairLimitOrders *orders_collection_ptr,
+                                  double worst_price):
+        """
+        Moves the limit orders of a trading pair priced at worst_price or better up their queues. The volume ahead of an
+        order can't be more than the lowest amount its price level went through since the last update: the volume
+        removed from the level is taken as traded or cancelled ahead of the order, and the volume added to it as queued
+        behind the order. The levels record their lowest amount until they're read, so the orders further away are
+        updated when they're checked.
+
+        :param is_buy: are the limit orders on the bid side?
+        :param trading_pair: trading pair of the limit orders
+        :param orders_collection_ptr: pointer to the limit orders of the trading pair
+        :param worst_price: price of the last level updated
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
+            SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
+            QueuePositions.iterator position_it
+            QueuePosition *position_ptr = NULL
+            double level_price = NaN
+            double low_amount = 0
+
+        # The orders are sorted by price, so each level is read once
+        if is_buy:
+            while orders_rit != orders_collection_ptr.rend():
+                position_it = self._queue_positions.find(deref(orders_rit).getClientOrderID())
+                if position_it != self._queue_positions.end():
+                    position_ptr = address(deref(position_it).second)
+                    if position_ptr.price < worst_price:
+                        break
+                    if position_ptr.price != level_price:
+                        level_price = position_ptr.price
+                        low_amount = order_book.c_pop_level_low_amount(True, level_price)
+                    position_ptr.amount_ahead = min(position_ptr.amount_ahead, low_amount)
+                inc(orders_rit)
+        else:
+            while orders_it != orders_collection_ptr.end():
+                position_it = self._queue_positions.find(deref(orders_it).getClientOrderID())
+                if position_it != self._queue_positions.end():
+                    position_ptr = address(deref(position_it).second)
+                    if position_ptr.price > worst_price:
+                        break
+                    if position_ptr.price != level_price:
+                        level_price = position_ptr.price
+                        low_amount = order_book.c_pop_level_low_amount(False, level_price)
+                    position_ptr.amount_ahead = min(position_ptr.amount_ahead, low_amount)
+                inc(orders_it)
+
+    cdef double c_get_amount_ahead(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        cdef:
+            QueuePositions.iterator it = self._queue_positions.find(cpp_limit_order_ptr.getClientOrderID())
+        if it == self._queue_positions.end():
+            return 0
+        return deref(it).second.amount_ahead
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
@@ -917,6 +1074,18 @@ cdef class PaperTradeExchange(ExchangeBase):
             return
 
         orders_collection_ptr = address(deref(map_it).second)
+        if self._queue_position_fills:
+            self.c_update_queue_positions(is_maker_buy,
+                                          order_book_trade_event.trading_pair,
+                                          orders_collection_ptr,
+                                          float(trade_price))
+            self.c_match_trade_to_queue_positions(is_maker_buy,
+                                                  limit_orders_map_ptr,
+                                                  address(map_it),
+                                                  float(trade_price),
+                                                  float(trade_quantity))
+            return
+
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
@@ -938,6 +1107,60 @@ cdef class PaperTradeExchange(ExchangeBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_to_queue_positions(self,
+                                          bint is_maker_buy,
+                                          LimitOrders *limit_orders_map_ptr,
+                                          LimitOrdersIterator *map_it_ptr,
+                                          double trade_price,
+                                          double trade_amount):
+        """
+        Trigger the limit orders a trade went through, and the limit orders at the trade price once the traded amount
+        exceeds the volume ahead of them. The traded amount is taken off the volume ahead of the orders at the trade
+        price.
+
+        :param is_maker_buy: are the limit orders on the bid side?
+        :param limit_orders_map_ptr: pointer to the limit orders map
+        :param map_it_ptr: limit orders map iterator, which implies the trading pair of the trade
+        :param trade_price: price of the trade
+        :param trade_amount: amount of the trade
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
+            SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
+            vector[SingleTradingPairLimitOrdersIterator] process_order_its
+            QueuePositions.iterator position_it
+            QueuePosition *position_ptr = NULL
+
+        if is_maker_buy:
+            while orders_rit != orders_collection_ptr.rend():
+                position_it = self._queue_positions.find(deref(orders_rit).getClientOrderID())
+                if position_it != self._queue_positions.end():
+                    position_ptr = address(deref(position_it).second)
+                    if position_ptr.price < trade_price:
+                        break
+                    if position_ptr.price == trade_price:
+                        position_ptr.amount_ahead -= trade_amount
+                    if position_ptr.price > trade_price or position_ptr.amount_ahead < 0:
+                        process_order_its.push_back(getIteratorFromReverseIterator(
+                            <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                inc(orders_rit)
+        else:
+            while orders_it != orders_collection_ptr.end():
+                position_it = self._queue_positions.find(deref(orders_it).getClientOrderID())
+                if position_it != self._queue_positions.end():
+                    position_ptr = address(deref(position_it).second)
+                    if position_ptr.price > trade_price:
+                        break
+                    if position_ptr.price == trade_price:
+                        position_ptr.amount_ahead -= trade_amount
+                    if position_ptr.price < trade_price or position_ptr.amount_ahead < 0:
+                        process_order_its.push_back(orders_it)
+                inc(orders_it)
+
+        for orders_it in process_order_its:
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, map_it_ptr, orders_it)
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
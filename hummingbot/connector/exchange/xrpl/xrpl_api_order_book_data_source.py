@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 # XRPL imports
-from xrpl.asyncio.clients import AsyncWebsocketClient
+from xrpl.asyncio.clients import AsyncWebsocketClient, Client
 from xrpl.models.requests import BookOffers, Subscribe, SubscribeBook
 from xrpl.utils import get_order_book_changes, ripple_time_to_posix
 
@@ -33,7 +33,6 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._trade_messages_queue_key = CONSTANTS.TRADE_EVENT_TYPE
         self._diff_messages_queue_key = CONSTANTS.DIFF_EVENT_TYPE
         self._snapshot_messages_queue_key = CONSTANTS.SNAPSHOT_EVENT_TYPE
-        self._open_client_lock = asyncio.Lock()
 
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         return await self._connector.get_last_traded_prices(trading_pairs=trading_pairs)
@@ -47,74 +46,50 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :return: the response from the exchange (JSON dictionary)
         """
         base_currency, quote_currency = self._connector.get_currencies_from_trading_pair(trading_pair)
-        async with self._open_client_lock:
-            max_retries = len(self._connector._node_pool._nodes)
-            retry_count = 0
-            last_error = None
-
-            while retry_count < max_retries:
-                client: AsyncWebsocketClient | None = None
-                node_url: str | None = None
-                try:
-                    client = await self._get_client()
-                    node_url = client.url
-                    if not client.is_open():
-                        await client.open()
-                    if client._websocket is not None:
-                        client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
-                        client._websocket.ping_timeout = CONSTANTS.WEBSOCKET_CONNECTION_TIMEOUT
-                    orderbook_asks_task = self.fetch_order_book_side(
-                        client, "current", base_currency, quote_currency, CONSTANTS.ORDER_BOOK_DEPTH
-                    )
-                    orderbook_bids_task = self.fetch_order_book_side(
-                        client, "current", quote_currency, base_currency, CONSTANTS.ORDER_BOOK_DEPTH
-                    )
-                    orderbook_asks_info, orderbook_bids_info = await safe_gather(
-                        orderbook_asks_task, orderbook_bids_task
-                    )
-                    asks = orderbook_asks_info.result.get("offers", None)
-                    bids = orderbook_bids_info.result.get("offers", None)
-                    if asks is None or bids is None:
-                        raise ValueError(f"Error fetching order book snapshot for {trading_pair}")
-                    order_book = {
-                        "asks": asks,
-                        "bids": bids,
-                    }
-                    await client.close()
-                    return order_book
+        # The pooled client sends the requests through the connections kept open by the connector, trying another
+        # node when one fails, so the snapshots of all the pairs are fetched concurrently
+        client = await self._get_client()
+        try:
+            orderbook_asks_task = self.fetch_order_book_side(
+                client, "current", base_currency, quote_currency, CONSTANTS.ORDER_BOOK_DEPTH
+            )
+            orderbook_bids_task = self.fetch_order_book_side(
+                client, "current", quote_currency, base_currency, CONSTANTS.ORDER_BOOK_DEPTH
+            )
+            orderbook_asks_info, orderbook_bids_info = await safe_gather(orderbook_asks_task, orderbook_bids_task)
+            asks = orderbook_asks_info.result.get("offers", None)
+            bids = orderbook_bids_info.result.get("offers", None)
+            if asks is None or bids is None:
+                raise ValueError(f"Error fetching order book snapshot for {trading_pair}")
+        except Exception as e:
+            self.logger().error(
+                f"{type(e).__name__} Exception fetching order book snapshot for {trading_pair}: {e}",
+                exc_info=True,
+            )
+            raise
 
-                except (TimeoutError, asyncio.exceptions.TimeoutError, ConnectionError) as e:
-                    last_error = e
-                    if node_url is not None:
-                        self._connector._node_pool.mark_bad_node(node_url)
-                    self.logger().warning(
-                        f"Node {node_url} failed with {type(e).__name__} when fetching order book snapshot for {trading_pair}. "
-                        f"Retrying with different node... (Attempt {retry_count + 1}/{max_retries})"
-                    )
-                except Exception as e:
-                    if node_url is not None:
-                        self._connector._node_pool.mark_bad_node(node_url)
-                    self.logger().error(
-                        f"{type(e).__name__} Exception fetching order book snapshot for {trading_pair}: {e}",
-                        exc_info=True,
-                    )
-                    raise e
-                finally:
-                    if client is not None:
-                        await client.close()
-                    retry_count += 1
-
-            # If we've exhausted all nodes, raise the last error
-            if last_error is not None:
-                self.logger().error(
-                    f"All nodes failed when fetching order book snapshot for {trading_pair}. "
-                    f"Last error: {type(last_error).__name__}: {str(last_error)}"
-                )
-                raise last_error
-            raise Exception("Failed to fetch order book snapshot: All nodes failed")
+        return {
+            "asks": asks,
+            "bids": bids,
+        }
+
+    async def _request_order_book_snapshots(self, output: asyncio.Queue):
+        snapshots = await safe_gather(
+            *[self._order_book_snapshot(trading_pair=trading_pair) for trading_pair in self._trading_pairs],
+            return_exceptions=True,
+        )
+        errors = []
+        for trading_pair, snapshot in zip(self._trading_pairs, snapshots):
+            if isinstance(snapshot, Exception):
+                self.logger().error(f"Unexpected error fetching order book snapshot for {trading_pair}: {snapshot}")
+                errors.append(snapshot)
+            else:
+                output.put_nowait(snapshot)
+        if len(errors) > 0:
+            raise errors[0]
 
     async def fetch_order_book_side(
-        self, client: AsyncWebsocketClient, ledger_index, taker_gets, taker_pays, limit, try_count: int = 0
+        self, client: Client, ledger_index, taker_gets, taker_pays, limit, try_count: int = 0
     ):
         try:
             response = await client.request(
@@ -199,9 +174,12 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         pass
 
-    async def _get_client(self) -> AsyncWebsocketClient:
+    async def _get_client(self) -> Client:
         return await self._connector._get_async_client()
 
+    async def _get_subscription_client(self) -> AsyncWebsocketClient:
+        return await self._connector._get_subscription_client()
+
     async def _process_websocket_messages_for_pair(self, trading_pair: str):
         base_currency, quote_currency = self._connector.get_currencies_from_trading_pair(trading_pair)
         account = self._connector.auth.get_account()
@@ -221,7 +199,7 @@ class XRPLAPIOrderBookDataSource(OrderBookTrackerDataSource):
             client = None
             listener = None
             try:
-                client = await self._get_client()
+                client = await self._get_subscription_client()
                 async with client as ws_client:
                     if ws_client._websocket is not None:
                         ws_client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
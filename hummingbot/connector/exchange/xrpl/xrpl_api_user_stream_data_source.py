@@ -96,4 +96,4 @@ class XRPLAPIUserStreamDataSource(UserStreamTrackerDataSource):
         queue.put_nowait(event_message)
 
     async def _get_client(self) -> AsyncWebsocketClient:
-        return await self._connector._get_async_client()
+        return await self._connector._get_subscription_client()
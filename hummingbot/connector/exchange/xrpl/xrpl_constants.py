@@ -110,6 +110,9 @@ CLIENT_REFRESH_INTERVAL = 30
 WEBSOCKET_MAX_SIZE_BYTES = 2**22  # 4MB
 WEBSOCKET_CONNECTION_TIMEOUT = 30
 
+# Number of nodes the request connections are kept open to
+CLIENT_POOL_MAX_CONNECTIONS = 3
+
 # XRPL maximum digit for issued currency
 XRPL_MAX_DIGIT = 16
 
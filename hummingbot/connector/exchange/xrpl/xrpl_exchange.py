@@ -54,6 +54,7 @@ from hummingbot.connector.exchange.xrpl.xrpl_utils import (  # AddLiquidityReque
     PoolInfo,
     QuoteLiquidityResponse,
     RemoveLiquidityResponse,
+    XRPLClientPool,
     XRPLMarket,
     XRPLNodePool,
     _wait_for_final_transaction_outcome,
@@ -103,6 +104,7 @@ class XrplExchange(ExchangePyBase):
             proactive_switch_interval=100,
             cooldown=100,
         )
+        self._client_pool = XRPLClientPool(self._node_pool, max_connections=CONSTANTS.CLIENT_POOL_MAX_CONNECTIONS)
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
         self._xrpl_auth: XRPLAuth = self.authenticator
@@ -184,7 +186,16 @@ class XrplExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
-    async def _get_async_client(self):
+    async def _get_async_client(self) -> Client:
+        """
+        Returns the client sending requests through the connections of the client pool, kept open between requests.
+        """
+        return self._client_pool.client
+
+    async def _get_subscription_client(self) -> AsyncWebsocketClient:
+        """
+        Returns a client with its own connection, for the subscriptions streaming messages until it is closed.
+        """
         url = await self._node_pool.get_node()
         return AsyncWebsocketClient(url)
 
@@ -2263,11 +2274,11 @@ class XrplExchange(ExchangePyBase):
     async def _make_network_check_request(self):
         self._node_pool.add_burst_tokens(1)
         client = await self._get_async_client()
-        try:
-            await client.open()
-        finally:
-            # Ensure client is always closed to prevent memory leak
-            await client.close()
+        await client.open()
+
+    async def stop_network(self):
+        await super().stop_network()
+        await self._client_pool.close()
 
     async def _make_trading_rules_request(self) -> Dict[str, Any]:
         zeroTransferRate = 1000000000
@@ -2437,16 +2448,9 @@ class XrplExchange(ExchangePyBase):
         lock: Optional[Lock] = None,
         delay_time: float = 0.0,
     ) -> Response:
-        # Use proper context manager to prevent memory leaks
+        # The client pool already sends the request again through the other nodes when its node fails
         client = await self._get_async_client()
         try:
-            # Configure client before using in context manager
-            await client.open()
-            if hasattr(client, "_websocket") and client._websocket is not None:
-                client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
-                client._websocket.ping_timeout = CONSTANTS.WEBSOCKET_CONNECTION_TIMEOUT
-
-            # Use context manager properly - client is already opened
             if lock is not None:
                 async with lock:
                     resp = await client.request(request)
@@ -2457,20 +2461,12 @@ class XrplExchange(ExchangePyBase):
             return resp
 
         except Exception as e:
-            # If timeout error or connection error, mark node as bad
-            if isinstance(e, (TimeoutError, ConnectionError)):
-                self.logger().error(f"Node {client.url} is bad, marking as bad")
-                self._node_pool.mark_bad_node(client.url)
-
             if max_retries > 0:
                 await self._sleep(CONSTANTS.REQUEST_RETRY_INTERVAL)
                 return await self.request_with_retry(request, max_retries - 1, lock, delay_time)
             else:
                 self.logger().error(f"Max retries reached. Request {request} failed: {e}", exc_info=True)
                 raise e
-        finally:
-            # Ensure client is always closed to prevent memory leak
-            await client.close()
 
     def get_token_symbol_from_all_markets(self, code: str, issuer: str) -> Optional[str]:
         all_markets = self._make_xrpl_trading_pairs_request()
@@ -2,15 +2,19 @@ import asyncio
 import binascii
 import logging
 import time
-from collections import deque
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from decimal import Decimal
 from random import randrange
-from typing import Dict, Final, List, Optional, cast
+from typing import Dict, Final, List, Optional, Set, cast
 
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
+from websockets.exceptions import WebSocketException
 from xrpl.asyncio.account import get_next_valid_seq_number
 from xrpl.asyncio.clients import AsyncWebsocketClient, Client, XRPLRequestFailureException
+from xrpl.asyncio.clients.async_client import AsyncClient
+from xrpl.asyncio.clients.client import REQUEST_TIMEOUT as XRPL_REQUEST_TIMEOUT
+from xrpl.asyncio.clients.exceptions import XRPLWebsocketException
 from xrpl.asyncio.transaction import XRPLReliableSubmissionException
 from xrpl.asyncio.transaction.main import _LEDGER_OFFSET, _calculate_fee_per_transaction_type, _tx_needs_networkID
 from xrpl.models import Currency, IssuedCurrency, Request, Response, ServerInfo, Transaction, TransactionMetadata, Tx
@@ -31,6 +35,7 @@ from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_validators import validate_with_regex
 from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
 CENTRALIZED = True
@@ -756,6 +761,230 @@ class XRPLNodePool:
         return self._rate_limiter.burst_tokens
 
 
+@dataclass
+class XRPLNodeHealth:
+    latency: float = 0.0  # moving average of the response time of the node, in seconds
+    failures: int = 0  # failures since the last response received from the node
+
+
+class XRPLPooledClient(AsyncClient):
+    """
+    Client handed to the xrpl-py helpers (autofill, submit, wait for the transaction outcome...) sending its requests
+    through the connections of an XRPLClientPool. The connections are shared, so leaving its context or closing it
+    does not close them.
+    """
+
+    def __init__(self, client_pool: "XRPLClientPool"):
+        super().__init__(url="")
+        self._client_pool = client_pool
+
+    async def _request_impl(self, request: Request, *, timeout: float = XRPL_REQUEST_TIMEOUT) -> Response:
+        return await self._client_pool.request(request, timeout=timeout)
+
+    def is_open(self) -> bool:
+        return self._client_pool.is_open()
+
+    async def open(self):
+        await self._client_pool.open()
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self) -> "XRPLPooledClient":
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class XRPLClientPool:
+    """
+    Keeps websocket connections to a few nodes of an XRPLNodePool open, and shares them between all the requests of
+    the connector. Concurrent requests are multiplexed over the same connection, each response being matched to its
+    request by id, so only the first request sent to a node pays the handshake.
+
+    Every node is scored with the moving average of its response time, penalized by its recent failures and by the
+    requests already waiting on its connection. A request goes to the best scored connection, and is sent again
+    through another node when its node times out or drops the connection.
+    """
+
+    _logger = None
+    NODE_ERRORS = (TimeoutError, asyncio.TimeoutError, OSError, WebSocketException, XRPLWebsocketException)
+
+    def __init__(
+        self,
+        node_pool: XRPLNodePool,
+        max_connections: int = 3,
+        latency_smoothing: float = 0.2,
+        failure_penalty: float = 5.0,
+    ):
+        """
+        Args:
+            node_pool: the pool choosing the nodes and limiting the rate of the requests
+            max_connections: maximum number of nodes connected at the same time
+            latency_smoothing: weight of the last response time in the moving average of the latency of a node
+            failure_penalty: seconds added to the score of a node for each of its recent failures
+        """
+        self._node_pool = node_pool
+        self._max_connections = max_connections
+        self._latency_smoothing = latency_smoothing
+        self._failure_penalty = failure_penalty
+        self._connections: Dict[str, AsyncWebsocketClient] = {}
+        self._in_flight: Dict[AsyncWebsocketClient, int] = defaultdict(int)
+        self._connect_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._health: Dict[str, XRPLNodeHealth] = defaultdict(XRPLNodeHealth)
+        self._client = XRPLPooledClient(self)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def client(self) -> XRPLPooledClient:
+        return self._client
+
+    @property
+    def health(self) -> Dict[str, XRPLNodeHealth]:
+        return self._health
+
+    def is_open(self) -> bool:
+        return any(client.is_open() for client in self._connections.values())
+
+    def node_score(self, url: str) -> float:
+        """Lower is better: the expected time for a new request sent to the node to get its response"""
+        health = self._health[url]
+        in_flight = self._in_flight.get(self._connections.get(url), 0)
+        return (health.latency + self._failure_penalty * health.failures) * (1 + in_flight)
+
+    async def open(self):
+        """Makes sure a connection to a node is open"""
+        await self._connection(await self._select_node(set(), use_burst=True))
+
+    async def request(
+        self, request: Request, timeout: float = XRPL_REQUEST_TIMEOUT, use_burst: bool = True
+    ) -> Response:
+        """
+        Sends the request through the best scored connection, trying each node at most once. The timeout bounds the
+        whole call: the nodes tried after a failure only get the time left.
+
+        Raises the error of the last node tried when none of them answered in time.
+        """
+        failed_nodes = set()
+        last_error: Optional[Exception] = None
+        deadline = time.perf_counter() + timeout
+        for _ in range(len(self._node_pool._nodes)):
+            if time.perf_counter() >= deadline:
+                break
+            url = await self._select_node(failed_nodes, use_burst)
+            client = None
+            start = time.perf_counter()
+            try:
+                client = await asyncio.wait_for(self._connection(url), timeout=deadline - start)
+                self._in_flight[client] += 1
+                response = await client._request_impl(request, timeout=max(0.0, deadline - time.perf_counter()))
+            except self.NODE_ERRORS as e:
+                last_error = e
+                failed_nodes.add(url)
+                self._record_failure(url)
+                self.logger().warning(
+                    f"Request {request.method} failed on node {url} ({type(e).__name__}: {e}), "
+                    f"sending it through another node."
+                )
+                continue
+            finally:
+                if client is not None:
+                    await self._release(client)
+            self._record_response_time(url, time.perf_counter() - start)
+            return response
+
+        raise last_error or ConnectionError("No XRPL node available to send the request.")
+
+    async def close(self):
+        connections = list(self._connections.values())
+        self._connections.clear()
+        for client in connections:
+            await self._close_connection(client)
+
+    async def _select_node(self, failed_nodes: Set[str], use_burst: bool) -> str:
+        # The node pool applies the rate limit and rotates away from the nodes marked as bad
+        preferred = await self._node_pool.get_node(use_burst)
+        if preferred in failed_nodes:
+            remaining = [url for url in self._node_pool._nodes if url not in failed_nodes]
+            preferred = next((url for url in remaining if url not in self._node_pool._bad_nodes), remaining[0])
+        candidates = [
+            url
+            for url, client in self._connections.items()
+            if client.is_open() and url not in failed_nodes and url not in self._node_pool._bad_nodes
+        ]
+        if preferred not in candidates:
+            candidates.append(preferred)
+        return min(candidates, key=self.node_score)
+
+    async def _connection(self, url: str) -> AsyncWebsocketClient:
+        async with self._connect_locks[url]:
+            client = self._connections.get(url)
+            if client is not None and client.is_open():
+                return client
+            if client is not None:
+                self._retire(url)
+            while len(self._connections) >= self._max_connections:
+                self._retire(max(self._connections, key=self.node_score))
+
+            client = AsyncWebsocketClient(url)
+            start = time.perf_counter()
+            await client.open()
+            if client._websocket is not None:
+                client._websocket.max_size = CONSTANTS.WEBSOCKET_MAX_SIZE_BYTES
+                client._websocket.ping_timeout = CONSTANTS.WEBSOCKET_CONNECTION_TIMEOUT
+            if self._health[url].latency == 0:
+                self._health[url].latency = time.perf_counter() - start
+            self._connections[url] = client
+            self.logger().debug(f"Opened a pooled connection to XRPL node {url}")
+            return client
+
+    def _retire(self, url: str):
+        """Stops sending requests to the connection, closing it once the requests waiting on it are answered"""
+        client = self._connections.pop(url)
+        if self._in_flight.get(client, 0) == 0:
+            safe_ensure_future(self._close_connection(client))
+
+    async def _release(self, client: AsyncWebsocketClient):
+        if client not in self._in_flight:
+            return  # closed with the pool
+        self._in_flight[client] -= 1
+        # The connection also queues every response for its iterators, and nothing iterates the pooled connections
+        messages = client._messages
+        while messages is not None and not messages.empty():
+            messages.get_nowait()
+            messages.task_done()
+        if self._in_flight[client] == 0 and self._connections.get(client.url) is not client:
+            await self._close_connection(client)
+
+    async def _close_connection(self, client: AsyncWebsocketClient):
+        self._in_flight.pop(client, None)
+        try:
+            if client.is_open():
+                await client.close()
+        except Exception as e:
+            self.logger().debug(f"Error closing the connection to XRPL node {client.url}: {e}")
+
+    def _record_response_time(self, url: str, response_time: float):
+        health = self._health[url]
+        health.failures = 0
+        if health.latency == 0:
+            health.latency = response_time
+        else:
+            health.latency += self._latency_smoothing * (response_time - health.latency)
+
+    def _record_failure(self, url: str):
+        self._health[url].failures += 1
+        if url in self._connections:
+            self._retire(url)
+        self._node_pool.mark_bad_node(url)
+
+
 def parse_offer_create_transaction(tx: dict) -> dict:
     """
     Helper to parse an OfferCreate transaction and its metadata to extract price (quality) and quantity transferred.
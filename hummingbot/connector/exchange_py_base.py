@@ -4,7 +4,7 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -14,8 +14,8 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -23,6 +23,8 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.sharded_order_book_tracker import ShardedOrderBookTracker
+from hummingbot.core.data_type.shared_memory_order_book_tracker import SharedMemoryOrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -42,6 +44,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of order status or fills requests in flight while updating the tracked orders
+    ORDER_UPDATES_MAX_CONCURRENCY = 10
 
     def __init__(self,
                  balance_asset_limit: Optional[Dict[str, Dict[str, Decimal]]] = None,
@@ -61,7 +65,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = SlidingWindowThrottler(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -193,6 +197,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return {key: value.to_json() for key, value in self._order_tracker.all_updatable_orders.items()}
 
+    def tracking_states_for_orders(self, client_order_ids: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the JSON representation of the given orders that are still active
+        """
+        orders = self._order_tracker.all_updatable_orders
+        return {order_id: orders[order_id].to_json() for order_id in client_order_ids if order_id in orders}
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -751,6 +762,38 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return await self.order_book_tracker.remove_trading_pair(trading_pair)
 
+    def use_order_book_worker_processes(self, worker_processes: int):
+        """
+        Maintains the order books in worker processes instead of the event loop of this process, splitting the trading
+        pairs between them. Must be called before the network is started.
+
+        :param worker_processes: the number of worker processes
+        """
+        self._set_order_book_tracker(ShardedOrderBookTracker(
+            connector_name=self.name,
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain,
+            worker_processes=worker_processes))
+
+    def use_coalesced_order_book_diffs(self):
+        """
+        Merges the diffs pending for a trading pair per price level and applies them to its order book at once, instead
+        of applying them one by one.
+        """
+        self.order_book_tracker.coalesce_diffs = True
+
+    def use_shared_memory_order_books(self):
+        """
+        Reads the order books published by the market data daemon of the host instead of opening the exchange streams.
+        Must be called before the network is started.
+        """
+        self._set_order_book_tracker(SharedMemoryOrderBookTracker(
+            connector_name=self.name,
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain))
+
     # === loops and sync related methods ===
     #
     async def _trading_rules_polling_loop(self):
@@ -981,18 +1024,47 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
+        if len(orders) == 0:
+            return
+        orders_trade_updates = {}
+        try:
+            orders_trade_updates = await self._all_trade_updates_for_orders(orders=orders) or {}
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for all orders. Requesting them per order. Error: {request_error}",
+                exc_info=request_error,
+            )
+        orders_to_request = []
         for order in orders:
+            if order.client_order_id not in orders_trade_updates:
+                orders_to_request.append(order)
+                continue
             try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
+                for trade_update in orders_trade_updates[order.client_order_id]:
                     self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
+            except Exception as process_error:
                 self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
+                    f"Failed to process the trade updates of order {order.client_order_id} fetched for all orders. "
+                    f"Requesting them for the order. Error: {process_error}",
+                    exc_info=process_error,
                 )
+                orders_to_request.append(order)
+        await self._run_with_bounded_concurrency(self._update_order_fills, orders_to_request)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -1021,7 +1093,34 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        if len(orders) == 0:
+            return
+        orders_updates = {}
+        try:
+            orders_updates = await self._request_orders_status(tracked_orders=orders) or {}
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of all orders. Requesting it per order. Error: {request_error}",
+                exc_info=request_error,
+            )
+        orders_to_request = []
         for order in orders:
+            if order.client_order_id not in orders_updates:
+                orders_to_request.append(order)
+                continue
+            try:
+                self._order_tracker.process_order_update(orders_updates[order.client_order_id])
+            except Exception as process_error:
+                self.logger().warning(
+                    f"Failed to process the status of order {order.client_order_id} fetched for all orders. "
+                    f"Requesting it for the order. Error: {process_error}",
+                    exc_info=process_error,
+                )
+                orders_to_request.append(order)
+
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -1030,6 +1129,22 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._run_with_bounded_concurrency(update_order, orders_to_request)
+
+    async def _run_with_bounded_concurrency(self, function: Callable, orders: List[InFlightOrder]):
+        """
+        Runs the function for all the orders, with at most ORDER_UPDATES_MAX_CONCURRENCY of them running at a time.
+        Each request still goes through the throttler, and bounding them keeps a large number of tracked orders from
+        queueing ahead of other requests (like order creations) that share the same rate limits.
+        """
+        semaphore = asyncio.Semaphore(self.ORDER_UPDATES_MAX_CONCURRENCY)
+
+        async def run(order: InFlightOrder):
+            async with semaphore:
+                await function(order)
+
+        await safe_gather(*[run(order) for order in orders])
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1080,6 +1195,24 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_orders(self, orders: List[InFlightOrder]) -> Optional[Dict[str, List[TradeUpdate]]]:
+        """
+        Connectors with an endpoint returning the recent fills of the account can override this method to get the
+        fills of all the orders in a few requests.
+        Returns the trade updates by client order id. Orders not included in the result are requested one by one with
+        _all_trade_updates_for_order, so an order should only be included if all its fills are in the response.
+        """
+        return None
+
+    async def _request_orders_status(self, tracked_orders: List[InFlightOrder]) -> Optional[Dict[str, OrderUpdate]]:
+        """
+        Connectors with an endpoint returning the status of many orders (like the open orders endpoint) can override
+        this method to update all the orders in a few requests.
+        Returns the order updates by client order id. Orders not included in the result (for example the ones no longer
+        open) are requested one by one with _request_order_status.
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
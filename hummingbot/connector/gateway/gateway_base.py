@@ -5,7 +5,7 @@ import logging
 import re
 import time
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Set, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
 from hummingbot.client.config.client_config_map import GatewayConfigMap
 from hummingbot.connector.budget_checker import BudgetChecker
@@ -202,6 +202,10 @@ class GatewayBase(ConnectorBase):
             for key, value in self.in_flight_orders.items()
         }
 
+    def tracking_states_for_orders(self, client_order_ids: Iterable[str]) -> Optional[Dict[str, Any]]:
+        orders = self.in_flight_orders
+        return {order_id: orders[order_id].to_json() for order_id in client_order_ids if order_id in orders}
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         self._order_tracker._in_flight_orders.update({
             key: GatewayInFlightOrder.from_json(value)
@@ -6,8 +6,9 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
@@ -16,6 +17,9 @@ from hummingbot.client.config.client_config_map import MarketDataCollectionConfi
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -23,6 +27,8 @@ from hummingbot.core.event.events import (
     FundingPaymentCompletedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderCancelledEvent,
     OrderExpiredEvent,
     OrderFilledEvent,
@@ -34,18 +40,21 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.market_data_capture import MarketDataCapture
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.position import Position
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -58,6 +67,10 @@ class MarketsRecorder:
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    # Number of market state deltas saved before saving all the tracking states again, removing the deltas
+    MARKET_STATES_COMPACTION_INTERVAL = 100
+    # Maximum seconds a read from the database waits for the pending writes in write behind mode
+    PENDING_WRITES_TIMEOUT = 2.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -76,7 +89,13 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False):
+        """
+        :param write_behind: if True, orders, fills and market states are written to the database by a background
+        thread instead of the event loop. The pending writes are applied before reading from the database and when
+        the recorder stops, and replayed on the next start if the bot stops before applying them.
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +106,27 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_capture: Optional[MarketDataCapture] = None
+        self._captured_order_books: Dict[OrderBook, str] = {}
+        self._captured_diff_listeners: Dict[ConnectorBase, Callable[[OrderBookMessage], None]] = {}
+        self._write_operations: Dict[str, Callable[[Session, Dict[str, Any]], bool]] = {
+            "order_created": self._write_order_created,
+            "order_filled": self._write_order_filled,
+            "order_status": self._write_order_status,
+            "market_states": self._write_market_states,
+            "market_states_delta": self._write_market_states_delta,
+        }
+        self._market_state_deltas_count: Dict[str, int] = {}
+        self._write_behind_queue: Optional[SQLWriteBehindQueue] = None
+        self._markets_with_pending_states: Dict[str, ConnectorBase] = {}
+        self._orders_with_pending_states: Dict[str, Set[str]] = {}
+        if write_behind:
+            self._sql_manager.enable_write_ahead_log()
+            self._write_behind_queue = SQLWriteBehindQueue(
+                sql=self._sql_manager,
+                writers=self._write_operations,
+                journal_path=f"{self._sql_manager.db_path}.pending_writes")
+            self._write_behind_queue.start()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -106,6 +146,7 @@ class MarketsRecorder:
         self._funding_payment_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_complete_funding_payment)
         self._update_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_update_range_position)
         self._close_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_close_position)
+        self._public_trade_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_receive_public_trade)
 
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
             (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
@@ -125,34 +166,20 @@ class MarketsRecorder:
         MarketsRecorder._shared_instance = self
 
     def _start_market_data_recording(self):
+        if self._market_data_collection_config.market_data_collection_files:
+            self._market_data_capture = MarketDataCapture(
+                depth=self._market_data_collection_config.market_data_collection_depth)
+            self._market_data_capture.start()
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
     async def _record_market_data(self):
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_capture is not None:
+                        self._capture_market_data()
+                    else:
+                        self._store_market_data()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -160,6 +187,62 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _store_market_data(self):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for market in self._markets:
+                    exchange = market.display_name
+                    for trading_pair in market.trading_pairs:
+                        mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                        best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                        best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                        order_book = market.get_order_book(trading_pair)
+                        depth = self._market_data_collection_config.market_data_collection_depth + 1
+                        bids, asks = order_book.top_levels(depth)
+                        market_data = MarketData(
+                            timestamp=self.db_timestamp,
+                            exchange=exchange,
+                            trading_pair=trading_pair,
+                            mid_price=mid_price,
+                            best_bid=best_bid,
+                            best_ask=best_ask,
+                            order_book={
+                                "bid": bids[~np.isnan(bids[:, 0])].tolist(),
+                                "ask": asks[~np.isnan(asks[:, 0])].tolist()}
+                        )
+                        session.add(market_data)
+
+    def _capture_market_data(self):
+        """
+        Captures the order books top levels to the market data files, and starts capturing the public trades of the
+        order books not captured yet, and the diffs of their trackers.
+        """
+        timestamp = time.time()
+        for market in self._markets:
+            order_book_tracker = getattr(market, "order_book_tracker", None)
+            if market not in self._captured_diff_listeners and isinstance(order_book_tracker, OrderBookTracker):
+                listener = self._diff_capture_listener(market.display_name)
+                self._captured_diff_listeners[market] = listener
+                order_book_tracker.add_diff_listener(listener)
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                if order_book not in self._captured_order_books:
+                    self._captured_order_books[order_book] = market.display_name
+                    order_book.add_listener(OrderBookEvent.TradeEvent, self._public_trade_forwarder)
+                self._market_data_capture.record_order_book(market.display_name, trading_pair, timestamp, order_book)
+
+    def _diff_capture_listener(self, connector_name: str) -> Callable[[OrderBookMessage], None]:
+        def capture_diff(message: OrderBookMessage):
+            # Timestamped when received, like the captured order books
+            if self._market_data_capture is not None:
+                self._market_data_capture.record_diff(connector_name, message.trading_pair, time.time(),
+                                                      message.bids_array, message.asks_array)
+        return capture_diff
+
+    def _did_receive_public_trade(self, event_tag: int, order_book: OrderBook, trade: OrderBookTradeEvent):
+        if self._market_data_capture is not None:
+            self._market_data_capture.record_trade(self._captured_order_books[order_book], trade)
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -219,6 +302,98 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        for order_book in self._captured_order_books:
+            order_book.remove_listener(OrderBookEvent.TradeEvent, self._public_trade_forwarder)
+        self._captured_order_books.clear()
+        for market, listener in self._captured_diff_listeners.items():
+            market.order_book_tracker.remove_diff_listener(listener)
+        self._captured_diff_listeners.clear()
+        if self._market_data_capture is not None:
+            self._market_data_capture.stop()
+            self._market_data_capture = None
+        if self._write_behind_queue is not None:
+            self._put_pending_market_states()
+            self._write_behind_queue.stop()
+
+    def flush_pending_writes(self) -> bool:
+        """
+        Waits until the writes queued in write behind mode are applied, so reads from the database include them.
+        The wait is bounded by PENDING_WRITES_TIMEOUT, and skipped when the writer thread is not running (the database
+        being unavailable while stopping), the read then missing the pending writes.
+        """
+        if self._write_behind_queue is None:
+            return True
+        self._put_pending_market_states()
+        if self._write_behind_queue.flush(self.PENDING_WRITES_TIMEOUT):
+            return True
+        self.logger().warning(f"Reading from the database without the pending writes, they were not applied within "
+                              f"{self.PENDING_WRITES_TIMEOUT} seconds.")
+        return False
+
+    async def wait_for_pending_writes(self) -> bool:
+        """
+        Same as flush_pending_writes, but keeps the event loop running while the writes are applied. Awaiting it
+        before reading from a coroutine makes the read itself return without waiting.
+        """
+        if self._write_behind_queue is None:
+            return True
+        self._put_pending_market_states()
+        if await self._write_behind_queue.wait_flushed(self.PENDING_WRITES_TIMEOUT):
+            return True
+        self.logger().warning(f"The pending writes were not applied within {self.PENDING_WRITES_TIMEOUT} seconds.")
+        return False
+
+    def _record(self, market: ConnectorBase, order_id: str, operation: str, payload: Dict[str, Any]):
+        """
+        Applies the write operation together with saving the market states of the order, or queues them in write
+        behind mode. Market states are saved once per event loop iteration in write behind mode, even for bursts of
+        events.
+        """
+        if self._write_behind_queue is None:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    if self._write_operations[operation](session, payload):
+                        states_operation, states = self._market_states_checkpoint(market, [order_id])
+                        self._write_operations[states_operation](session, states)
+        else:
+            self._write_behind_queue.put(operation, payload)
+            if len(self._markets_with_pending_states) == 0:
+                self._ev_loop.call_soon(self._put_pending_market_states)
+            self._markets_with_pending_states[market.display_name] = market
+            self._orders_with_pending_states.setdefault(market.display_name, set()).add(order_id)
+
+    def _put_pending_market_states(self):
+        markets = list(self._markets_with_pending_states.values())
+        orders_by_market = self._orders_with_pending_states
+        self._markets_with_pending_states = {}
+        self._orders_with_pending_states = {}
+        for market in markets:
+            self._write_behind_queue.put(*self._market_states_checkpoint(market, orders_by_market[market.display_name]))
+
+    def _market_states_checkpoint(self, market: ConnectorBase, order_ids: Iterable[str]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Returns the write operation saving the market states after the given orders changed. It is a delta with the
+        states of those orders only, except for the first checkpoint of the session and every
+        MARKET_STATES_COMPACTION_INTERVAL deltas, when all the tracking states are saved and the deltas removed.
+        Connectors unable to serialize single orders always save all the tracking states.
+        """
+        deltas_count = self._market_state_deltas_count.get(market.display_name, self.MARKET_STATES_COMPACTION_INTERVAL)
+        updated_states = None
+        if deltas_count < self.MARKET_STATES_COMPACTION_INTERVAL:
+            updated_states = market.tracking_states_for_orders(order_ids)
+        if updated_states is None:
+            self._market_state_deltas_count[market.display_name] = 0
+            return "market_states", {"config_file_path": self._config_file_path,
+                                     "market": market.display_name,
+                                     "timestamp": self.db_timestamp,
+                                     "saved_state": market.tracking_states}
+        self._market_state_deltas_count[market.display_name] = deltas_count + 1
+        return "market_states_delta", {"config_file_path": self._config_file_path,
+                                       "market": market.display_name,
+                                       "timestamp": self.db_timestamp,
+                                       "updated_states": updated_states,
+                                       "removed_orders": sorted(order_id for order_id in order_ids
+                                                                if order_id not in updated_states)}
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -276,31 +451,37 @@ class MarketsRecorder:
             session.commit()
 
     def get_executors_by_ids(self, executor_ids: List[str]):
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
             return executors
 
     def get_executors_by_controller(self, controller_id: str = None) -> List[ExecutorInfo]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_all_executors(self) -> List[ExecutorInfo]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_positions_by_ids(self, position_ids: List[str]) -> List[Position]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.id.in_(position_ids)).all()
             return positions
 
     def get_positions_by_controller(self, controller_id: str = None) -> List[Position]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.controller_id == controller_id).all()
             return positions
 
     def get_all_positions(self) -> List[Position]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).all()
             return positions
@@ -308,6 +489,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -323,6 +505,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -334,25 +517,52 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._market_state_deltas_count[market.display_name] = 0
+        self._write_market_states(session, {"config_file_path": config_file_path,
+                                            "market": market.display_name,
+                                            "timestamp": self.db_timestamp,
+                                            "saved_state": market.tracking_states})
+
+    def _write_market_states(self, session: Session, states: Dict[str, Any]) -> bool:
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == states["config_file_path"],
+                                MarketState.market == states["market"]))
+        market_states: Optional[MarketState] = query.one_or_none()
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
+            market_states.saved_state = states["saved_state"]
+            market_states.timestamp = states["timestamp"]
         else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+            market_states = MarketState(config_file_path=states["config_file_path"],
+                                        market=states["market"],
+                                        timestamp=states["timestamp"],
+                                        saved_state=states["saved_state"])
             session.add(market_states)
+        # The saved states include all the changes recorded in the deltas
+        (session
+         .query(MarketStateDelta)
+         .filter(MarketStateDelta.config_file_path == states["config_file_path"],
+                 MarketStateDelta.market == states["market"])
+         .delete())
+        return True
+
+    def _write_market_states_delta(self, session: Session, delta: Dict[str, Any]) -> bool:
+        session.add(MarketStateDelta(**delta))
+        return True
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
             if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+                saved_state = dict(market_states.saved_state)
+                for delta in self.get_market_state_deltas(config_file_path, market, session=session):
+                    saved_state.update(delta.updated_states)
+                    for order_id in delta.removed_orders:
+                        saved_state.pop(order_id, None)
+                market.restore_tracking_states(saved_state)
 
     def get_market_states(self,
                           config_file_path: str,
@@ -365,6 +575,17 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def get_market_state_deltas(self,
+                                config_file_path: str,
+                                market: ConnectorBase,
+                                session: Session) -> List[MarketStateDelta]:
+        query: Query = (session
+                        .query(MarketStateDelta)
+                        .filter(MarketStateDelta.config_file_path == config_file_path,
+                                MarketStateDelta.market == market.display_name)
+                        .order_by(MarketStateDelta.id))
+        return query.all()
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -377,31 +598,34 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._record(market, evt.order_id, "order_created", {
+            "id": evt.order_id,
+            "config_file_path": self._config_file_path,
+            "strategy": self._strategy_name,
+            "market": market.display_name,
+            "symbol": evt.trading_pair,
+            "base_asset": base_asset,
+            "quote_asset": quote_asset,
+            "creation_timestamp": timestamp,
+            "order_type": evt.type.name,
+            "amount": Decimal(evt.amount),
+            "leverage": evt.leverage if evt.leverage else 1,
+            "price": Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+            "position": evt.position if evt.position else PositionAction.NIL.value,
+            "last_status": event_type.name,
+            "last_update_timestamp": timestamp,
+            "exchange_order_id": evt.exchange_order_id,
+        })
+
+    def _write_order_created(self, session: Session, order: Dict[str, Any]) -> bool:
+        order_record: Order = Order(**order)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=order["creation_timestamp"],
+                                                status=order["last_status"])
+        session.add(order_record)
+        session.add(order_status)
+        return True
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -416,56 +640,61 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        self._record(market, order_id, "order_filled", {
+            "order_id": order_id,
+            "status": event_type.name,
+            "timestamp": timestamp,
+            "trade_fill": {
+                "config_file_path": self.config_file_path,
+                "strategy": self.strategy_name,
+                "market": market.display_name,
+                "symbol": evt.trading_pair,
+                "base_asset": base_asset,
+                "quote_asset": quote_asset,
+                "timestamp": timestamp,
+                "order_id": order_id,
+                "trade_type": evt.trade_type.name,
+                "order_type": evt.order_type.name,
+                "price": evt.price,
+                "amount": evt.amount,
+                "leverage": evt.leverage if evt.leverage else 1,
+                "trade_fee": evt.trade_fee.to_json(),
+                "trade_fee_in_quote": fee_in_quote,
+                "exchange_trade_id": evt.exchange_trade_id,
+                "position": evt.position if evt.position else PositionAction.NIL.value,
+            },
+        })
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+    def _write_order_filled(self, session: Session, fill: Dict[str, Any]) -> bool:
+        # Try to find the order record, and update it if necessary.
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == fill["order_id"]).one_or_none()
+        if order_record is not None:
+            order_record.last_status = fill["status"]
+            order_record.last_update_timestamp = fill["timestamp"]
+
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=fill["order_id"],
+                                                timestamp=fill["timestamp"],
+                                                status=fill["status"])
+        trade_fill_record: TradeFill = TradeFill(**fill["trade_fill"])
+        session.add(order_status)
+        session.add(trade_fill_record)
+        return True
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -535,18 +764,21 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+        self._record(market, order_id, "order_status", {"order_id": order_id,
+                                                         "status": event_type.name,
+                                                         "timestamp": timestamp})
+
+    def _write_order_status(self, session: Session, status: Dict[str, Any]) -> bool:
+        order_record: Optional[Order] = session.query(Order).filter(Order.id == status["order_id"]).one_or_none()
 
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        if order_record is not None:
+            order_record.last_status = status["status"]
+            order_record.last_update_timestamp = status["timestamp"]
+            order_status: OrderStatus = OrderStatus(order_id=status["order_id"],
+                                                    timestamp=status["timestamp"],
+                                                    status=status["status"])
+            session.add(order_status)
+        return order_record is not None
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -580,6 +812,8 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_update_range_position, event_tag, connector, evt)
             return
 
+        # Written right away, after the queued writes, so the saved market states are not overwritten by older ones
+        self.flush_pending_writes()
         timestamp: int = self.db_timestamp
 
         with self._sql_manager.get_new_session() as session:
@@ -600,6 +834,8 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
+        # Written right away, after the queued writes, so the saved market states are not overwritten by older ones
+        self.flush_pending_writes()
         with self._sql_manager.get_new_session() as session:
             with session.begin():
                 rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
@@ -118,6 +118,15 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def get_funding_info(self, trading_pair: str) -> FundingInfo:
         return self._perpetual_trading.get_funding_info(trading_pair)
 
+    def use_order_book_worker_processes(self, worker_processes: int):
+        # The funding info updates are received by the order book data source of this process
+        self.logger().warning(f"The order books of {self.name} can't be maintained in worker processes, the funding "
+                              f"info is received with them.")
+
+    def use_shared_memory_order_books(self):
+        self.logger().warning(f"The order books of {self.name} can't be read from the market data daemon, the funding "
+                              f"info is received with them.")
+
     def start_tracking_order(
         self,
         order_id: str,
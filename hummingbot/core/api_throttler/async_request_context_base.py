@@ -65,27 +65,42 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def log_task(self):
+        """
+        Records the capacity consumed by this request on its rate limit and the related limits
+        """
+        now = time.time()
+        # Each related limit is represented as it own individual TaskLog
+
+        # Log the acquired rate limit into the tasks log
+        new_logs = [
+            TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight)
+        ] + [
+            # Log its related limits into the tasks log as individual tasks
+            TaskLog(timestamp=now, rate_limit=limit, weight=weight)
+            for limit, weight in self._related_limits
+        ]
+        self._task_logs.extend(new_logs)
+
+    def _warn_capacity_reached(self, rate_limit: RateLimit, capacity_used: int, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {capacity_used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
     async def acquire(self):
         while True:
             async with self._lock:
                 self.flush()
 
                 if self.within_capacity():
+                    # Log the task while still holding the lock, so no other request can take the same capacity
+                    self.log_task()
                     break
             await asyncio.sleep(self._retry_interval)
-        async with self._lock:
-            now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-
-            # Log the acquired rate limit into the tasks log
-            new_logs = [
-                TaskLog(timestamp=now, rate_limit=self._rate_limit, weight=self._rate_limit.weight)
-            ] + [
-                # Log its related limits into the tasks log as individual tasks
-                TaskLog(timestamp=now, rate_limit=limit, weight=weight)
-                for limit, weight in self._related_limits
-            ]
-            self._task_logs.extend(new_logs)
 
     async def __aenter__(self):
         await self.acquire()
@@ -3,10 +3,7 @@ import time
 from decimal import Decimal
 from typing import List, Tuple
 
-from hummingbot.core.api_throttler.async_request_context_base import (
-    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
-    AsyncRequestContextBase,
-)
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
 
@@ -37,13 +34,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                           Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
 
                 if capacity_used + weight > rate_limit.limit:
-                    if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
-                        msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
-                              f"{rate_limit.time_interval}s) has almost reached. Limits used " \
-                              f"is {capacity_used} in the last " \
-                              f"{rate_limit.time_interval} seconds"
-                        self.logger().notify(msg)
-                        AsyncRequestContextBase._last_max_cap_warning_ts = now
+                    self._warn_capacity_reached(rate_limit, capacity_used, now)
                     return False
         return True
 
@@ -0,0 +1,231 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Added to the computed wake up time, since an entry only expires once strictly past its time interval
+EXPIRY_WAKEUP_DELAY = 0.0001
+
+
+class RateLimitWindow:
+    """
+    Rolling window of the capacity consumed on a single RateLimit.
+    Entries are kept in the order they were logged together with a running sum of their weights, so expired entries
+    are dropped from the front of the window and the used capacity is read without scanning the whole log.
+    """
+
+    __slots__ = ("_entries", "_used_capacity")
+
+    def __init__(self):
+        # Each entry is (timestamp + safety margin, time interval, weight)
+        self._entries: Deque[Tuple[Decimal, float, int]] = deque()
+        self._used_capacity: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, timestamp: Decimal, rate_limit: RateLimit, weight: int, safety_margin_pct: float):
+        window_start = timestamp + Decimal(str(rate_limit.time_interval * safety_margin_pct))
+        self._entries.append((window_start, rate_limit.time_interval, weight))
+        self._used_capacity += weight
+
+    def used_capacity(self, now: Decimal) -> int:
+        """
+        Drops the entries that are no longer within their time interval (plus the safety margin) and returns the
+        capacity used by the remaining ones.
+        """
+        entries = self._entries
+        while entries and now - entries[0][0] > entries[0][1]:
+            self._used_capacity -= entries.popleft()[2]
+        return self._used_capacity
+
+    def expiry_time(self, capacity_to_free: int) -> Optional[float]:
+        """
+        Returns the time at which enough entries will have expired to free the requested capacity, or None if the
+        window does not hold that much capacity.
+        All the entries of a window belong to the same limit, so they expire in the order they were logged.
+        """
+        freed: int = 0
+        for window_start, time_interval, weight in self._entries:
+            freed += weight
+            if freed >= capacity_to_free:
+                return float(window_start) + time_interval
+        return None
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
+    Capacity is read from the RateLimitWindow of each limit instead of the shared task logs, so checking the limits
+    costs the same regardless of how many requests were logged in the window.
+    Requests that have to wait queue up in a FIFO per limit. Only the first request in line of all its limits checks
+    the capacity, sleeping until the exact time the next slot frees up, and it wakes the next waiting request when it
+    leaves the queues.
+    """
+
+    def __init__(self,
+                 windows: Dict[str, RateLimitWindow],
+                 rate_limit: RateLimit,
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 waiters: Optional[Dict[str, Deque[asyncio.Event]]] = None,
+                 ):
+        """
+        :param windows: Shared rolling windows, by limit id
+        :param retry_interval: Time between each limit check, only used when the request weight exceeds the limit
+        :param waiters: Shared queues of the requests waiting for capacity, by limit id
+        """
+        super().__init__(task_logs=[],
+                         rate_limit=rate_limit,
+                         related_limits=related_limits,
+                         lock=lock,
+                         safety_margin_pct=safety_margin_pct,
+                         retry_interval=retry_interval)
+        self._windows: Dict[str, RateLimitWindow] = windows
+        self._waiters: Dict[str, Deque[asyncio.Event]] = waiters if waiters is not None else {}
+
+    def flush(self):
+        # Expired entries are dropped by each window while checking its capacity
+        pass
+
+    def within_capacity(self) -> bool:
+        if self._rate_limit is not None:
+            now: float = self._time()
+            decimal_now: Decimal = Decimal(str(now))
+            for rate_limit, weight in [(self._rate_limit, self._rate_limit.weight)] + self._related_limits:
+                window = self._windows.get(rate_limit.limit_id)
+                capacity_used: int = 0 if window is None else window.used_capacity(decimal_now)
+                if capacity_used + weight > rate_limit.limit:
+                    self._warn_capacity_reached(rate_limit, capacity_used, now)
+                    return False
+        return True
+
+    def log_task(self):
+        if self._rate_limit is not None:
+            now: Decimal = Decimal(str(self._time()))
+            for rate_limit, weight in [(self._rate_limit, self._rate_limit.weight)] + self._related_limits:
+                window = self._windows.get(rate_limit.limit_id)
+                if window is None:
+                    window = self._windows[rate_limit.limit_id] = RateLimitWindow()
+                window.add(now, rate_limit, weight, self._safety_margin_pct)
+
+    async def acquire(self):
+        waiter: Optional[asyncio.Event] = None
+        try:
+            while True:
+                async with self._lock:
+                    first_in_line = self._is_first_in_line(waiter)
+                    if first_in_line and self.within_capacity():
+                        self.log_task()
+                        return
+                    if waiter is None:
+                        waiter = self._enqueue_waiter()
+                        first_in_line = self._is_first_in_line(waiter)
+                    # Requests behind others in line sleep until the request ahead of them leaves the queue
+                    timeout: Optional[float] = self._time_to_capacity() if first_in_line else None
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                waiter.clear()
+        finally:
+            if waiter is not None:
+                self._dequeue_waiter(waiter)
+
+    def _limit_ids(self) -> List[str]:
+        if self._rate_limit is None:
+            return []
+        # The related limits can include the request limit itself, each queue should hold a waiter only once
+        return list(dict.fromkeys(
+            [self._rate_limit.limit_id] + [limit.limit_id for limit, _ in self._related_limits]
+        ))
+
+    def _is_first_in_line(self, waiter: Optional[asyncio.Event]) -> bool:
+        for limit_id in self._limit_ids():
+            queue = self._waiters.get(limit_id)
+            if queue and queue[0] is not waiter:
+                return False
+        return True
+
+    def _enqueue_waiter(self) -> asyncio.Event:
+        waiter = asyncio.Event()
+        for limit_id in self._limit_ids():
+            queue = self._waiters.get(limit_id)
+            if queue is None:
+                queue = self._waiters[limit_id] = deque()
+            queue.append(waiter)
+        return waiter
+
+    def _dequeue_waiter(self, waiter: asyncio.Event):
+        for limit_id in self._limit_ids():
+            queue = self._waiters.get(limit_id)
+            if queue is None or waiter not in queue:
+                continue
+            if queue[0] is waiter:
+                queue.popleft()
+            else:
+                queue.remove(waiter)
+            if queue:
+                # Wake the next request in line so it starts checking the capacity
+                queue[0].set()
+
+    def _time_to_capacity(self) -> float:
+        """
+        Returns the seconds left until all the limits of the request have capacity for it.
+        """
+        now: float = self._time()
+        decimal_now: Decimal = Decimal(str(now))
+        capacity_time: float = now
+        for rate_limit, weight in [(self._rate_limit, self._rate_limit.weight)] + self._related_limits:
+            window = self._windows.get(rate_limit.limit_id)
+            if window is None:
+                continue
+            capacity_to_free: int = window.used_capacity(decimal_now) + weight - rate_limit.limit
+            if capacity_to_free > 0:
+                expiry_time: Optional[float] = window.expiry_time(capacity_to_free)
+                if expiry_time is None:
+                    # The request weight alone exceeds the limit, fall back to polling
+                    return self._retry_interval
+                capacity_time = max(capacity_time, expiry_time)
+        return capacity_time - now + EXPIRY_WAKEUP_DELAY
+
+    def _time(self):
+        return time.time()
+
+
+class SlidingWindowThrottler(AsyncThrottler):
+    """
+    Handles call rate limits with the same RateLimit and LinkedLimitWeightPair semantics as AsyncThrottler, keeping
+    a rolling window with a running total per limit. Checking the capacity for a request is O(1) amortized, instead of
+    a scan of every logged request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._waiters: Dict[str, Deque[asyncio.Event]] = {}
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SlidingWindowRequestContext(
+            windows=self._windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            waiters=self._waiters,
+        )
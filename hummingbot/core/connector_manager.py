@@ -6,6 +6,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 
 
 class ConnectorManager:
@@ -70,7 +71,8 @@ class ConnectorManager:
                 base_connector = base_connector_name
                 connector = create_paper_trade_market(
                     base_connector,
-                    trading_pairs
+                    trading_pairs,
+                    queue_position_fills=self.client_config_map.paper_trade.paper_trade_queue_position_fills,
                 )
 
                 # Set paper trade balances if configured
@@ -97,6 +99,15 @@ class ConnectorManager:
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**init_params)
 
+                order_book_worker_processes = self.client_config_map.order_book_worker_processes
+                if isinstance(connector, ExchangePyBase):
+                    if self.client_config_map.shared_memory_order_books:
+                        connector.use_shared_memory_order_books()
+                    elif order_book_worker_processes > 0:
+                        connector.use_order_book_worker_processes(order_book_worker_processes)
+                    elif self.client_config_map.coalesce_order_book_diffs:
+                        connector.use_coalesced_order_book_diffs()
+
             # Add to active connectors
             self.connectors[connector_name] = connector
 
@@ -1,8 +1,16 @@
 # distutils: language=c++
-from hummingbot.core.data_type.order_book cimport OrderBook
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book cimport OrderBook, OrderBookDepthLevel
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        vector[int64_t] _bid_depth_update_ids
+        vector[int64_t] _ask_depth_update_ids
+        double[:, ::1] _top_level
 
+    cdef vector[OrderBookDepthLevel] *c_get_depth_index(self, bint is_buy)
+    cdef int c_top_levels(self, bint is_buy, double[:, ::1] levels)
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -3,23 +3,31 @@
 
 from typing import Iterator
 
-from cython.operator cimport address as ref, dereference as deref, postincrement as inc
+import numpy as np
+
+from cython.operator cimport address as ref, dereference as deref, postincrement as inc, predecrement as dec
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBookDepthLevel, c_depth_levels_within_price
+from libc.math cimport INFINITY, NAN
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    Override the order book bid_entries, ask_entries methods to return the composite order book entries.
+    The composite levels are kept in the depth index of the book, so the depth queries of OrderBook apply to them.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._top_level = np.empty((1, 3))
 
     @property
     def traded_order_book(self) -> OrderBook:
@@ -28,6 +36,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book.c_invalidate_depth_index()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -36,6 +46,7 @@ cdef class CompositeOrderBook(OrderBook):
             set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
             set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
             OrderBookEntry entry
+            double crossed_price = NAN
 
         price = order_fill_event.price
         amount = float(order_fill_event.amount)
@@ -70,7 +81,28 @@ cdef class CompositeOrderBook(OrderBook):
                     break
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
+        # A fill crossing the other traded side truncates it, which changes those composite levels too
+        if (order_fill_event.trade_type is TradeType.BUY and
+                self._traded_order_book._bid_book.size() > 0 and
+                deref(self._traded_order_book._bid_book.rbegin()).getPrice() >= price):
+            crossed_price = deref(self._traded_order_book._bid_book.rbegin()).getPrice()
+        elif (order_fill_event.trade_type is TradeType.SELL and
+                self._traded_order_book._ask_book.size() > 0 and
+                deref(self._traded_order_book._ask_book.begin()).getPrice() <= price):
+            crossed_price = deref(self._traded_order_book._ask_book.begin()).getPrice()
+
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        # The composite levels from the fill price outwards change
+        if order_fill_event.trade_type is TradeType.BUY:
+            if price < self._ask_depth_dirty_price:
+                self._ask_depth_dirty_price = price
+            if crossed_price > self._bid_depth_dirty_price:
+                self._bid_depth_dirty_price = crossed_price
+        else:
+            if price > self._bid_depth_dirty_price:
+                self._bid_depth_dirty_price = price
+            if crossed_price < self._ask_depth_dirty_price:
+                self._ask_depth_dirty_price = crossed_price
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -80,115 +112,216 @@ cdef class CompositeOrderBook(OrderBook):
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
+            # Copied, so the rows stay consistent if the book is updated while they're iterated
+            vector[OrderBookDepthLevel] levels = deref(self.c_get_depth_index(False))
+            vector[int64_t] update_ids = self._bid_depth_update_ids
+            size_t index
+        for index in range(levels.size()):
+            yield OrderBookRow(levels[index].price, levels[index].amount, update_ids[index])
 
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            vector[OrderBookDepthLevel] levels = deref(self.c_get_depth_index(True))
+            vector[int64_t] update_ids = self._ask_depth_update_ids
+            size_t index
+        for index in range(levels.size()):
+            yield OrderBookRow(levels[index].price, levels[index].amount, update_ids[index])
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+    cdef vector[OrderBookDepthLevel] *c_get_depth_index(self, bint is_buy):
+        """
+        Returns the depth index of the composite book for one side, the levels of the original book less the recorded
+        fills, ordered from the best price outwards.
 
-    def ask_entries(self) -> Iterator[OrderBookRow]:
+        The index is invalidated from the best price changed by the diffs, like the index of the original book, and
+        from the price of the recorded fills, so only the levels past it are merged again. The recorded fills priced
+        between the levels of the original book are removed while merging, and the fills larger than their level are
+        capped to its amount.
+        """
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
+            vector[OrderBookDepthLevel] *levels
+            vector[int64_t] *update_ids
+            set[OrderBookEntry] *traded_book
+            set[OrderBookEntry].iterator it
+            set[OrderBookEntry].iterator traded_it
+            OrderBookEntry entry
+            OrderBookEntry traded_entry
+            OrderBookDepthLevel level
             vector[OrderBookEntry] cpp_bids_changes
+            vector[OrderBookEntry] cpp_asks_changes
+            size_t valid_levels
+            double amount
+            double cumulative_base = 0
+            double cumulative_quote = 0
 
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
+        if is_buy:
+            levels = ref(self._ask_depth_index)
+            update_ids = ref(self._ask_depth_update_ids)
+            if self._ask_depth_dirty_price == INFINITY:
+                return levels
+            valid_levels = c_depth_levels_within_price(levels, True, self._ask_depth_dirty_price)
+            while valid_levels > 0 and deref(levels)[valid_levels - 1].price >= self._ask_depth_dirty_price:
+                valid_levels -= 1
+        else:
+            levels = ref(self._bid_depth_index)
+            update_ids = ref(self._bid_depth_update_ids)
+            if self._bid_depth_dirty_price == -INFINITY:
+                return levels
+            valid_levels = c_depth_levels_within_price(levels, False, self._bid_depth_dirty_price)
+            while valid_levels > 0 and deref(levels)[valid_levels - 1].price <= self._bid_depth_dirty_price:
+                valid_levels -= 1
 
+        deref(levels).resize(valid_levels)
+        deref(update_ids).resize(valid_levels)
+        if valid_levels > 0:
+            level = deref(levels)[valid_levels - 1]
+            cumulative_base = level.cumulative_base
+            cumulative_quote = level.cumulative_quote
+
+        if is_buy:
+            traded_book = ref(self._traded_order_book._ask_book)
+            if valid_levels > 0:
+                it = self._ask_book.upper_bound(OrderBookEntry(level.price, 0, 0))
+                traded_it = deref(traded_book).upper_bound(OrderBookEntry(level.price, 0, 0))
             else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
+                it = self._ask_book.begin()
+                traded_it = deref(traded_book).begin()
+            while it != self._ask_book.end():
+                entry = deref(it)
+                inc(it)
+                amount = entry.getAmount()
+                while traded_it != deref(traded_book).end():
+                    traded_entry = deref(traded_it)
+                    if traded_entry.getPrice() > entry.getPrice():
+                        break
+                    inc(traded_it)
+                    if traded_entry.getPrice() < entry.getPrice():
+                        cpp_asks_changes.push_back(OrderBookEntry(traded_entry.getPrice(), 0,
+                                                                  traded_entry.getUpdateId()))
+                    else:
+                        amount -= traded_entry.getAmount()
+                        if amount <= 0:
+                            cpp_asks_changes.push_back(OrderBookEntry(entry.getPrice(),
+                                                                      min(entry.getAmount(), traded_entry.getAmount()),
+                                                                      traded_entry.getUpdateId()))
+                        break
+                if amount > 0:
+                    cumulative_base += amount
+                    cumulative_quote += amount * entry.getPrice()
+                    deref(levels).push_back(OrderBookDepthLevel(entry.getPrice(), amount, cumulative_base,
+                                                                cumulative_quote))
+                    deref(update_ids).push_back(entry.getUpdateId())
+            self._ask_depth_dirty_price = INFINITY
+        else:
+            traded_book = ref(self._traded_order_book._bid_book)
+            if valid_levels > 0:
+                it = self._bid_book.lower_bound(OrderBookEntry(level.price, 0, 0))
+                traded_it = deref(traded_book).lower_bound(OrderBookEntry(level.price, 0, 0))
+            else:
+                it = self._bid_book.end()
+                traded_it = deref(traded_book).end()
+            while it != self._bid_book.begin():
+                dec(it)
+                entry = deref(it)
+                amount = entry.getAmount()
+                while traded_it != deref(traded_book).begin():
+                    dec(traded_it)
+                    traded_entry = deref(traded_it)
+                    if traded_entry.getPrice() < entry.getPrice():
+                        inc(traded_it)
+                        break
+                    if traded_entry.getPrice() > entry.getPrice():
+                        cpp_bids_changes.push_back(OrderBookEntry(traded_entry.getPrice(), 0,
+                                                                  traded_entry.getUpdateId()))
+                    else:
+                        amount -= traded_entry.getAmount()
+                        if amount <= 0:
+                            cpp_bids_changes.push_back(OrderBookEntry(entry.getPrice(),
+                                                                      min(entry.getAmount(), traded_entry.getAmount()),
+                                                                      traded_entry.getUpdateId()))
+                        break
+                if amount > 0:
+                    cumulative_base += amount
+                    cumulative_quote += amount * entry.getPrice()
+                    deref(levels).push_back(OrderBookDepthLevel(entry.getPrice(), amount, cumulative_base,
+                                                                cumulative_quote))
+                    deref(update_ids).push_back(entry.getUpdateId())
+            self._bid_depth_dirty_price = -INFINITY
 
-            inc(order_it)
+        if not cpp_bids_changes.empty() or not cpp_asks_changes.empty():
+            self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+        return levels
 
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+    cdef int c_top_levels(self, bint is_buy, double[:, ::1] levels):
+        """
+        Writes the first composite levels into the rows of levels, merging the recorded fills like `bid_entries` and
+        `ask_entries` do, without walking the rest of the book. The traded order book is left unchanged.
+        """
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].iterator traded_ask_it = self._traded_order_book._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].reverse_iterator traded_bid_it = self._traded_order_book._bid_book.rbegin()
+            OrderBookEntry entry
+            OrderBookEntry traded_entry
+            double amount
+            int max_levels = levels.shape[0]
+            int count = 0
+
+        while count < max_levels:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+                amount = entry.getAmount()
+                # Recorded fills below the ask price range are not part of the composite book
+                while traded_ask_it != self._traded_order_book._ask_book.end():
+                    traded_entry = deref(traded_ask_it)
+                    if traded_entry.getPrice() > entry.getPrice():
+                        break
+                    inc(traded_ask_it)
+                    if traded_entry.getPrice() == entry.getPrice():
+                        amount -= traded_entry.getAmount()
+                        break
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+                amount = entry.getAmount()
+                # Recorded fills above the bid price range are not part of the composite book
+                while traded_bid_it != self._traded_order_book._bid_book.rend():
+                    traded_entry = deref(traded_bid_it)
+                    if traded_entry.getPrice() < entry.getPrice():
+                        break
+                    inc(traded_bid_it)
+                    if traded_entry.getPrice() == entry.getPrice():
+                        amount -= traded_entry.getAmount()
+                        break
+            if amount > 0:
+                levels[count, 0] = entry.getPrice()
+                levels[count, 1] = amount
+                levels[count, 2] = entry.getUpdateId()
+                count += 1
+        return count
 
     cdef double c_get_price(self, bint is_buy) except? -1:
+        """
+        Returns the best composite price, skipping the levels of the original book consumed by the recorded fills
+        without merging the rest of the book.
+        """
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._ask_book)
+                                                if is_buy
+                                                else ref(self._traded_order_book._bid_book))
+            double[:, ::1] top_level
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
+        if deref(traded_book).empty():
+            return self._best_ask if is_buy else self._best_bid
 
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+        top_level = self._top_level
+        if self.c_top_levels(is_buy, top_level) == 0:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return top_level[0, 0]
@@ -1,7 +1,9 @@
 # distutils: language=c++
 
+from cython.operator cimport dereference as deref
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
+from libcpp.unordered_map cimport unordered_map
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
@@ -9,6 +11,73 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef struct OrderBookDepthLevel:
+    double price
+    double amount
+    double cumulative_base
+    double cumulative_quote
+
+
+cdef inline size_t c_depth_level_for_base(vector[OrderBookDepthLevel] *levels, double base_volume):
+    """
+    Returns the index of the first level at which the cumulative base volume reaches `base_volume`, or the number of
+    levels if the book is not deep enough.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(levels).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) >> 1
+        if deref(levels)[middle].cumulative_base >= base_volume:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline size_t c_depth_level_for_quote(vector[OrderBookDepthLevel] *levels, double quote_volume):
+    """
+    Returns the index of the first level at which the cumulative quote volume reaches `quote_volume`, or the number
+    of levels if the book is not deep enough.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(levels).size()
+        size_t middle
+    while low < high:
+        middle = (low + high) >> 1
+        if deref(levels)[middle].cumulative_quote >= quote_volume:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline size_t c_depth_levels_within_price(vector[OrderBookDepthLevel] *levels, bint is_buy, double price):
+    """
+    Returns the number of levels, counted from the top of the book, that are priced at or better than `price`.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(levels).size()
+        size_t middle
+        double level_price
+    while low < high:
+        middle = (low + high) >> 1
+        level_price = deref(levels)[middle].price
+        if (level_price > price) if is_buy else (level_price < price):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef struct WatchedLevel:
+    int watchers
+    double low_amount
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,6 +89,12 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef vector[OrderBookDepthLevel] _bid_depth_index
+    cdef vector[OrderBookDepthLevel] _ask_depth_index
+    cdef double _bid_depth_dirty_price
+    cdef double _ask_depth_dirty_price
+    cdef unordered_map[double, WatchedLevel] _watched_bid_levels
+    cdef unordered_map[double, WatchedLevel] _watched_ask_levels
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +105,14 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_invalidate_depth_index(self)
+    cdef vector[OrderBookDepthLevel] *c_get_depth_index(self, bint is_buy)
+    cdef int c_top_levels(self, bint is_buy, double[:, ::1] levels)
+    cdef double c_get_level_amount(self, bint is_bid, double price)
+    cdef c_watch_level(self, bint is_bid, double price)
+    cdef c_unwatch_level(self, bint is_bid, double price)
+    cdef double c_pop_level_low_amount(self, bint is_bid, double price)
+    cdef c_lower_watched_levels(self, bint is_bid)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
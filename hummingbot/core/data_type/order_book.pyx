@@ -18,9 +18,15 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
+from cpython.conversion cimport PyOS_string_to_double
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize, PyUnicode_CheckExact
+from libc.math cimport INFINITY
+from libcpp.map cimport map
+from libcpp.unordered_map cimport unordered_map
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -36,6 +42,56 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline double c_parse_book_number(object value) except? -1:
+    """
+    Converts a price or amount as sent by the exchange into a double. Decimal strings are parsed in place from the
+    string buffer with the same conversion `float()` uses, anything else falls back to `float()`.
+    """
+    cdef:
+        const char *text
+        char *end
+        Py_ssize_t size
+        double result
+    if PyUnicode_CheckExact(value):
+        text = PyUnicode_AsUTF8AndSize(value, &size)
+        try:
+            result = PyOS_string_to_double(text, &end, NULL)
+        except ValueError:
+            return float(value)
+        if end == text + size:
+            return result
+    return float(value)
+
+
+cdef c_parse_raw_entries(object raw_entries, int64_t update_id, vector[OrderBookEntry] *entries):
+    for raw_entry in raw_entries:
+        deref(entries).push_back(OrderBookEntry(c_parse_book_number(raw_entry[0]),
+                                                c_parse_book_number(raw_entry[1]),
+                                                update_id))
+
+
+cdef c_merge_raw_entries(object raw_entries, int64_t update_id, map[double, OrderBookEntry] *levels):
+    cdef double price
+    for raw_entry in raw_entries:
+        price = c_parse_book_number(raw_entry[0])
+        deref(levels)[price] = OrderBookEntry(price, c_parse_book_number(raw_entry[1]), update_id)
+
+
+cdef c_merge_rows(object rows, map[double, OrderBookEntry] *levels):
+    cdef double price
+    for row in rows:
+        price = row.price
+        deref(levels)[price] = OrderBookEntry(price, row.amount, row.update_id)
+
+
+cdef c_levels_to_entries(map[double, OrderBookEntry] *levels, vector[OrderBookEntry] *entries):
+    cdef map[double, OrderBookEntry].iterator it = deref(levels).begin()
+    entries.reserve(deref(levels).size())
+    while it != deref(levels).end():
+        deref(entries).push_back(deref(it).second)
+        inc(it)
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -55,6 +111,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self.c_invalidate_depth_index()
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +122,11 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
+            unordered_map[double, WatchedLevel].iterator watched_it
+            bint bids_watched = not self._watched_bid_levels.empty()
+            bint asks_watched = not self._watched_ask_levels.empty()
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,15 +135,39 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            # Depth index levels priced above the highest changed bid are still valid.
+            if bid.getPrice() > self._bid_depth_dirty_price:
+                self._bid_depth_dirty_price = bid.getPrice()
+            if bids_watched:
+                watched_it = self._watched_bid_levels.find(bid.getPrice())
+                if watched_it != self._watched_bid_levels.end():
+                    deref(watched_it).second.low_amount = min(deref(watched_it).second.low_amount, bid.getAmount())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            # Depth index levels priced below the lowest changed ask are still valid.
+            if ask.getPrice() < self._ask_depth_dirty_price:
+                self._ask_depth_dirty_price = ask.getPrice()
+            if asks_watched:
+                watched_it = self._watched_ask_levels.find(ask.getPrice())
+                if watched_it != self._watched_ask_levels.end():
+                    deref(watched_it).second.low_amount = min(deref(watched_it).second.low_amount, ask.getAmount())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if bid_book_size != self._bid_book.size():
+            self._bid_depth_dirty_price = INFINITY
+            if bids_watched:
+                self.c_lower_watched_levels(True)
+        if ask_book_size != self._ask_book.size():
+            self._ask_depth_dirty_price = -INFINITY
+            if asks_watched:
+                self.c_lower_watched_levels(False)
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -108,6 +194,7 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self.c_invalidate_depth_index()
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -133,6 +220,9 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        self.c_lower_watched_levels(True)
+        self.c_lower_watched_levels(False)
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
@@ -177,6 +267,19 @@ cdef class OrderBook(PubSub):
         asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def top_levels(self, int n) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the first n levels of the bid and ask sides, best price first, as (n, 3) arrays with the price, amount
+        and update id of each level. The rows past the depth of the book are NaN.
+        Only the returned levels are read from the book, so it is much cheaper than `snapshot` or listing the entries
+        when only the top of a deep book is needed.
+        """
+        bids = np.full((n, 3), np.nan)
+        asks = np.full((n, 3), np.nan)
+        self.c_top_levels(False, bids)
+        self.c_top_levels(True, asks)
+        return bids, asks
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +300,79 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: List, asks: List, update_id: int):
+        """
+        Applies diffs given in the exchange layout, `[[price, amount, ...], ...]`, with prices and amounts as strings or
+        numbers. The rows are parsed straight into the native entries without building `OrderBookRow` objects.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_parse_raw_entries(bids, update_id, ref(cpp_bids))
+        c_parse_raw_entries(asks, update_id, ref(cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: List, asks: List, update_id: int):
+        """
+        Applies a snapshot given in the exchange layout, `[[price, amount, ...], ...]`, with prices and amounts as
+        strings or numbers.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_parse_raw_entries(bids, update_id, ref(cpp_bids))
+        c_parse_raw_entries(asks, update_id, ref(cpp_asks))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_messages(self, messages: List[OrderBookMessage]):
+        """
+        Applies a sequence of diff messages as a single batch. The rows are merged per price level first (the last
+        update for a level wins, a zero amount still means deletion), and the merged levels are applied at once,
+        recording the highest update id of the batch.
+        """
+        cdef:
+            map[double, OrderBookEntry] bid_levels
+            map[double, OrderBookEntry] ask_levels
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t update_id
+            int64_t last_update_id
+
+        if len(messages) == 0:
+            return
+        last_update_id = messages[0].update_id
+        for message in messages:
+            update_id = message.update_id
+            if type(message) is OrderBookMessage:
+                c_merge_raw_entries(message.content["bids"], update_id, ref(bid_levels))
+                c_merge_raw_entries(message.content["asks"], update_id, ref(ask_levels))
+            else:
+                c_merge_rows(message.bids, ref(bid_levels))
+                c_merge_rows(message.asks, ref(ask_levels))
+            if update_id > last_update_id:
+                last_update_id = update_id
+
+        c_levels_to_entries(ref(bid_levels), ref(cpp_bids))
+        c_levels_to_entries(ref(ask_levels), ref(cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+
+    def apply_message(self, message: OrderBookMessage):
+        """
+        Applies a diff or snapshot message. Plain `OrderBookMessage` instances keep the rows as received from the
+        exchange, so they are parsed natively. Subclasses may reinterpret the content and are applied through their
+        `bids` and `asks` rows.
+        """
+        if message.type is OrderBookMessageType.DIFF:
+            if type(message) is OrderBookMessage:
+                self.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+            else:
+                self.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            if type(message) is OrderBookMessage:
+                self.apply_raw_snapshot(message.content["bids"], message.content["asks"], message.update_id)
+            else:
+                self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -318,142 +494,290 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef double c_get_level_amount(self, bint is_bid, double price):
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator it = deref(book).find(OrderBookEntry(price, 0, 0))
+        if it == deref(book).end():
+            return 0
+        return deref(it).getAmount()
+
+    cdef c_watch_level(self, bint is_bid, double price):
+        """
+        Starts recording the lowest amount the level at price of the bid side (is_bid) or the ask side goes through, as
+        the diffs and snapshots are applied. Levels are watched once per watcher, until each of them unwatches it.
+        """
+        cdef:
+            unordered_map[double, WatchedLevel] *levels = (ref(self._watched_bid_levels)
+                                                           if is_bid
+                                                           else ref(self._watched_ask_levels))
+            unordered_map[double, WatchedLevel].iterator it = deref(levels).find(price)
+        if it == deref(levels).end():
+            deref(levels)[price] = WatchedLevel(1, self.c_get_level_amount(is_bid, price))
+        else:
+            deref(it).second.watchers = deref(it).second.watchers + 1
+
+    cdef c_unwatch_level(self, bint is_bid, double price):
+        cdef:
+            unordered_map[double, WatchedLevel] *levels = (ref(self._watched_bid_levels)
+                                                           if is_bid
+                                                           else ref(self._watched_ask_levels))
+            unordered_map[double, WatchedLevel].iterator it = deref(levels).find(price)
+        if it != deref(levels).end():
+            deref(it).second.watchers = deref(it).second.watchers - 1
+            if deref(it).second.watchers <= 0:
+                deref(levels).erase(it)
+
+    cdef double c_pop_level_low_amount(self, bint is_bid, double price):
+        """
+        Returns the lowest amount of a watched level since it was last popped, or since it started being watched, and
+        starts recording again from its current amount. The current amount is returned for a level not watched.
+        """
+        cdef:
+            unordered_map[double, WatchedLevel] *levels = (ref(self._watched_bid_levels)
+                                                           if is_bid
+                                                           else ref(self._watched_ask_levels))
+            unordered_map[double, WatchedLevel].iterator it = deref(levels).find(price)
+            double current_amount = self.c_get_level_amount(is_bid, price)
+            double low_amount
+        if it == deref(levels).end():
+            return current_amount
+        low_amount = min(deref(it).second.low_amount, current_amount)
+        deref(it).second.low_amount = current_amount
+        return low_amount
+
+    cdef c_lower_watched_levels(self, bint is_bid):
+        cdef:
+            unordered_map[double, WatchedLevel] *levels = (ref(self._watched_bid_levels)
+                                                           if is_bid
+                                                           else ref(self._watched_ask_levels))
+            unordered_map[double, WatchedLevel].iterator it = deref(levels).begin()
+        while it != deref(levels).end():
+            deref(it).second.low_amount = min(deref(it).second.low_amount,
+                                              self.c_get_level_amount(is_bid, deref(it).first))
+            inc(it)
+
+    def get_level_amount(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_amount(is_bid, price)
+
+    def watch_level(self, is_bid: bool, price: float):
+        self.c_watch_level(is_bid, price)
+
+    def unwatch_level(self, is_bid: bool, price: float):
+        self.c_unwatch_level(is_bid, price)
+
+    def pop_level_low_amount(self, is_bid: bool, price: float) -> float:
+        return self.c_pop_level_low_amount(is_bid, price)
+
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_dirty_price = INFINITY
+        self._ask_depth_dirty_price = -INFINITY
+
+    cdef int c_top_levels(self, bint is_buy, double[:, ::1] levels):
+        """
+        Writes the first levels of the ask side (is_buy) or the bid side into the rows of levels, and returns the number
+        of rows written.
+        """
+        cdef:
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+            int max_levels = levels.shape[0]
+            int count = 0
+
+        while count < max_levels:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            levels[count, 0] = entry.getPrice()
+            levels[count, 1] = entry.getAmount()
+            levels[count, 2] = entry.getUpdateId()
+            count += 1
+        return count
+
+    cdef vector[OrderBookDepthLevel] *c_get_depth_index(self, bint is_buy):
+        """
+        Returns the cumulative depth index for one side of the book, ordered from the best price outwards.
+
+        Diffs only record the best-priced level they touched, so the levels before it keep their cumulative sums and
+        only the remainder of the index is recomputed here. The sums are accumulated level by level in book order, which
+        keeps them bit-identical to walking the entries.
+        """
+        cdef:
+            vector[OrderBookDepthLevel] *levels
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+            OrderBookDepthLevel level
+            size_t valid_levels
+            double cumulative_base = 0
+            double cumulative_quote = 0
+            double level_quote
+
+        if is_buy:
+            levels = ref(self._ask_depth_index)
+            if self._ask_depth_dirty_price == INFINITY:
+                return levels
+            valid_levels = c_depth_levels_within_price(levels, True, self._ask_depth_dirty_price)
+            while valid_levels > 0 and deref(levels)[valid_levels - 1].price >= self._ask_depth_dirty_price:
+                valid_levels -= 1
+        else:
+            levels = ref(self._bid_depth_index)
+            if self._bid_depth_dirty_price == -INFINITY:
+                return levels
+            valid_levels = c_depth_levels_within_price(levels, False, self._bid_depth_dirty_price)
+            while valid_levels > 0 and deref(levels)[valid_levels - 1].price <= self._bid_depth_dirty_price:
+                valid_levels -= 1
+
+        deref(levels).resize(valid_levels)
+        if valid_levels > 0:
+            level = deref(levels)[valid_levels - 1]
+            cumulative_base = level.cumulative_base
+            cumulative_quote = level.cumulative_quote
+
+        if is_buy:
+            if valid_levels > 0:
+                it = self._ask_book.upper_bound(OrderBookEntry(level.price, 0, 0))
+            else:
+                it = self._ask_book.begin()
+            while it != self._ask_book.end():
+                entry = deref(it)
+                level_quote = entry.getAmount() * entry.getPrice()
+                cumulative_base += entry.getAmount()
+                cumulative_quote += level_quote
+                deref(levels).push_back(
+                    OrderBookDepthLevel(entry.getPrice(), entry.getAmount(), cumulative_base, cumulative_quote)
+                )
+                inc(it)
+            self._ask_depth_dirty_price = INFINITY
+        else:
+            if valid_levels > 0:
+                it = self._bid_book.lower_bound(OrderBookEntry(level.price, 0, 0))
+            else:
+                it = self._bid_book.end()
+            while it != self._bid_book.begin():
+                dec(it)
+                entry = deref(it)
+                level_quote = entry.getAmount() * entry.getPrice()
+                cumulative_base += entry.getAmount()
+                cumulative_quote += level_quote
+                deref(levels).push_back(
+                    OrderBookDepthLevel(entry.getPrice(), entry.getAmount(), cumulative_base, cumulative_quote)
+                )
+            self._bid_depth_dirty_price = -INFINITY
+
+        return levels
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[OrderBookDepthLevel] *levels = self.c_get_depth_index(is_buy)
+            size_t index = c_depth_level_for_base(levels, volume)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        if index < deref(levels).size():
+            cumulative_volume = deref(levels)[index].cumulative_base
+            result_price = deref(levels)[index].price
+        elif index > 0:
+            cumulative_volume = deref(levels)[index - 1].cumulative_base
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[OrderBookDepthLevel] *levels = self.c_get_depth_index(is_buy)
+            size_t index = c_depth_level_for_base(levels, volume)
+            OrderBookDepthLevel level
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        if index < deref(levels).size():
+            # Replays the same floating point steps as the level by level walk on the level that fills the volume.
+            level = deref(levels)[index]
+            total_cost = level.cumulative_quote
+            total_volume = level.cumulative_base
+            total_cost -= level.amount * level.price
+            total_volume -= level.amount
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * level.price
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif index > 0:
+            total_volume = deref(levels)[index - 1].cumulative_base
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[OrderBookDepthLevel] *levels = self.c_get_depth_index(is_buy)
+            size_t index = c_depth_level_for_quote(levels, quote_volume)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if index < deref(levels).size():
+            cumulative_volume = deref(levels)[index].cumulative_quote
+            result_price = deref(levels)[index].price
+        elif index > 0:
+            cumulative_volume = deref(levels)[index - 1].cumulative_quote
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[OrderBookDepthLevel] *levels = self.c_get_depth_index(is_buy)
+            size_t index = c_depth_level_for_base(levels, base_amount)
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        if index > 0:
+            cumulative_base_amount = deref(levels)[index - 1].cumulative_base
+            cumulative_volume = deref(levels)[index - 1].cumulative_quote
+
+        # All levels before `index` are taken whole, the remaining amount is taken from the following levels.
+        while index < deref(levels).size():
+            row_amount = deref(levels)[index].amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * deref(levels)[index].price
+            if cumulative_base_amount >= base_amount:
+                break
+            index += 1
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[OrderBookDepthLevel] *levels = self.c_get_depth_index(is_buy)
+            size_t index = c_depth_levels_within_price(levels, is_buy, price)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if index > 0:
+            cumulative_volume = deref(levels)[index - 1].cumulative_base
+            result_price = deref(levels)[index - 1].price
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[OrderBookDepthLevel] *levels = self.c_get_depth_index(is_buy)
+            size_t index = c_depth_levels_within_price(levels, is_buy, price)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if index > 0:
+            cumulative_volume = deref(levels)[index - 1].cumulative_quote
+            result_price = deref(levels)[index - 1].price
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -478,6 +802,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_message(diff)
@@ -1,8 +1,10 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -14,6 +16,10 @@ class OrderBookMessageType(Enum):
 
 @total_ordering
 class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp")):
+    """
+    The content is treated as immutable once the message is created, so the fields parsed from it (update and trade
+    ids, bid and ask rows) are computed on first access and cached in the message.
+    """
     type: OrderBookMessageType
     content: Dict[str, any]
     timestamp: float
@@ -28,7 +34,7 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     ):
         return super(OrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
 
-    @property
+    @cached_property
     def update_id(self) -> int:
         if self.type in [OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT]:
             return self.content["update_id"]
@@ -42,7 +48,7 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         else:
             return -1
 
-    @property
+    @cached_property
     def trade_id(self) -> int:
         if self.type is OrderBookMessageType.TRADE:
             return self.content["trade_id"]
@@ -52,18 +58,34 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
         ]
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        """
+        The ask rows as a `(n, 3)` float64 array of [price, amount, update_id], as expected by
+        `OrderBook.apply_numpy_diffs`.
+        """
+        return self._rows_to_array(self.asks)
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bid rows as a `(n, 3)` float64 array of [price, amount, update_id], as expected by
+        `OrderBook.apply_numpy_diffs`.
+        """
+        return self._rows_to_array(self.bids)
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -72,26 +94,29 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
 
+    @staticmethod
+    def _rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+        return np.array(rows, dtype=np.float64).reshape(-1, 3)
+
     def __eq__(self, other: "OrderBookMessage") -> bool:
         eq = (
             (self.type == other.type)
             and (
                 (self.has_update_id and (self.update_id == other.update_id))
-                or (self.trade_id == other.trade_id)
+                or (self.has_trade_id and (self.trade_id == other.trade_id))
             )
         )
         return eq
 
     def __hash__(self):
-        return hash(self.type, self.update_id, self.trade_id)
+        return hash((self.type, self.update_id, self.trade_id))
 
     def __lt__(self, other: "OrderBookMessage") -> bool:
-        eq = (
-            (self.has_update_id and other.has_update_id and self.update_id < other.update_id)
-            or (self.has_trade_id and other.has_trade_id and self.trade_id < other.trade_id)
-            or (
-                ((self.timestamp != other.timestamp) and self.timestamp < other.timestamp)
-                or self.has_update_id  # if same timestamp, order book messages < trade messages.
-            )
-        )
-        return eq
+        if self.has_update_id and other.has_update_id:
+            return self.update_id < other.update_id
+        if self.has_trade_id and other.has_trade_id:
+            return self.trade_id < other.trade_id
+        if self.timestamp != other.timestamp:
+            return self.timestamp < other.timestamp
+        # if same timestamp, order book messages < trade messages.
+        return self.has_update_id and not other.has_update_id
@@ -4,7 +4,7 @@ import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -20,6 +20,7 @@ from hummingbot.logger import HummingbotLogger
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
     EXCHANGE_API = 3
+    SHARED_MEMORY = 4
 
 
 @dataclass
@@ -108,11 +109,27 @@ class OrderBookPairMetrics:
     last_trade_timestamp: float = 0.0
     tracking_start_time: float = 0.0
 
+    # Diff coalescing
+    diff_batches_applied: int = 0
+    diffs_coalesced: int = 0  # Diff messages applied as part of a batch
+    queue_depth: int = 0  # Tracking queue depth seen by the last processed diff
+    max_queue_depth: int = 0
+
     # Latency tracking
     diff_processing_latency: LatencyStats = field(default_factory=LatencyStats)
     snapshot_processing_latency: LatencyStats = field(default_factory=LatencyStats)
     trade_processing_latency: LatencyStats = field(default_factory=LatencyStats)
 
+    @property
+    def coalescing_ratio(self) -> float:
+        """Average number of diff messages merged into each applied batch."""
+        return self.diffs_coalesced / self.diff_batches_applied if self.diff_batches_applied > 0 else 0.0
+
+    def record_queue_depth(self, queue_depth: int):
+        self.queue_depth = queue_depth
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+
     def messages_per_minute(self, current_time: float) -> Dict[str, float]:
         """Calculate messages per minute rates."""
         elapsed_minutes = (current_time - self.tracking_start_time) / 60.0 if self.tracking_start_time > 0 else 0
@@ -143,6 +160,11 @@ class OrderBookPairMetrics:
             "last_snapshot_timestamp": self.last_snapshot_timestamp,
             "last_trade_timestamp": self.last_trade_timestamp,
             "tracking_start_time": self.tracking_start_time,
+            "diff_batches_applied": self.diff_batches_applied,
+            "diffs_coalesced": self.diffs_coalesced,
+            "coalescing_ratio": self.coalescing_ratio,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
             "messages_per_minute": self.messages_per_minute(current_time),
             "diff_latency": self.diff_processing_latency.to_dict(),
             "snapshot_latency": self.snapshot_processing_latency.to_dict(),
@@ -162,6 +184,8 @@ class OrderBookTrackerMetrics:
     total_snapshots_rejected: int = 0
     total_trades_processed: int = 0
     total_trades_rejected: int = 0
+    total_diff_batches_applied: int = 0
+    total_diffs_coalesced: int = 0
 
     # Timing
     tracker_start_time: float = 0.0
@@ -187,6 +211,15 @@ class OrderBookTrackerMetrics:
         """Remove metrics for a trading pair."""
         self.per_pair_metrics.pop(trading_pair, None)
 
+    @property
+    def coalescing_ratio(self) -> float:
+        """Average number of diff messages merged into each applied batch, across all pairs."""
+        return (
+            self.total_diffs_coalesced / self.total_diff_batches_applied
+            if self.total_diff_batches_applied > 0
+            else 0.0
+        )
+
     def messages_per_minute(self, current_time: float) -> Dict[str, float]:
         """Calculate global messages per minute rates."""
         elapsed_minutes = (current_time - self.tracker_start_time) / 60.0 if self.tracker_start_time > 0 else 0
@@ -215,6 +248,9 @@ class OrderBookTrackerMetrics:
             "total_snapshots_rejected": self.total_snapshots_rejected,
             "total_trades_processed": self.total_trades_processed,
             "total_trades_rejected": self.total_trades_rejected,
+            "total_diff_batches_applied": self.total_diff_batches_applied,
+            "total_diffs_coalesced": self.total_diffs_coalesced,
+            "coalescing_ratio": self.coalescing_ratio,
             "tracker_start_time": self.tracker_start_time,
             "uptime_seconds": current_time - self.tracker_start_time if self.tracker_start_time > 0 else 0,
             "messages_per_minute": self.messages_per_minute(current_time),
@@ -238,8 +274,17 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 coalesce_diffs: bool = False):
+        """
+        :param coalesce_diffs: if True, all diffs pending for a trading pair are merged per price level and applied to
+            the order book as a single batch, instead of being applied one by one
+        """
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -252,6 +297,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._diff_listeners: List[Callable[[OrderBookMessage], None]] = []
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -275,10 +321,32 @@ class OrderBookTracker:
     def data_source(self) -> OrderBookTrackerDataSource:
         return self._data_source
 
+    @property
+    def data_source_type(self) -> OrderBookTrackerDataSourceType:
+        return OrderBookTrackerDataSourceType.EXCHANGE_API
+
+    @property
+    def coalesce_diffs(self) -> bool:
+        return self._coalesce_diffs
+
+    @coalesce_diffs.setter
+    def coalesce_diffs(self, value: bool):
+        self._coalesce_diffs = value
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    def add_diff_listener(self, listener: Callable[[OrderBookMessage], None]):
+        """
+        Adds a function called with each diff message once it is applied to its order book.
+        """
+        self._diff_listeners.append(listener)
+
+    def remove_diff_listener(self, listener: Callable[[OrderBookMessage], None]):
+        if listener in self._diff_listeners:
+            self._diff_listeners.remove(listener)
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
@@ -636,23 +704,45 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        pair_metrics: OrderBookPairMetrics = self._metrics.get_or_create_pair_metrics(trading_pair)
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process a message left over from the last diff batch, then saved messages if there are any
+                if pending_message is not None:
+                    message = pending_message
+                    pending_message = None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    pair_metrics.record_queue_depth(message_queue.qsize())
+                    if self._coalesce_diffs:
+                        diff_messages: List[OrderBookMessage] = [message]
+                        pending_message = self._drain_pending_diffs(saved_messages, message_queue, diff_messages)
+                        order_book.apply_diff_messages(diff_messages)
+                        past_diffs_window.extend(diff_messages)
+                        for listener in self._diff_listeners:
+                            for diff_message in diff_messages:
+                                listener(diff_message)
+                        diff_messages_accepted += len(diff_messages)
+                        pair_metrics.diff_batches_applied += 1
+                        pair_metrics.diffs_coalesced += len(diff_messages)
+                        self._metrics.total_diff_batches_applied += 1
+                        self._metrics.total_diffs_coalesced += len(diff_messages)
+                    else:
+                        order_book.apply_message(message)
+                        past_diffs_window.append(message)
+                        for listener in self._diff_listeners:
+                            listener(message)
+                        diff_messages_accepted += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -673,6 +763,28 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _drain_pending_diffs(saved_messages: Deque[OrderBookMessage],
+                             message_queue: asyncio.Queue,
+                             diff_messages: List[OrderBookMessage]) -> Optional[OrderBookMessage]:
+        """
+        Moves the diff messages already waiting for a trading pair into `diff_messages`, without waiting for new ones.
+        Draining stops at the first message that is not a diff, so that it is processed after the batch.
+
+        :return: the first non diff message found, or None if every pending message was a diff
+        """
+        while len(saved_messages) > 0:
+            message = saved_messages.popleft()
+            if message.type is not OrderBookMessageType.DIFF:
+                return message
+            diff_messages.append(message)
+        while not message_queue.empty():
+            message = message_queue.get_nowait()
+            if message.type is not OrderBookMessageType.DIFF:
+                return message
+            diff_messages.append(message)
+        return None
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -65,7 +65,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_message(snapshot_msg)
         return order_book
 
     async def listen_for_subscriptions(self):
@@ -233,17 +233,18 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None:  # data will be None when the websocket is disconnected
-                channel: str = self._channel_originating_message(event_message=data)
-                valid_channels = self._get_messages_queue_keys()
-                if channel in valid_channels:
-                    self._message_queue[channel].put_nowait(data)
-                else:
-                    await self._process_message_for_unknown_channel(
-                        event_message=data, websocket_assistant=websocket_assistant
-                    )
+        async for ws_responses in websocket_assistant.iter_message_batches():
+            valid_channels = self._get_messages_queue_keys()
+            for ws_response in ws_responses:
+                data: Dict[str, Any] = ws_response.data
+                if data is not None:  # data will be None when the websocket is disconnected
+                    channel: str = self._channel_originating_message(event_message=data)
+                    if channel in valid_channels:
+                        self._message_queue[channel].put_nowait(data)
+                    else:
+                        await self._process_message_for_unknown_channel(
+                            event_message=data, websocket_assistant=websocket_assistant
+                        )
 
     def _get_messages_queue_keys(self) -> List[str]:
         return [self._snapshot_messages_queue_key, self._diff_messages_queue_key, self._trade_messages_queue_key]
@@ -0,0 +1,403 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_memory_order_book import (
+    SharedMemoryOrderBook,
+    publish_order_book,
+    shared_row_size,
+)
+from hummingbot.core.data_type.shared_memory_order_book_tracker import _open_shared_memory, _unlink_shared_memory
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+ADD_TRADING_PAIR = "add"
+REMOVE_TRADING_PAIR = "remove"
+# Sequence written by a worker in the row of a removed trading pair once it stopped publishing it, so the slot can be
+# reused. It is even, so readers of the removed book don't wait for the row to be written.
+RELEASED_SLOT_SEQUENCE = -2
+
+
+class OrderBookShard:
+    """
+    Group of trading pairs whose order books are maintained by one worker process, and the shared memory block where
+    the worker publishes them, one row per trading pair.
+    """
+
+    def __init__(self, index: int, trading_pairs: List[str], capacity: int, depth: int):
+        self.index = index
+        self.capacity = capacity
+        self.depth = depth
+        self.slots: Dict[str, int] = {trading_pair: slot for slot, trading_pair in enumerate(trading_pairs)}
+        # Slots of the removed trading pairs the worker may still be publishing
+        self.releasing_slots: Set[int] = set()
+        self.shared_memory: Optional[SharedMemory] = None
+        self.rows: Optional[np.ndarray] = None
+        self.commands: Optional[multiprocessing.Queue] = None
+        self.process: Optional[multiprocessing.Process] = None
+
+    def allocate(self):
+        self.shared_memory = SharedMemory(create=True, size=self.capacity * shared_row_size(self.depth) * 8)
+        self.rows = np.ndarray((self.capacity, shared_row_size(self.depth)), dtype=np.float64,
+                               buffer=self.shared_memory.buf)
+        self.rows[:] = np.nan
+        self.rows[:, 0] = 0
+        self.releasing_slots.clear()
+
+    def release(self):
+        self.rows = None
+        if self.shared_memory is not None:
+            try:
+                self.shared_memory.close()
+            except BufferError:
+                # Order books still referenced by the strategies keep the block mapped until they are collected
+                pass
+            # The workers share the resource tracker of this process and unregistered the block when attaching to it
+            _unlink_shared_memory(self.shared_memory)
+            self.shared_memory = None
+
+    def free_slot(self) -> Optional[int]:
+        """
+        Returns a slot not used by any trading pair. The slot of a removed trading pair is only free once the worker
+        released it, otherwise the worker could still publish the removed book into it.
+        """
+        used_slots = set(self.slots.values())
+        for slot in range(self.capacity):
+            if slot in used_slots:
+                continue
+            if slot in self.releasing_slots:
+                if self.rows[slot, 0] != RELEASED_SLOT_SEQUENCE:
+                    continue
+                self.releasing_slots.discard(slot)
+            return slot
+        return None
+
+
+class ShardedOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that maintains the order books in worker processes, each one following a group of trading pairs.
+
+    Every worker runs its own instance of the connector order book tracker, so the websocket messages of its trading
+    pairs are received, parsed and applied to the books in the worker. The top levels of the books are published into
+    shared memory, where the `SharedMemoryOrderBook` instances of this tracker read them: best prices are read without
+    any inter-process call, deeper queries only see the published depth. The public trades are forwarded to the
+    tracker through a queue and applied to its order books, so the trade events keep being triggered in this process.
+    """
+    _sobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sobt_logger is None:
+            cls._sobt_logger = logging.getLogger(__name__)
+        return cls._sobt_logger
+
+    def __init__(self,
+                 connector_name: str,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 worker_processes: int = 2,
+                 depth: int = 20,
+                 publish_interval: float = 0.005,
+                 spare_slots: int = 8,
+                 worker_check_interval: float = 1.0):
+        """
+        :param connector_name: name of the connector instantiated by the workers
+        :param worker_processes: number of worker processes, the trading pairs are split evenly between them
+        :param depth: number of levels published on each side of the books
+        :param publish_interval: seconds between the checks for updated books in the workers
+        :param spare_slots: number of trading pairs each worker can add after starting
+        :param worker_check_interval: seconds between the checks that the workers are alive
+        """
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._connector_name = connector_name
+        self._depth = depth
+        self._publish_interval = publish_interval
+        self._worker_check_interval = worker_check_interval
+        shard_count = max(1, min(worker_processes, len(trading_pairs)))
+        shard_pairs = [trading_pairs[index::shard_count] for index in range(shard_count)]
+        capacity = max(len(pairs) for pairs in shard_pairs) + spare_slots
+        self._shards: List[OrderBookShard] = [OrderBookShard(index, pairs, capacity, depth)
+                                              for index, pairs in enumerate(shard_pairs)]
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._trades: Optional[multiprocessing.Queue] = None
+        self._forward_trades_task: Optional[asyncio.Task] = None
+        self._wait_for_order_books_task: Optional[asyncio.Task] = None
+        self._watch_workers_task: Optional[asyncio.Task] = None
+        # Sequences of the rows of restarted workers when they were restarted, their books are stale until published
+        self._restarted_sequences: Dict[str, int] = {}
+
+    @property
+    def shards(self) -> List[OrderBookShard]:
+        return self._shards
+
+    def start(self):
+        self.stop()
+        self._metrics.tracker_start_time = time.perf_counter()
+        self._trades = self._mp_context.Queue(maxsize=100000)
+        for shard in self._shards:
+            shard.allocate()
+            for trading_pair, slot in shard.slots.items():
+                self._order_books[trading_pair] = SharedMemoryOrderBook(shard.rows[slot], self._depth)
+            self._start_worker(shard)
+        self._forward_trades_task = safe_ensure_future(self._forward_trades_loop())
+        self._wait_for_order_books_task = safe_ensure_future(self._wait_for_order_books())
+        self._watch_workers_task = safe_ensure_future(self._watch_workers_loop())
+
+    def stop(self):
+        if self._forward_trades_task is not None:
+            self._forward_trades_task.cancel()
+            self._forward_trades_task = None
+        if self._wait_for_order_books_task is not None:
+            self._wait_for_order_books_task.cancel()
+            self._wait_for_order_books_task = None
+        if self._watch_workers_task is not None:
+            self._watch_workers_task.cancel()
+            self._watch_workers_task = None
+        self._restarted_sequences.clear()
+        for shard in self._shards:
+            self._stop_worker(shard)
+            shard.release()
+        self._order_books.clear()
+        self._order_books_initialized.clear()
+
+    async def add_trading_pair(self, trading_pair: str) -> bool:
+        if trading_pair in self._order_books:
+            self.logger().warning(f"Trading pair {trading_pair} is already being tracked")
+            return False
+        await self._order_books_initialized.wait()
+        shard_slots: List[Tuple[OrderBookShard, int]] = [(shard, shard.free_slot()) for shard in self._shards]
+        shard_slots = [(shard, slot) for shard, slot in shard_slots if slot is not None]
+        if len(shard_slots) == 0:
+            self.logger().error(f"Can't add {trading_pair}, all the order book workers are full.")
+            return False
+        shard, slot = min(shard_slots, key=lambda shard_slot: len(shard_slot[0].slots))
+        shard.rows[slot] = np.nan
+        shard.rows[slot, 0] = 0
+        shard.slots[trading_pair] = slot
+        shard.commands.put((ADD_TRADING_PAIR, trading_pair, slot))
+        if trading_pair not in self._trading_pairs:
+            self._trading_pairs.append(trading_pair)
+        self._order_books[trading_pair] = SharedMemoryOrderBook(shard.rows[slot], self._depth)
+        self.logger().info(f"Added trading pair {trading_pair} to order book worker {shard.index}")
+        return True
+
+    async def remove_trading_pair(self, trading_pair: str) -> bool:
+        shard = next((shard for shard in self._shards if trading_pair in shard.slots), None)
+        if trading_pair not in self._order_books or shard is None:
+            self.logger().warning(f"Trading pair {trading_pair} is not being tracked")
+            return False
+        slot = shard.slots.pop(trading_pair)
+        shard.releasing_slots.add(slot)
+        shard.commands.put((REMOVE_TRADING_PAIR, trading_pair, slot))
+        self._order_books.pop(trading_pair, None)
+        self._metrics.remove_pair_metrics(trading_pair)
+        if trading_pair in self._trading_pairs:
+            self._trading_pairs.remove(trading_pair)
+        self.logger().info(f"Removed trading pair {trading_pair} from order book worker {shard.index}")
+        return True
+
+    def _start_worker(self, shard: OrderBookShard):
+        shard.commands = self._mp_context.Queue()
+        shard.process = self._mp_context.Process(
+            target=run_order_book_worker,
+            args=(self._connector_name, shard.slots, shard.shared_memory.name, shard.capacity, self._depth,
+                  self._publish_interval, shard.commands, self._trades),
+            name=f"{self._connector_name}_order_books_{shard.index}",
+            daemon=True,
+        )
+        shard.process.start()
+
+    def _stop_worker(self, shard: OrderBookShard):
+        if shard.process is not None:
+            shard.commands.put(None)
+            shard.process.join(timeout=5)
+            if shard.process.is_alive():
+                shard.process.terminate()
+                shard.process.join(timeout=5)
+            shard.process = None
+        # A stopped worker doesn't publish anymore, its removals don't need to be acknowledged
+        shard.releasing_slots.clear()
+        shard.commands = None
+
+    async def _wait_for_order_books(self):
+        while not all(order_book.sequence > self._restarted_sequences.get(trading_pair, 0)
+                      for trading_pair, order_book in self._order_books.items()):
+            await self._sleep(self._publish_interval)
+        self._restarted_sequences.clear()
+        self._order_books_initialized.set()
+        self.logger().info(f"Initialized the {len(self._order_books)} order books of the {len(self._shards)} "
+                           f"order book workers.")
+
+    async def _watch_workers_loop(self):
+        while True:
+            await self._sleep(self._worker_check_interval)
+            for shard in self._shards:
+                if shard.process is not None and not shard.process.is_alive():
+                    self._restart_worker(shard)
+
+    def _restart_worker(self, shard: OrderBookShard):
+        """
+        Starts a new worker for the trading pairs of a worker that died. The tracker is not ready until the new worker
+        published all their books, since the published ones stopped being updated.
+        """
+        self.logger().error(f"Order book worker {shard.index} exited unexpectedly (exit code "
+                            f"{shard.process.exitcode}), restarting it.")
+        self._order_books_initialized.clear()
+        for trading_pair in shard.slots:
+            order_book = self._order_books.get(trading_pair)
+            if order_book is not None:
+                self._restarted_sequences[trading_pair] = order_book.sequence
+        self._stop_worker(shard)
+        self._start_worker(shard)
+        if self._wait_for_order_books_task is None or self._wait_for_order_books_task.done():
+            self._wait_for_order_books_task = safe_ensure_future(self._wait_for_order_books())
+
+    async def _forward_trades_loop(self):
+        while True:
+            try:
+                trade: OrderBookTradeEvent = self._trades.get_nowait()
+            except queue.Empty:
+                await self._sleep(self._publish_interval)
+                continue
+            order_book = self._order_books.get(trade.trading_pair)
+            if order_book is not None:
+                order_book.apply_trade(trade)
+                self._metrics.total_trades_processed += 1
+
+
+class OrderBookPublisher:
+    """
+    Publishes the order books of a tracker into the shared rows of their slots, each time they changed.
+    """
+
+    def __init__(self,
+                 tracker: OrderBookTracker,
+                 rows: np.ndarray,
+                 depth: int,
+                 trade_listener: Optional[EventForwarder] = None):
+        """
+        :param rows: the shared rows, indexed by slot
+        :param trade_listener: listener added to the trade events of the order books
+        """
+        self._tracker = tracker
+        self._rows = rows
+        self._depth = depth
+        self._trade_listener = trade_listener
+        self._published: Dict[str, Tuple] = {}
+
+    def publish(self, slots: Dict[str, int]):
+        for trading_pair, slot in slots.items():
+            order_book: Optional[OrderBook] = self._tracker.order_books.get(trading_pair)
+            if order_book is None:
+                continue
+            if trading_pair not in self._published and self._trade_listener is not None:
+                order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_listener)
+            # Diffs of some exchanges share their update id, so the best levels are compared too
+            best_bid, best_ask = order_book.top_levels(1)
+            state = (order_book.snapshot_uid, order_book.last_diff_uid, order_book.last_applied_trade,
+                     order_book.last_trade_price_rest_updated, best_bid.tobytes(), best_ask.tobytes())
+            if self._published.get(trading_pair) != state:
+                publish_order_book(self._rows[slot], order_book, self._depth, time.time())
+                self._published[trading_pair] = state
+
+    def forget(self, trading_pair: str):
+        self._published.pop(trading_pair, None)
+
+
+class PublicTradeForwarder:
+    """
+    Forwards the public trades of the worker order books to the tracker. Trades are dropped when the queue is full,
+    they are counted and logged at most once every log interval.
+    """
+
+    def __init__(self, trades: multiprocessing.Queue, log_interval: float = 10.0):
+        self._trades = trades
+        self._log_interval = log_interval
+        self._last_log_timestamp = 0.0
+        self.dropped_trades = 0
+        self._logged_dropped_trades = 0
+
+    def __call__(self, trade: OrderBookTradeEvent):
+        try:
+            self._trades.put_nowait(trade)
+        except queue.Full:
+            self.dropped_trades += 1
+            now = time.time()
+            if now - self._last_log_timestamp >= self._log_interval:
+                ShardedOrderBookTracker.logger().warning(
+                    f"Dropped {self.dropped_trades - self._logged_dropped_trades} public trades, the order book "
+                    f"tracker is not consuming them fast enough ({self.dropped_trades} dropped in total).")
+                self._last_log_timestamp = now
+                self._logged_dropped_trades = self.dropped_trades
+
+
+def run_order_book_worker(connector_name: str,
+                          slots: Dict[str, int],
+                          shared_memory_name: str,
+                          capacity: int,
+                          depth: int,
+                          publish_interval: float,
+                          commands: multiprocessing.Queue,
+                          trades: multiprocessing.Queue):
+    """
+    Entry point of the order book worker processes.
+    """
+    asyncio.run(_order_book_worker_loop(connector_name, slots, shared_memory_name, capacity, depth, publish_interval,
+                                        commands, trades))
+
+
+async def _order_book_worker_loop(connector_name: str,
+                                  slots: Dict[str, int],
+                                  shared_memory_name: str,
+                                  capacity: int,
+                                  depth: int,
+                                  publish_interval: float,
+                                  commands: multiprocessing.Queue,
+                                  trades: multiprocessing.Queue):
+    from hummingbot.client.settings import AllConnectorSettings
+
+    # The block is unlinked by the tracker that allocated it, not by the resource tracker when the worker exits
+    shared_memory = _open_shared_memory(shared_memory_name)
+    rows = np.ndarray((capacity, shared_row_size(depth)), dtype=np.float64, buffer=shared_memory.buf)
+    connector = AllConnectorSettings.get_connector_settings()[connector_name] \
+        .non_trading_connector_instance_with_default_configuration(trading_pairs=list(slots))
+    tracker: OrderBookTracker = connector.order_book_tracker
+    publisher = OrderBookPublisher(tracker, rows, depth,
+                                   trade_listener=EventForwarder(PublicTradeForwarder(trades)))
+    tracker.start()
+    try:
+        while True:
+            try:
+                command = commands.get_nowait()
+                if command is None:
+                    return
+                action, trading_pair, slot = command
+                if action == ADD_TRADING_PAIR:
+                    slots[trading_pair] = slot
+                    safe_ensure_future(tracker.add_trading_pair(trading_pair))
+                else:
+                    slots.pop(trading_pair, None)
+                    publisher.forget(trading_pair)
+                    safe_ensure_future(tracker.remove_trading_pair(trading_pair))
+                    rows[slot, 0] = RELEASED_SLOT_SEQUENCE
+                continue
+            except queue.Empty:
+                pass
+            publisher.publish(slots)
+            await asyncio.sleep(publish_interval)
+    finally:
+        tracker.stop()
+        del publisher, rows
+        shared_memory.close()
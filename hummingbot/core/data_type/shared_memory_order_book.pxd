@@ -0,0 +1,20 @@
+# distutils: language=c++
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+
+cdef class SharedMemoryOrderBook(OrderBook):
+    cdef:
+        object _shared_row
+        double[::1] _row
+        int _depth
+        double _synced_sequence
+
+    cdef c_sync(self)
+    cdef int c_top_levels(self, bint is_buy, double[:, ::1] levels)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
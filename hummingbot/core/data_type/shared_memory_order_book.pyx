@@ -0,0 +1,188 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from typing import Iterator
+
+from libc.math cimport isnan
+from libc.stdint cimport int64_t
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+cimport numpy as np
+
+cdef extern from "<atomic>" namespace "std" nogil:
+    ctypedef enum memory_order:
+        memory_order_seq_cst
+    void atomic_thread_fence(memory_order order)
+
+# Layout of a shared row: a sequence number, odd while the row is being written, the update id of the book, its last
+# trade price, the time it was published, then the prices and amounts of the top bid and ask levels.
+cdef enum:
+    SEQUENCE = 0
+    UPDATE_ID = 1
+    LAST_TRADE_PRICE = 2
+    TIMESTAMP = 3
+    LEVELS = 4
+
+# Number of times a row being written is read again, before keeping the levels copied from it before
+cdef enum:
+    SYNC_ATTEMPTS = 100
+
+NaN = float("nan")
+
+
+def shared_row_size(int depth) -> int:
+    """
+    Returns the number of doubles of a shared row holding depth levels on each side.
+    """
+    return LEVELS + 4 * depth
+
+
+def publish_order_book(double[::1] row, OrderBook order_book, int depth, double timestamp):
+    """
+    Writes the top depth levels of the order book into the shared row. The sequence number of the row is odd while it
+    is written, so readers in other processes never use a partially written row.
+    """
+    cdef:
+        double[:, ::1] bids = np.full((depth, 3), NaN)
+        double[:, ::1] asks = np.full((depth, 3), NaN)
+        int i
+
+    order_book.c_top_levels(False, bids)
+    order_book.c_top_levels(True, asks)
+    row[SEQUENCE] += 1
+    atomic_thread_fence(memory_order_seq_cst)
+    for i in range(depth):
+        row[LEVELS + i] = bids[i, 0]
+        row[LEVELS + depth + i] = bids[i, 1]
+        row[LEVELS + 2 * depth + i] = asks[i, 0]
+        row[LEVELS + 3 * depth + i] = asks[i, 1]
+    row[UPDATE_ID] = max(order_book._snapshot_uid, order_book._last_diff_uid)
+    row[LAST_TRADE_PRICE] = order_book._last_trade_price
+    row[TIMESTAMP] = timestamp
+    atomic_thread_fence(memory_order_seq_cst)
+    row[SEQUENCE] += 1
+
+
+cdef class SharedMemoryOrderBook(OrderBook):
+    """
+    Order book whose top levels are maintained by another process and read from a shared memory row written with
+    `publish_order_book`.
+
+    The best prices are read directly from the shared row, without any copy or inter-process call. The other queries
+    first copy the published levels into the local book when the row changed since the last copy, then run on them, so
+    they only see the published depth.
+    """
+
+    def __init__(self, np.ndarray[np.float64_t, ndim=1] shared_row, int depth, dex=False):
+        super().__init__(dex=dex)
+        # Keeps the shared buffer alive as long as the book
+        self._shared_row = shared_row
+        self._row = shared_row
+        self._depth = depth
+        self._synced_sequence = 0
+
+    @property
+    def sequence(self) -> int:
+        return int(self._row[SEQUENCE])
+
+    @property
+    def published_timestamp(self) -> float:
+        return self._row[TIMESTAMP]
+
+    @property
+    def last_trade_price(self) -> float:
+        return self._row[LAST_TRADE_PRICE]
+
+    @last_trade_price.setter
+    def last_trade_price(self, value: float):
+        self._last_trade_price = value
+
+    cdef c_sync(self):
+        cdef:
+            double sequence = self._row[SEQUENCE]
+            int depth = self._depth
+            int attempt
+            int i
+            int bid_count = 0
+            int ask_count = 0
+            np.ndarray[np.float64_t, ndim=2] bids
+            np.ndarray[np.float64_t, ndim=2] asks
+
+        if sequence == self._synced_sequence:
+            return
+        bids = np.empty((depth, 3), dtype=np.float64)
+        asks = np.empty((depth, 3), dtype=np.float64)
+        for attempt in range(SYNC_ATTEMPTS):
+            sequence = self._row[SEQUENCE]
+            if (<int64_t>sequence) & 1:
+                continue
+            atomic_thread_fence(memory_order_seq_cst)
+            for i in range(depth):
+                bids[i, 0] = self._row[LEVELS + i]
+                bids[i, 1] = self._row[LEVELS + depth + i]
+                asks[i, 0] = self._row[LEVELS + 2 * depth + i]
+                asks[i, 1] = self._row[LEVELS + 3 * depth + i]
+            bids[:, 2] = self._row[UPDATE_ID]
+            asks[:, 2] = self._row[UPDATE_ID]
+            atomic_thread_fence(memory_order_seq_cst)
+            if self._row[SEQUENCE] == sequence:
+                break
+        else:
+            # The row kept being written, the levels copied before are kept until the next query
+            return
+
+        while bid_count < depth and not isnan(bids[bid_count, 0]):
+            bid_count += 1
+        while ask_count < depth and not isnan(asks[ask_count, 0]):
+            ask_count += 1
+        self.c_apply_numpy_snapshot(bids[:bid_count], asks[:ask_count])
+        self._synced_sequence = sequence
+
+    def sync(self):
+        self.c_sync()
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        self.c_sync()
+        return OrderBook.bid_entries(self)
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        self.c_sync()
+        return OrderBook.ask_entries(self)
+
+    cdef int c_top_levels(self, bint is_buy, double[:, ::1] levels):
+        self.c_sync()
+        return OrderBook.c_top_levels(self, is_buy, levels)
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            double price = self._row[LEVELS + 2 * self._depth] if is_buy else self._row[LEVELS]
+        if isnan(price):
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return price
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        self.c_sync()
+        return OrderBook.c_get_price_for_volume(self, is_buy, volume)
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        self.c_sync()
+        return OrderBook.c_get_price_for_quote_volume(self, is_buy, quote_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        self.c_sync()
+        return OrderBook.c_get_volume_for_price(self, is_buy, price)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        self.c_sync()
+        return OrderBook.c_get_quote_volume_for_price(self, is_buy, price)
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        self.c_sync()
+        return OrderBook.c_get_vwap_for_volume(self, is_buy, volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        self.c_sync()
+        return OrderBook.c_get_quote_volume_for_base_amount(self, is_buy, base_amount)
@@ -0,0 +1,280 @@
+import asyncio
+import logging
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerDataSourceType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook, shared_row_size
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+# Layout of a segment header: the time the segment was created, the last time its publisher was alive, the number of
+# trading pairs and the number of levels published for each of them.
+GENERATION = 0
+HEARTBEAT = 1
+CAPACITY = 2
+DEPTH = 3
+HEADER_SIZE = 4
+# Bytes reserved for each trading pair in the directory following the header
+NAME_SIZE = 32
+
+
+def order_book_segment_name(connector_name: str) -> str:
+    return f"hb_books_{connector_name}"
+
+
+def _open_shared_memory(name: str, create: bool = False, size: int = 0) -> SharedMemory:
+    # Segments are shared by unrelated processes and their lifetime is managed by their publisher, so they are not left
+    # to the resource tracker, which would unlink them when the first process using them exits
+    shared_memory = SharedMemory(name=name, create=create, size=size)
+    resource_tracker.unregister(shared_memory._name, "shared_memory")
+    return shared_memory
+
+
+def _unlink_shared_memory(shared_memory: SharedMemory):
+    resource_tracker.register(shared_memory._name, "shared_memory")
+    shared_memory.unlink()
+
+
+class OrderBookSegment:
+    """
+    Shared memory segment where the order books of one connector are published for all the processes of the host.
+
+    The segment starts with a header, followed by the directory of the published trading pairs, then the shared rows
+    of their order books, in the same order, written with `publish_order_book`.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, owner: bool):
+        self._shared_memory = shared_memory
+        self._owner = owner
+        self._header = np.ndarray((HEADER_SIZE,), dtype=np.float64, buffer=shared_memory.buf)
+        capacity = int(self._header[CAPACITY])
+        depth = int(self._header[DEPTH])
+        self._directory = shared_memory.buf[HEADER_SIZE * 8:HEADER_SIZE * 8 + capacity * NAME_SIZE]
+        self._rows = np.ndarray((capacity, shared_row_size(depth)), dtype=np.float64, buffer=shared_memory.buf,
+                                offset=HEADER_SIZE * 8 + capacity * NAME_SIZE)
+
+    @classmethod
+    def create(cls, connector_name: str, trading_pairs: List[str], depth: int,
+               stale_timeout: float = 10.0) -> "OrderBookSegment":
+        """
+        Creates the segment of the connector. A segment left by a publisher that stopped more than stale_timeout
+        seconds ago is replaced, a segment still being published raises a FileExistsError.
+        """
+        names = [trading_pair.encode("utf-8") for trading_pair in trading_pairs]
+        if any(len(name) > NAME_SIZE for name in names):
+            raise ValueError(f"Trading pairs can't be longer than {NAME_SIZE} bytes.")
+        size = HEADER_SIZE * 8 + len(names) * (NAME_SIZE + shared_row_size(depth) * 8)
+        name = order_book_segment_name(connector_name)
+        try:
+            shared_memory = _open_shared_memory(name, create=True, size=size)
+        except FileExistsError:
+            previous = cls.attach(connector_name)
+            alive = previous.heartbeat > 0 and time.time() - previous.heartbeat < stale_timeout
+            previous.close()
+            if alive:
+                raise FileExistsError(f"The order books of {connector_name} are already published by another "
+                                      f"process.")
+            stale = _open_shared_memory(name)
+            stale.close()
+            _unlink_shared_memory(stale)
+            shared_memory = _open_shared_memory(name, create=True, size=size)
+        header = np.ndarray((HEADER_SIZE,), dtype=np.float64, buffer=shared_memory.buf)
+        header[CAPACITY] = len(names)
+        header[DEPTH] = depth
+        for index, trading_pair_name in enumerate(names):
+            offset = HEADER_SIZE * 8 + index * NAME_SIZE
+            shared_memory.buf[offset:offset + NAME_SIZE] = trading_pair_name.ljust(NAME_SIZE, b"\0")
+        segment = cls(shared_memory, owner=True)
+        segment.rows[:] = np.nan
+        segment.rows[:, 0] = 0
+        header[HEARTBEAT] = 0
+        header[GENERATION] = time.time()
+        del header
+        return segment
+
+    @classmethod
+    def attach(cls, connector_name: str) -> "OrderBookSegment":
+        """
+        Attaches to the segment of the connector, raises a FileNotFoundError when it is not published.
+        """
+        return cls(_open_shared_memory(order_book_segment_name(connector_name)), owner=False)
+
+    @property
+    def generation(self) -> float:
+        return self._header[GENERATION]
+
+    @property
+    def heartbeat(self) -> float:
+        return self._header[HEARTBEAT]
+
+    @property
+    def depth(self) -> int:
+        return int(self._header[DEPTH])
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows
+
+    @property
+    def slots(self) -> Dict[str, int]:
+        directory = bytes(self._directory)
+        return {directory[slot * NAME_SIZE:(slot + 1) * NAME_SIZE].rstrip(b"\0").decode("utf-8"): slot
+                for slot in range(len(self._rows))}
+
+    def beat(self, timestamp: float):
+        self._header[HEARTBEAT] = timestamp
+
+    def close(self):
+        generation = self.generation
+        self._header = None
+        self._rows = None
+        self._directory.release()
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            # Order books still referenced by the strategies keep the segment mapped until they are collected
+            pass
+        if self._owner:
+            try:
+                current = _open_shared_memory(self._shared_memory.name)
+            except FileNotFoundError:
+                return
+            current_generation = np.frombuffer(current.buf, dtype=np.float64, count=1, offset=GENERATION * 8)[0]
+            current.close()
+            # A segment left stale for too long may have been replaced by another publisher already
+            if current_generation == generation:
+                _unlink_shared_memory(current)
+
+
+class SharedMemoryOrderBookTracker(OrderBookTracker):
+    """
+    Read-only order book tracker attached to the order books published by the market data daemon of the host, so the
+    bots of the host don't open their own streams. Only the published depth is available, and the public trades are not
+    forwarded, their last price is.
+
+    The tracker attaches to the segment of the connector as soon as the daemon publishes it, and attaches again when
+    the daemon is restarted.
+    """
+    _smobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._smobt_logger is None:
+            cls._smobt_logger = logging.getLogger(__name__)
+        return cls._smobt_logger
+
+    def __init__(self,
+                 connector_name: str,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 poll_interval: float = 0.5,
+                 stale_timeout: float = 10.0):
+        """
+        :param connector_name: name of the connector whose published order books are read
+        :param poll_interval: seconds between the checks of the published segment
+        :param stale_timeout: seconds without a heartbeat of the daemon before its order books are reported as stale
+        """
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._connector_name = connector_name
+        self._poll_interval = poll_interval
+        self._stale_timeout = stale_timeout
+        self._segment: Optional[OrderBookSegment] = None
+        self._stale = False
+        self._attach_task: Optional[asyncio.Task] = None
+
+    @property
+    def data_source_type(self) -> OrderBookTrackerDataSourceType:
+        return OrderBookTrackerDataSourceType.SHARED_MEMORY
+
+    def start(self):
+        self.stop()
+        self._metrics.tracker_start_time = time.perf_counter()
+        self._attach_task = safe_ensure_future(self._attach_loop())
+
+    def stop(self):
+        if self._attach_task is not None:
+            self._attach_task.cancel()
+            self._attach_task = None
+        self._order_books.clear()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+        self._order_books_initialized.clear()
+
+    async def add_trading_pair(self, trading_pair: str) -> bool:
+        if trading_pair in self._order_books:
+            self.logger().warning(f"Trading pair {trading_pair} is already being tracked")
+            return False
+        if self._segment is not None and trading_pair not in self._segment.slots:
+            self.logger().error(f"Can't add {trading_pair}, its order book is not published by the market data "
+                                f"daemon.")
+            return False
+        if trading_pair not in self._trading_pairs:
+            self._trading_pairs.append(trading_pair)
+        if self._segment is not None:
+            self._order_books[trading_pair] = self._attached_order_book(trading_pair)
+        return True
+
+    async def remove_trading_pair(self, trading_pair: str) -> bool:
+        if trading_pair not in self._trading_pairs:
+            self.logger().warning(f"Trading pair {trading_pair} is not being tracked")
+            return False
+        self._trading_pairs.remove(trading_pair)
+        self._order_books.pop(trading_pair, None)
+        self._metrics.remove_pair_metrics(trading_pair)
+        return True
+
+    def _attached_order_book(self, trading_pair: str) -> SharedMemoryOrderBook:
+        return SharedMemoryOrderBook(self._segment.rows[self._segment.slots[trading_pair]], self._segment.depth)
+
+    def _attach(self):
+        try:
+            segment = OrderBookSegment.attach(self._connector_name)
+        except FileNotFoundError:
+            return
+        if segment.heartbeat == 0 or (self._segment is not None and segment.generation == self._segment.generation):
+            segment.close()
+            return
+        if self._segment is not None:
+            self._order_books.clear()
+            self._order_books_initialized.clear()
+            self._segment.close()
+        self._segment = segment
+        slots = segment.slots
+        for trading_pair in self._trading_pairs:
+            if trading_pair in slots:
+                self._order_books[trading_pair] = self._attached_order_book(trading_pair)
+            else:
+                self.logger().error(f"The order book of {trading_pair} is not published by the market data daemon.")
+        self._stale = False
+        self.logger().info(f"Attached to the {len(self._order_books)} order books of {self._connector_name} "
+                           f"published by the market data daemon.")
+
+    async def _attach_loop(self):
+        while True:
+            if self._segment is None or time.time() - self._segment.heartbeat > self._stale_timeout:
+                self._attach()
+            if self._segment is not None:
+                stale = time.time() - self._segment.heartbeat > self._stale_timeout
+                if stale and not self._stale:
+                    self.logger().warning(f"The market data daemon stopped publishing the order books of "
+                                          f"{self._connector_name}.")
+                elif self._stale and not stale:
+                    self.logger().info(f"The market data daemon resumed publishing the order books of "
+                                       f"{self._connector_name}.")
+                self._stale = stale
+                if stale:
+                    # The order books are frozen, the tracker is not ready until the daemon publishes them again
+                    self._order_books_initialized.clear()
+                elif (not self._order_books_initialized.is_set()
+                        and all(trading_pair in self._order_books for trading_pair in self._trading_pairs)
+                        and all(order_book.sequence > 0 for order_book in self._order_books.values())):
+                    self._order_books_initialized.set()
+            await self._sleep(self._poll_interval)
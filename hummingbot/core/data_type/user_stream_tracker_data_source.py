@@ -74,9 +74,9 @@ class UserStreamTrackerDataSource(metaclass=ABCMeta):
         raise NotImplementedError
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant, queue: asyncio.Queue):
-        async for ws_response in websocket_assistant.iter_messages():
-            data = ws_response.data
-            await self._process_event_message(event_message=data, queue=queue)
+        async for ws_responses in websocket_assistant.iter_message_batches():
+            for ws_response in ws_responses:
+                await self._process_event_message(event_message=ws_response.data, queue=queue)
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
         if len(event_message) > 0:
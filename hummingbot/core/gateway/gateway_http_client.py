@@ -25,6 +25,7 @@ from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.gateway_config_utils import build_config_namespace_keys
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.logger import HummingbotLogger
 
 POLL_INTERVAL = 2.0
@@ -449,7 +450,7 @@ class GatewayHttpClient:
                 self.logger().network(f"The network call to {url} has timed out.")
             else:
                 try:
-                    parsed_response = await response.json()
+                    parsed_response = await response.json(loads=json_loads)
                 except ContentTypeError:
                     parsed_response = await response.text()
                 if response.status != 200 and \
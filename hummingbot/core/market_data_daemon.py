@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.sharded_order_book_tracker import OrderBookPublisher
+from hummingbot.core.data_type.shared_memory_order_book_tracker import OrderBookSegment
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataDaemon:
+    """
+    Maintains the order books of several connectors with their own order book trackers, and publishes them into one
+    shared memory segment per connector, for the bots of the host using `SharedMemoryOrderBookTracker`. The bots then
+    share the exchange streams opened by the daemon instead of opening their own.
+    """
+    _mdd_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdd_logger is None:
+            cls._mdd_logger = logging.getLogger(__name__)
+        return cls._mdd_logger
+
+    def __init__(self, markets: Dict[str, List[str]], depth: int = 20, publish_interval: float = 0.005):
+        """
+        :param markets: the trading pairs to publish, by connector name
+        :param depth: number of levels published on each side of the books
+        :param publish_interval: seconds between the checks for updated books
+        """
+        self._markets = markets
+        self._depth = depth
+        self._publish_interval = publish_interval
+        self._stopped: asyncio.Event = asyncio.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    async def run(self):
+        from hummingbot.client.settings import AllConnectorSettings
+
+        publications: List[Tuple[OrderBookTracker, OrderBookSegment, OrderBookPublisher, Dict[str, int]]] = []
+        try:
+            for connector_name, trading_pairs in self._markets.items():
+                connector = AllConnectorSettings.get_connector_settings()[connector_name] \
+                    .non_trading_connector_instance_with_default_configuration(trading_pairs=trading_pairs)
+                tracker: OrderBookTracker = connector.order_book_tracker
+                segment = OrderBookSegment.create(connector_name, trading_pairs, self._depth)
+                publications.append((tracker, segment, OrderBookPublisher(tracker, segment.rows, self._depth),
+                                     segment.slots))
+                tracker.start()
+                self.logger().info(f"Publishing the order books of {connector_name}: {', '.join(trading_pairs)}")
+            while not self._stopped.is_set():
+                now = time.time()
+                for _, segment, publisher, slots in publications:
+                    publisher.publish(slots)
+                    segment.beat(now)
+                await asyncio.sleep(self._publish_interval)
+        finally:
+            for tracker, segment, _, _ in publications:
+                tracker.stop()
+                segment.close()
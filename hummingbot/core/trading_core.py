@@ -365,7 +365,8 @@ class TradingCore:
             list(self.connector_manager.connectors.values()),
             self._strategy_file_name or db_name,
             self.strategy_name or db_name,
-            self.client_config_map.market_data_collection
+            self.client_config_map.market_data_collection,
+            write_behind=self.client_config_map.db_mode.db_write_behind,
         )
 
         self.markets_recorder.start()
@@ -549,6 +550,7 @@ class TradingCore:
 
                 # Restore market states if markets recorder exists
                 if self.markets_recorder:
+                    await self.markets_recorder.wait_for_pending_writes()
                     for market in self.markets.values():
                         self.markets_recorder.restore_market_states(self._strategy_file_name, market)
 
@@ -0,0 +1,53 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSONDocument = Union[str, bytes, bytearray, memoryview]
+
+
+def _orjson_loads(document: JSONDocument) -> Any:
+    try:
+        return orjson.loads(document)
+    except orjson.JSONDecodeError:
+        # orjson rejects some documents the standard library accepts, like NaN values or integers beyond 64 bits
+        return json.loads(document)
+
+
+JSON_DECODERS: Dict[str, Callable[[JSONDocument], Any]] = {"json": json.loads}
+if orjson is not None:
+    JSON_DECODERS["orjson"] = _orjson_loads
+
+_decoder_name: str = "orjson" if "orjson" in JSON_DECODERS else "json"
+_loads: Callable[[JSONDocument], Any] = JSON_DECODERS[_decoder_name]
+
+
+def json_loads(document: JSONDocument) -> Any:
+    """
+    Decodes a JSON document received from an exchange or the gateway, with the decoder selected when the module is
+    imported: orjson when it is installed, the standard library otherwise.
+
+    Raises json.JSONDecodeError when the document is not valid JSON, whatever the decoder.
+    """
+    return _loads(document)
+
+
+def json_decoder_name() -> str:
+    return _decoder_name
+
+
+def use_json_decoder(name: str):
+    """
+    Selects the decoder used by `json_loads`, for all the connections of the process.
+
+    :param name: one of the keys of JSON_DECODERS
+    """
+    global _decoder_name, _loads
+    if name not in JSON_DECODERS:
+        raise ValueError(f"The JSON decoder {name} is not available, the available decoders are "
+                         f"{', '.join(JSON_DECODERS)}.")
+    _decoder_name = name
+    _loads = JSON_DECODERS[name]
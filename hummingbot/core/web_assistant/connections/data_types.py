@@ -1,4 +1,3 @@
-import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -7,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Mapping, Optional
 import aiohttp
 import ujson
 
+from hummingbot.core.utils.json_decoder import json_loads
+
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -116,12 +117,11 @@ class RESTResponse:
             # https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientResponse.json
             byte_string = await self._aiohttp_response.read()
             if isinstance(byte_string, bytes):
-                decoded_string = byte_string.decode('utf-8')
-                json_ = json.loads(decoded_string)
+                json_ = json_loads(byte_string)
             else:
-                json_ = await self._aiohttp_response.json()
+                json_ = await self._aiohttp_response.json(loads=json_loads)
         else:
-            json_ = await self._aiohttp_response.json()
+            json_ = await self._aiohttp_response.json(loads=json_loads)
         return json_
 
     async def text(self) -> str:
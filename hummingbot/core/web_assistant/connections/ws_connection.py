@@ -1,16 +1,18 @@
 import asyncio
 import time
 from json import JSONDecodeError
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
+from hummingbot.core.utils.json_decoder import json_loads
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
+    MAX_BATCH_SIZE = 1000
 
     def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
         self._client_session = aiohttp_client_session
@@ -18,6 +20,7 @@ class WSConnection:
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        self._batch_error: Optional[Exception] = None
 
     @property
     def last_recv_time(self) -> float:
@@ -44,6 +47,7 @@ class WSConnection:
             max_msg_size=max_msg_size,
         )
         self._message_timeout = message_timeout
+        self._batch_error = None
         self._connected = True
 
     async def disconnect(self):
@@ -70,6 +74,47 @@ class WSConnection:
                 break
         return response
 
+    async def receive_batch(self, max_batch_size: int = MAX_BATCH_SIZE) -> List[WSResponse]:
+        """
+        Waits for a message, then reads without waiting the messages already received by aiohttp after it, up to
+        max_batch_size messages. Returns an empty list if disconnected, or if `disconnect()` is called while waiting.
+
+        When reading one of the additional messages fails, the batch read so far is returned and the error is raised by
+        the next call.
+        """
+        if self._batch_error is not None:
+            error, self._batch_error = self._batch_error, None
+            raise error
+        if not self._connected:
+            return []
+        response = await self.receive()
+        if response is None:
+            return []
+        responses = [response]
+        while self._connected and len(responses) < max_batch_size and self._buffered_message_count() > 0:
+            try:
+                # The message is already buffered, it is read without any timeout
+                msg = await self._connection.receive()
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    self._update_last_recv_time(msg)
+                else:
+                    msg = await self._process_message(msg)
+            except Exception as exception:
+                self._batch_error = exception
+                break
+            if msg is not None:
+                responses.append(self._build_resp(msg))
+        return responses
+
+    def _buffered_message_count(self) -> int:
+        # aiohttp keeps the frames received from the socket in the buffer of the connection reader until they are
+        # read. The reader itself has no length (WebSocketDataQueue), and receive() can't be polled since a zero
+        # timeout means the default receive timeout and a timed out receive marks the connection as closed abnormally
+        try:
+            return len(self._connection._reader._buffer)
+        except (AttributeError, TypeError):
+            return 0
+
     def _ensure_not_connected(self):
         if self._connected:
             raise RuntimeError("WS is connected.")
@@ -147,7 +192,7 @@ class WSConnection:
             data = msg.data
         else:
             try:
-                data = msg.json()
+                data = msg.json(loads=json_loads)
             except JSONDecodeError:
                 data = msg.data
         response = WSResponse(data)
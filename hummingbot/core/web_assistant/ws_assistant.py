@@ -73,6 +73,21 @@ class WSAssistant:
                 response = await self._post_process_response(response)
                 yield response
 
+    async def iter_message_batches(
+        self, max_batch_size: int = WSConnection.MAX_BATCH_SIZE
+    ) -> AsyncGenerator[List[WSResponse], None]:
+        """
+        Yields the received messages in batches, each one holding all the messages already received when it is read.
+        Stops if `WSDelegate.disconnect()` is called while waiting for a response.
+        """
+        while True:
+            responses = await self._connection.receive_batch(max_batch_size=max_batch_size)
+            if len(responses) == 0:
+                break
+            if len(self._ws_post_processors) > 0:
+                responses = [await self._post_process_response(response) for response in responses]
+            yield responses
+
     async def receive(self) -> Optional[WSResponse]:
         """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response."""
         response = await self._connection.receive()
@@ -1,7 +1,6 @@
 import asyncio
 import os
 import time
-from collections import deque
 from typing import List, Optional
 
 import numpy as np
@@ -15,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a columnar CandlesBuffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,7 +52,11 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(columns=self.columns, maxlen=max_records)
+        self._candles_df: Optional[pd.DataFrame] = None
+        self._candles_df_version: int = -1
+        # When set, historical candles are read from the store and only the missing ranges are fetched
+        self.candles_store: Optional[CandlesStore] = None
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +96,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +146,14 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is only rebuilt when the candles changed since the last call, and a shallow copy of it is
+        returned so callers can add columns without altering the cached one.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df is None or self._candles_df_version != self._candles.version:
+            self._candles_df = pd.DataFrame(self._candles.values, columns=self.columns, dtype=float, copy=True)
+            self._candles_df_version = self._candles.version
+        return self._candles_df.copy(deep=False)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -162,27 +172,13 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                    candles_df = pd.concat([fetched_candles_df, candles_df])
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+            if self.candles_store is None:
+                candles_df = await self._fetch_historical_candles(start_time=config.start_time,
+                                                                  end_time=config.end_time)
+            else:
+                candles_df = await self._get_stored_historical_candles(config)
             candles_df = candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
         except ValueError as e:
@@ -192,6 +188,80 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _fetch_historical_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        """
+        Fetches the candles between start_time and end_time from the exchange, paging through the REST API.
+        """
+        candles_df = pd.DataFrame()
+        current_end_time = self._round_timestamp_to_interval_multiple(end_time)
+        current_start_time = self._round_timestamp_to_interval_multiple(start_time)
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            candles = await self.fetch_candles(start_time=current_start_time,
+                                               end_time=current_end_time,
+                                               limit=missing_records)
+            if len(candles) <= 1 or missing_records == 0:
+                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
+                candles_df = pd.concat([fetched_candles_df, candles_df])
+                break
+            candles = candles[candles[:, 0] <= current_end_time]
+            current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
+            fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
+            candles_df = pd.concat([fetched_candles_df, candles_df])
+            candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+            candles_df.reset_index(drop=True, inplace=True)
+            self.check_candles_sorted_and_equidistant(candles_df.values)
+        return candles_df
+
+    async def _get_stored_historical_candles(self, config: HistoricalCandlesConfig) -> pd.DataFrame:
+        """
+        Reads the candles between the config start and end times from the candles store, fetching from the exchange
+        only the ranges that were not stored yet. Only closed candles are added to the store, since the current one
+        can still change.
+        """
+        interval = self.interval_in_seconds
+        start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+        end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+        last_closed_candle_time = self._round_timestamp_to_interval_multiple(self._time()) - interval
+        store_key = (config.connector_name, config.trading_pair, interval)
+
+        covered_range = self.candles_store.covered_range(*store_key)
+        if covered_range is None:
+            missing_ranges = [(start_time, end_time)]
+        else:
+            # Missing ranges are fetched up to the covered range, so the stored range stays contiguous
+            covered_start, covered_end = covered_range
+            missing_ranges = []
+            if start_time < covered_start:
+                missing_ranges.append((start_time, covered_start - interval))
+            if end_time > covered_end:
+                missing_ranges.append((covered_end + interval, end_time))
+
+        candles_dfs = []
+        for missing_start, missing_end in missing_ranges:
+            fetched_candles_df = await self._fetch_historical_candles(start_time=missing_start, end_time=missing_end)
+            candles_dfs.append(fetched_candles_df)
+            closed_end = min(missing_end, last_closed_candle_time)
+            if closed_end >= missing_start:
+                closed_candles = (fetched_candles_df[fetched_candles_df["timestamp"] <= closed_end]
+                                  if len(fetched_candles_df) > 0 else fetched_candles_df)
+                self.candles_store.write(*store_key,
+                                         candles=closed_candles.values,
+                                         start_time=missing_start,
+                                         end_time=closed_end)
+
+        stored_candles = self.candles_store.read(*store_key, start_time=start_time, end_time=end_time)
+        if len(stored_candles) > 0:
+            candles_dfs.append(pd.DataFrame(stored_candles, columns=self.columns))
+        candles_dfs = [candles_df for candles_df in candles_dfs if len(candles_df) > 0]
+        if len(candles_dfs) == 0:
+            return pd.DataFrame(columns=self.columns, dtype=float)
+        candles_df = pd.concat(candles_dfs)
+        candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+        candles_df.sort_values(by="timestamp", inplace=True)
+        candles_df.reset_index(drop=True, inplace=True)
+        return candles_df
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -321,7 +391,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -341,7 +411,7 @@ class CandlesBase(NetworkBase):
                     "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
                 )
                 await self._sleep(1.0)
-        self.check_candles_sorted_and_equidistant(np.array(self._candles))
+        self.check_candles_sorted_and_equidistant(self._candles.values)
 
     async def listen_for_subscriptions(self):
         """
@@ -408,16 +478,17 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
+                # The row is written in place into the columns of the candles buffer
+                candles_row = [parsed_message["timestamp"],
+                               parsed_message["open"],
+                               parsed_message["high"],
+                               parsed_message["low"],
+                               parsed_message["close"],
+                               parsed_message["volume"],
+                               parsed_message["quote_asset_volume"],
+                               parsed_message["n_trades"],
+                               parsed_message["taker_buy_base_volume"],
+                               parsed_message["taker_buy_quote_volume"]]
                 if len(self._candles) == 0:
                     self._candles.append(candles_row)
                     self._ws_candle_available.set()
@@ -0,0 +1,145 @@
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Fixed size columnar storage for candles, with the same interface as the deque used before (append, appendleft,
+    extend, extendleft, clear, indexing and maxlen).
+    Each column is a contiguous float array, preallocated with room for twice the maximum records, so the stored
+    candles are always a contiguous window of it. Appending moves the window, and the candles are only copied back to
+    the other end of the arrays when the window reaches one of them, making updates O(1) amortized and allowing
+    zero-copy views of the candles.
+    """
+
+    def __init__(self, columns: List[str], maxlen: int):
+        self._columns: List[str] = columns
+        self._maxlen: int = maxlen
+        self._data: np.ndarray = np.zeros((len(columns), 2 * max(maxlen, 1)), dtype=float)
+        self._start: int = 0
+        self._end: int = 0
+        self._version: int = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        Counter increased on every change of the candles, used to know when data built from them is stale.
+        """
+        return self._version
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Returns a (records, columns) view of the candles, oldest first. The view is only valid until the next change.
+        """
+        return self._data[:, self._start:self._end].T
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns a view of the values of a single column, oldest first. The view is only valid until the next change.
+        """
+        return self._data[self._columns.index(name), self._start:self._end]
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return iter(self.values.tolist())
+
+    def __reversed__(self) -> Iterator[List[float]]:
+        return reversed(self.values.tolist())
+
+    def __getitem__(self, index: int) -> List[float]:
+        return self._data[:, self._position(index)].tolist()
+
+    def __setitem__(self, index: int, candle: Iterable[float]):
+        self._data[:, self._position(index)] = self._to_candle(candle)
+        self._version += 1
+
+    def append(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if len(self) == self._maxlen:
+            self._start += 1
+        if self._end == self._data.shape[1]:
+            self._move_window(0)
+        self._data[:, self._end] = self._to_candle(candle)
+        self._end += 1
+        self._version += 1
+
+    def appendleft(self, candle: Iterable[float]):
+        if self._maxlen == 0:
+            return
+        if len(self) == self._maxlen:
+            self._end -= 1
+        if self._start == 0:
+            self._move_window(self._data.shape[1] - len(self))
+        self._start -= 1
+        self._data[:, self._start] = self._to_candle(candle)
+        self._version += 1
+
+    def extend(self, candles: Iterable[Iterable[float]]):
+        rows = self._to_rows(candles)
+        if len(rows) == 0 or self._maxlen == 0:
+            return
+        if len(rows) >= self._maxlen:
+            self._start = 0
+            self._end = self._maxlen
+            self._data[:, :self._maxlen] = rows[-self._maxlen:].T
+        else:
+            self._start += max(0, len(self) + len(rows) - self._maxlen)
+            if self._end + len(rows) > self._data.shape[1]:
+                self._move_window(0)
+            self._data[:, self._end:self._end + len(rows)] = rows.T
+            self._end += len(rows)
+        self._version += 1
+
+    def extendleft(self, candles: Iterable[Iterable[float]]):
+        # Same as deque.extendleft, the candles end up before the stored ones in reverse order
+        rows = self._to_rows(candles)[::-1]
+        if len(rows) == 0 or self._maxlen == 0:
+            return
+        if len(rows) >= self._maxlen:
+            self._start = 0
+            self._end = self._maxlen
+            self._data[:, :self._maxlen] = rows[:self._maxlen].T
+        else:
+            self._end -= max(0, len(self) + len(rows) - self._maxlen)
+            if self._start < len(rows):
+                self._move_window(self._data.shape[1] - len(self))
+            self._data[:, self._start - len(rows):self._start] = rows.T
+            self._start -= len(rows)
+        self._version += 1
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self._version += 1
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("candles index out of range")
+        return self._start + index
+
+    def _move_window(self, new_start: int):
+        length = len(self)
+        self._data[:, new_start:new_start + length] = self._data[:, self._start:self._end]
+        self._start = new_start
+        self._end = new_start + length
+
+    def _to_candle(self, candle: Iterable[float]) -> np.ndarray:
+        return np.asarray(candle, dtype=float)
+
+    def _to_rows(self, candles: Iterable[Iterable[float]]) -> np.ndarray:
+        rows = np.asarray(candles if isinstance(candles, np.ndarray) else list(candles), dtype=float)
+        if rows.ndim == 1:
+            rows = np.broadcast_to(rows[:, None], (len(rows), len(self._columns)))
+        return rows
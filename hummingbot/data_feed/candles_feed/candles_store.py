@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+from typing import Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+
+
+class CandlesStore:
+    """
+    Local store of closed candles, used to avoid downloading the same historical candles on every backtest.
+    Candles are kept in a NumPy file per connector, trading pair and interval, sorted by timestamp and read through a
+    memory map, so reading a time range only loads the requested records. A metadata file next to it holds the time
+    range already fetched from the exchange, that only grows as new candles are added.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        :param path: directory holding the candles files, by default the candles folder in the data path
+        """
+        self._path: str = path if path is not None else os.path.join(data_path(), "candles")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def covered_range(self, connector_name: str, trading_pair: str, interval_in_seconds: int) -> Optional[Tuple[int, int]]:
+        """
+        Returns the (start, end) timestamps of the candles already fetched, or None if nothing was stored.
+        """
+        metadata_path = self._file_path(connector_name, trading_pair, interval_in_seconds, "json")
+        if not os.path.exists(metadata_path):
+            return None
+        with open(metadata_path, "r") as metadata_file:
+            metadata = json.load(metadata_file)
+        return metadata["start_time"], metadata["end_time"]
+
+    def read(self,
+             connector_name: str,
+             trading_pair: str,
+             interval_in_seconds: int,
+             start_time: int,
+             end_time: int) -> np.ndarray:
+        """
+        Returns the stored candles with timestamps between start_time and end_time (both included).
+        """
+        candles_path = self._file_path(connector_name, trading_pair, interval_in_seconds, "npy")
+        if not os.path.exists(candles_path):
+            return np.empty((0, 0))
+        candles = np.load(candles_path, mmap_mode="r")
+        if len(candles) == 0:
+            return np.array(candles)
+        timestamps = candles[:, 0]
+        first = np.searchsorted(timestamps, start_time, side="left")
+        last = np.searchsorted(timestamps, end_time, side="right")
+        return np.array(candles[first:last])
+
+    def write(self,
+              connector_name: str,
+              trading_pair: str,
+              interval_in_seconds: int,
+              candles: np.ndarray,
+              start_time: int,
+              end_time: int):
+        """
+        Adds candles fetched for the [start_time, end_time] range to the store.
+        Candles already stored are kept over the new ones with the same timestamp. The range has to overlap or be
+        next to the range already covered, so the covered range stays contiguous.
+        """
+        covered_range = self.covered_range(connector_name, trading_pair, interval_in_seconds)
+        if covered_range is not None:
+            covered_start, covered_end = covered_range
+            if start_time > covered_end + interval_in_seconds or end_time < covered_start - interval_in_seconds:
+                raise ValueError(f"The range {start_time}-{end_time} is not contiguous to the stored candles range "
+                                 f"{covered_start}-{covered_end}.")
+            start_time = min(start_time, covered_start)
+            end_time = max(end_time, covered_end)
+
+        candles_path = self._file_path(connector_name, trading_pair, interval_in_seconds, "npy")
+        candles = np.asarray(candles, dtype=float)
+        if os.path.exists(candles_path):
+            stored_candles = np.load(candles_path)
+            if len(candles) == 0:
+                candles = stored_candles
+            elif len(stored_candles) > 0:
+                candles = np.concatenate([stored_candles, candles])
+        if len(candles) > 0:
+            # np.unique keeps the first occurrence of each timestamp, so stored candles are kept
+            _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+            candles = candles[unique_indexes]
+
+        os.makedirs(self._path, exist_ok=True)
+        self._replace_file(candles_path, lambda file: np.save(file, candles))
+        metadata_path = self._file_path(connector_name, trading_pair, interval_in_seconds, "json")
+        self._replace_file(metadata_path,
+                           lambda file: file.write(json.dumps({"start_time": start_time, "end_time": end_time}).encode()))
+
+    def _file_path(self, connector_name: str, trading_pair: str, interval_in_seconds: int, extension: str) -> str:
+        return os.path.join(self._path, f"{connector_name}_{trading_pair}_{interval_in_seconds}.{extension}")
+
+    @staticmethod
+    def _replace_file(path: str, write_function):
+        # Written to a temporary file first, so readers never see a partially written file. Each write has its own
+        # temporary file, since other processes can be writing the same candles.
+        fd, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.",
+                                              suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write_function(file)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
@@ -0,0 +1,262 @@
+import glob
+import logging
+import os
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.logger import HummingbotLogger
+
+StreamKey = Tuple[str, str, str]
+
+
+class MarketDataCapture:
+    """
+    Captures the top levels of order books, their diffs and the public trades of many trading pairs into compressed
+    columnar files, that the backtesting data provider can load directly.
+
+    Each stream (connector, trading pair and kind of data) is filled row by row into preallocated NumPy columns. When
+    the columns are full, or the first row is older than the maximum file duration, they are handed over to a
+    background thread that writes them to a new compressed .npz file, so files rotate as data is captured and the event
+    loop never writes to disk. At most max_pending_files are waiting to be written, columns handed over while the
+    writer is behind are dropped, keeping the memory used bounded.
+
+    Order book files hold the `timestamp` column and the `bid_price`, `bid_amount`, `ask_price` and `ask_amount`
+    columns with one value per level, NaN where the book has less levels than the captured depth. Diff files hold the
+    same columns, with the levels changed by each diff (a zero amount removing the level), a diff changing more levels
+    than the captured depth being split into several rows with the same timestamp. Trade files hold the `timestamp`,
+    `price`, `amount` and `trade_type` (TradeType value) columns.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    ORDER_BOOK = "order_book"
+    DIFFS = "diffs"
+    TRADES = "trades"
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 depth: int = 20,
+                 rows_per_file: int = 1000,
+                 max_file_duration: float = 3600,
+                 max_pending_files: int = 64):
+        """
+        :param path: directory holding the files, by default the market_data folder in the data path
+        :param depth: number of levels captured on each side of the order books
+        :param rows_per_file: number of rows of each file
+        :param max_file_duration: maximum number of seconds between the first and the last row of a file
+        :param max_pending_files: maximum number of files waiting to be written by the background thread
+        """
+        self._path: str = path if path is not None else os.path.join(data_path(), "market_data")
+        self._depth = depth
+        self._rows_per_file = rows_per_file
+        self._max_file_duration = max_file_duration
+        self._columns: Dict[StreamKey, Dict[str, np.ndarray]] = {}
+        self._rows: Dict[StreamKey, int] = {}
+        self._pending_files: queue.Queue = queue.Queue(maxsize=max_pending_files)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._dropped_rows = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def dropped_rows(self) -> int:
+        return self._dropped_rows
+
+    def start(self):
+        self._writer_thread = threading.Thread(target=self._write_loop, name="MarketDataCapture", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self):
+        """
+        Writes the rows captured so far and stops the writer thread.
+        """
+        self.flush()
+        if self._writer_thread is not None:
+            self._pending_files.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def flush(self):
+        """
+        Hands over the rows captured so far to the writer thread, even if their files are not full.
+        """
+        for key in list(self._columns.keys()):
+            self._hand_over(key)
+
+    def record_order_book(self, connector_name: str, trading_pair: str, timestamp: float, order_book: OrderBook):
+        key = (connector_name, trading_pair, self.ORDER_BOOK)
+        columns, row = self._next_row(key, timestamp)
+        bids, asks = order_book.top_levels(self._depth)
+        columns["bid_price"][row] = bids[:, 0]
+        columns["bid_amount"][row] = bids[:, 1]
+        columns["ask_price"][row] = asks[:, 0]
+        columns["ask_amount"][row] = asks[:, 1]
+        self._row_added(key)
+
+    def record_diff(self, connector_name: str, trading_pair: str, timestamp: float, bids: np.ndarray, asks: np.ndarray):
+        """
+        Records the levels changed by an order book diff, bids and asks being arrays of [price, amount, ...] rows.
+        """
+        key = (connector_name, trading_pair, self.DIFFS)
+        depth = self._depth
+        for first in range(0, max(len(bids), len(asks), 1), depth):
+            columns, row = self._next_row(key, timestamp)
+            for side, levels in (("bid", bids[first:first + depth]), ("ask", asks[first:first + depth])):
+                columns[f"{side}_price"][row] = np.nan
+                columns[f"{side}_amount"][row] = np.nan
+                columns[f"{side}_price"][row, :len(levels)] = levels[:, 0]
+                columns[f"{side}_amount"][row, :len(levels)] = levels[:, 1]
+            self._row_added(key)
+
+    def record_trade(self, connector_name: str, trade: OrderBookTradeEvent):
+        key = (connector_name, trade.trading_pair, self.TRADES)
+        columns, row = self._next_row(key, trade.timestamp)
+        columns["price"][row] = float(trade.price)
+        columns["amount"][row] = float(trade.amount)
+        columns["trade_type"][row] = trade.type.value
+        self._row_added(key)
+
+    def read_order_book_snapshots(self,
+                                  connector_name: str,
+                                  trading_pair: str,
+                                  start_time: Optional[float] = None,
+                                  end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the order book columns of the snapshots with timestamps between start_time and end_time (both
+        included), sorted by timestamp.
+        """
+        return self._read(connector_name, trading_pair, self.ORDER_BOOK, start_time, end_time)
+
+    def read_order_book_diffs(self,
+                              connector_name: str,
+                              trading_pair: str,
+                              start_time: Optional[float] = None,
+                              end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the order book columns of the diffs with timestamps between start_time and end_time (both included),
+        sorted by timestamp.
+        """
+        return self._read(connector_name, trading_pair, self.DIFFS, start_time, end_time)
+
+    def read_trades(self,
+                    connector_name: str,
+                    trading_pair: str,
+                    start_time: Optional[float] = None,
+                    end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the trade columns of the trades with timestamps between start_time and end_time (both included),
+        sorted by timestamp.
+        """
+        return self._read(connector_name, trading_pair, self.TRADES, start_time, end_time)
+
+    def _new_columns(self, kind: str) -> Dict[str, np.ndarray]:
+        rows = self._rows_per_file
+        if kind in (self.ORDER_BOOK, self.DIFFS):
+            return {"timestamp": np.empty(rows),
+                    "bid_price": np.empty((rows, self._depth)),
+                    "bid_amount": np.empty((rows, self._depth)),
+                    "ask_price": np.empty((rows, self._depth)),
+                    "ask_amount": np.empty((rows, self._depth))}
+        return {"timestamp": np.empty(rows),
+                "price": np.empty(rows),
+                "amount": np.empty(rows),
+                "trade_type": np.empty(rows, dtype=np.int8)}
+
+    def _next_row(self, key: StreamKey, timestamp: float) -> Tuple[Dict[str, np.ndarray], int]:
+        columns = self._columns.get(key)
+        if columns is not None and timestamp - columns["timestamp"][0] >= self._max_file_duration:
+            self._hand_over(key)
+            columns = None
+        if columns is None:
+            columns = self._new_columns(key[2])
+            self._columns[key] = columns
+            self._rows[key] = 0
+        row = self._rows[key]
+        columns["timestamp"][row] = timestamp
+        return columns, row
+
+    def _row_added(self, key: StreamKey):
+        self._rows[key] += 1
+        if self._rows[key] == self._rows_per_file:
+            self._hand_over(key)
+
+    def _hand_over(self, key: StreamKey):
+        columns = self._columns.pop(key)
+        rows = self._rows.pop(key)
+        if rows == 0:
+            return
+        connector_name, trading_pair, kind = key
+        file_prefix = os.path.join(self._path, connector_name,
+                                   f"{trading_pair}_{kind}_{int(columns['timestamp'][0] * 1e3)}")
+        try:
+            self._pending_files.put_nowait((file_prefix, {name: column[:rows] for name, column in columns.items()}))
+        except queue.Full:
+            self._dropped_rows += rows
+            self.logger().warning(f"Market data writer is behind, {rows} rows of {trading_pair} {kind} from "
+                                  f"{connector_name} were dropped.")
+
+    def _write_loop(self):
+        while True:
+            pending_file = self._pending_files.get()
+            if pending_file is None:
+                return
+            file_prefix, columns = pending_file
+            file_path = file_prefix
+            try:
+                os.makedirs(os.path.dirname(file_prefix), exist_ok=True)
+                # Files starting in the same millisecond are numbered in the order they are written
+                sequence = 0
+                file_path = f"{file_prefix}_{sequence}.npz"
+                while os.path.exists(file_path):
+                    sequence += 1
+                    file_path = f"{file_prefix}_{sequence}.npz"
+                # Written to a temporary file first, so readers never see a partially written file
+                temporary_path = f"{file_path}.tmp"
+                with open(temporary_path, "wb") as file:
+                    np.savez_compressed(file, **columns)
+                os.replace(temporary_path, file_path)
+            except Exception:
+                self.logger().error(f"Error writing the market data file {file_path}.", exc_info=True)
+
+    def _read(self,
+              connector_name: str,
+              trading_pair: str,
+              kind: str,
+              start_time: Optional[float],
+              end_time: Optional[float]) -> Dict[str, np.ndarray]:
+        prefix = os.path.join(self._path, connector_name, f"{trading_pair}_{kind}_")
+        # Files are named with the millisecond timestamp of their first row and their sequence in that millisecond
+        files: List[Tuple[int, int, str]] = sorted(
+            (*(int(part) for part in file_path[len(prefix):-len(".npz")].split("_")), file_path)
+            for file_path in glob.glob(f"{glob.escape(prefix)}*_*.npz"))
+        selected_files = [
+            file_path for i, (first_timestamp, _, file_path) in enumerate(files)
+            # A file can hold rows from start_time if the next one starts in its millisecond or after it
+            if (end_time is None or first_timestamp <= end_time * 1e3)
+            and (start_time is None or i == len(files) - 1 or files[i + 1][0] >= int(start_time * 1e3))
+        ]
+        # Empty columns, so the result has all the columns even without files
+        parts: Dict[str, List[np.ndarray]] = {name: [column[:0]] for name, column in self._new_columns(kind).items()}
+        for file_path in selected_files:
+            with np.load(file_path) as file_columns:
+                for name in parts:
+                    parts[name].append(file_columns[name])
+        columns = {name: np.concatenate(column_parts) for name, column_parts in parts.items()}
+        order = np.argsort(columns["timestamp"], kind="stable")
+        timestamps = columns["timestamp"][order]
+        first = 0 if start_time is None else np.searchsorted(timestamps, start_time, side="left")
+        last = len(timestamps) if end_time is None else np.searchsorted(timestamps, end_time, side="right")
+        return {name: column[order][first:last] for name, column in columns.items()}
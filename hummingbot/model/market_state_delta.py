@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketStateDelta(HummingbotBase):
+    """
+    Changes to the tracking states of a market since its last MarketState checkpoint: the states of the orders updated
+    and the ids of the orders no longer tracked.
+    """
+    __tablename__ = "MarketStateDelta"
+    __table_args__ = (Index("msd_config_market_index",
+                            "config_file_path", "market"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    updated_states = Column(JSON, nullable=False)
+    removed_orders = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MarketStateDelta(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', timestamp={self.timestamp}, updated_states={self.updated_states}, " \
+            f"removed_orders={self.removed_orders})"
@@ -103,6 +103,15 @@ class SQLConnectionManager(TransactionBase):
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    def enable_write_ahead_log(self):
+        """
+        Switches SQLite databases to write-ahead log mode, where reads don't wait for writes done from other threads.
+        The mode is stored in the database file, so it only needs to be set once.
+        """
+        if self._engine.dialect.name == "sqlite":
+            with self._engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
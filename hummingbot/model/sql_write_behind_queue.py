@@ -0,0 +1,293 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from decimal import Decimal
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import DisconnectionError, OperationalError, TimeoutError as SQLTimeoutError
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.transaction_base import TransactionBase
+
+WriteOperation = Tuple[int, str, Dict[str, Any]]
+
+
+class _PayloadEncoder(json.JSONEncoder):
+    def default(self, o: Any):
+        if isinstance(o, Decimal):
+            return {"__decimal__": str(o)}
+        return super().default(o)
+
+
+def _decode_payload_object(value: Dict[str, Any]) -> Any:
+    if len(value) == 1 and "__decimal__" in value:
+        return Decimal(value["__decimal__"])
+    return value
+
+
+class SQLWriteBehindQueue:
+    """
+    Applies database writes from a dedicated thread, so the thread adding them (the event loop) never waits for the
+    database. Writes are named operations with a JSON serializable payload, applied in the order they are added, in
+    batched transactions.
+    The writer thread appends the operations to a journal file before applying them, and the sequence number of the last
+    operation applied is stored in the Metadata table in the same transaction as the operation. When the process stops
+    without flushing the queue, the operations in the journal not yet applied are replayed the next time the queue
+    starts.
+    Operations failing because the database is unavailable are retried with an exponential backoff, the others are
+    discarded.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    LAST_SEQUENCE_KEY = "write_behind_last_sequence"
+    # Errors of the database or of the connection to it, that don't depend on the operation applied
+    TRANSIENT_ERRORS = (OperationalError, DisconnectionError, SQLTimeoutError)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql: TransactionBase,
+                 writers: Dict[str, Callable[[Session, Dict[str, Any]], Any]],
+                 journal_path: str,
+                 max_batch_size: int = 500,
+                 retry_interval: float = 0.5,
+                 max_retry_interval: float = 30.0):
+        """
+        :param sql: connection manager used to open the sessions
+        :param writers: functions applying each operation name, receiving the session and the operation payload
+        :param journal_path: file where the operations are recorded until they are applied
+        :param max_batch_size: maximum number of operations applied in a single transaction
+        :param retry_interval: seconds before the first retry of operations failing with a transient database error
+        :param max_retry_interval: maximum seconds between two retries, the interval doubling after each of them
+        """
+        self._sql = sql
+        self._writers = writers
+        self._journal_path = journal_path
+        self._max_batch_size = max_batch_size
+        self._retry_interval = retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._pending: Deque[WriteOperation] = deque()
+        self._condition = threading.Condition()
+        self._sequence = 0
+        self._applied_sequence = 0
+        self._stored_sequence = 0
+        self._journal = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_running = False
+        self._stopping = False
+
+    @property
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer_running
+
+    def start(self):
+        """
+        Replays the operations left in the journal by a previous run and starts the writer thread.
+        """
+        self.replay()
+        self._journal = open(self._journal_path, "a")
+        self._stopping = False
+        self._writer_running = True
+        self._writer_thread = threading.Thread(target=self._write_loop, name="SQLWriteBehindQueue", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Applies all the pending operations and stops the writer thread. The operations the writer thread could not apply
+        are left in the journal.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout)
+            self._writer_thread = None
+        if self._journal is not None and not self._writer_running:
+            with self._condition:
+                operations = list(self._pending)
+                self._pending.clear()
+            self._append_to_journal(operations)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def put(self, operation: str, payload: Dict[str, Any]):
+        """
+        Queues the operation. The payload is serialized to the journal by the writer thread, so it must not be changed
+        after being added.
+        """
+        with self._condition:
+            self._sequence += 1
+            self._pending.append((self._sequence, operation, payload))
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all the operations added before the call are applied.
+        Returns False if they were not applied within the timeout, or if the writer thread is not running.
+        """
+        with self._condition:
+            sequence = self._sequence
+            self._condition.wait_for(lambda: self._applied_sequence >= sequence or not self._writer_running, timeout)
+            return self._applied_sequence >= sequence
+
+    async def wait_flushed(self, timeout: Optional[float] = None) -> bool:
+        """
+        Same as flush, waiting from an executor thread so the event loop keeps running meanwhile.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.flush, timeout)
+
+    def replay(self):
+        """
+        Applies the operations recorded in the journal after the last one stored as applied in the database.
+        Transient database errors are raised, leaving the journal to be replayed again.
+        """
+        stored_sequence = self._get_stored_sequence()
+        self._stored_sequence = stored_sequence
+        operations: List[WriteOperation] = []
+        if os.path.exists(self._journal_path):
+            with open(self._journal_path, "r") as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line, object_hook=_decode_payload_object)
+                    except json.JSONDecodeError:
+                        # The last line can be incomplete if the process stopped while writing it
+                        continue
+                    if entry["sequence"] > stored_sequence:
+                        operations.append((entry["sequence"], entry["operation"], entry["payload"]))
+        if len(operations) > 0:
+            self.logger().info(f"Replaying {len(operations)} database operations not applied in the last run.")
+            for start in range(0, len(operations), self._max_batch_size):
+                self._apply_batch(operations[start:start + self._max_batch_size])
+        self._sequence = max([stored_sequence] + [sequence for sequence, _, _ in operations])
+        self._applied_sequence = self._sequence
+        self._truncate_journal()
+
+    def _write_loop(self):
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: len(self._pending) > 0 or self._stopping)
+                    if len(self._pending) == 0:
+                        return
+                    operations = list(self._pending)
+                    self._pending.clear()
+                self._append_to_journal(operations)
+                for start in range(0, len(operations), self._max_batch_size):
+                    batch = operations[start:start + self._max_batch_size]
+                    if not self._apply(batch):
+                        return
+                    with self._condition:
+                        self._applied_sequence = batch[-1][0]
+                        if self._applied_sequence == self._sequence:
+                            self._truncate_journal()
+                        self._condition.notify_all()
+        finally:
+            with self._condition:
+                self._writer_running = False
+                self._condition.notify_all()
+
+    def _apply(self, batch: List[WriteOperation]) -> bool:
+        """
+        Applies the batch, retrying while the database is unavailable.
+        Returns False if the queue was stopped before the database came back, the operations not applied staying in
+        the journal to be replayed on the next start.
+        """
+        retry_interval = self._retry_interval
+        while True:
+            # The operations applied one by one before a transient error are not applied again
+            batch = [operation for operation in batch if operation[0] > self._stored_sequence]
+            try:
+                self._apply_batch(batch)
+                return True
+            except self.TRANSIENT_ERRORS:
+                if self._stopping:
+                    self.logger().error(f"The database is unavailable. {len(batch)} database operations are kept in "
+                                        f"the journal, to be applied on the next start.", exc_info=True)
+                    return False
+                self.logger().warning(f"The database is unavailable. Retrying {len(batch)} database operations in "
+                                      f"{retry_interval} seconds.", exc_info=True)
+            with self._condition:
+                self._condition.wait_for(lambda: self._stopping, retry_interval)
+            retry_interval = min(retry_interval * 2, self._max_retry_interval)
+
+    def _apply_batch(self, batch: List[WriteOperation]):
+        try:
+            self._apply_in_transaction(batch)
+        except self.TRANSIENT_ERRORS:
+            raise
+        except Exception:
+            self.logger().warning("Error applying a batch of database operations. Applying them one by one.",
+                                  exc_info=True)
+            for operation in batch:
+                try:
+                    self._apply_in_transaction([operation])
+                except self.TRANSIENT_ERRORS:
+                    raise
+                except Exception:
+                    self.logger().error(f"Error applying the database operation {operation[1]}. "
+                                        f"Discarding it: {operation[2]}", exc_info=True)
+                    self._store_sequence(operation[0])
+
+    def _apply_in_transaction(self, batch: List[WriteOperation]):
+        with self._sql.get_new_session() as session:
+            with session.begin():
+                for _, operation, payload in batch:
+                    self._writers[operation](session, payload)
+                if len(batch) > 0:
+                    self._set_stored_sequence(session, batch[-1][0])
+        if len(batch) > 0:
+            self._stored_sequence = batch[-1][0]
+
+    def _store_sequence(self, sequence: int):
+        with self._sql.get_new_session() as session:
+            with session.begin():
+                self._set_stored_sequence(session, sequence)
+        self._stored_sequence = sequence
+
+    def _get_stored_sequence(self) -> int:
+        with self._sql.get_new_session() as session:
+            metadata = session.query(Metadata).filter(Metadata.key == self.LAST_SEQUENCE_KEY).one_or_none()
+            return int(metadata.value) if metadata is not None else 0
+
+    def _set_stored_sequence(self, session: Session, sequence: int):
+        metadata = session.query(Metadata).filter(Metadata.key == self.LAST_SEQUENCE_KEY).one_or_none()
+        if metadata is None:
+            session.add(Metadata(key=self.LAST_SEQUENCE_KEY, value=str(sequence)))
+        else:
+            metadata.value = str(sequence)
+
+    def _append_to_journal(self, operations: List[WriteOperation]):
+        if self._journal is None or len(operations) == 0:
+            return
+        lines = []
+        for sequence, operation, payload in operations:
+            try:
+                lines.append(json.dumps({"sequence": sequence, "operation": operation, "payload": payload},
+                                        cls=_PayloadEncoder) + "\n")
+            except (TypeError, ValueError):
+                self.logger().error(f"The database operation {operation} can't be recorded in the journal, it won't be "
+                                    f"replayed if the process stops before applying it: {payload}", exc_info=True)
+        self._journal.write("".join(lines))
+        self._journal.flush()
+
+    def _truncate_journal(self):
+        if self._journal is not None:
+            self._journal.seek(0)
+            self._journal.truncate()
+        elif os.path.exists(self._journal_path):
+            open(self._journal_path, "w").close()
@@ -170,6 +170,7 @@ class StrategyV2Base(ScriptStrategyBase):
     closed_executors_buffer: int = 100
     max_executors_close_attempts: int = 10
     config_update_interval: int = 10
+    event_driven_executors: bool = False
 
     @classmethod
     def init_markets(cls, config: StrategyV2ConfigBase):
@@ -204,7 +205,8 @@ class StrategyV2Base(ScriptStrategyBase):
         # Collect initial positions from all controller configs
         self.executor_orchestrator = ExecutorOrchestrator(
             strategy=self,
-            initial_positions_by_controller=self._collect_initial_positions()
+            initial_positions_by_controller=self._collect_initial_positions(),
+            event_driven_scheduling=self.event_driven_executors,
         )
         self.mqtt_enabled = False
         self._pub: Optional[ETopicPublisher] = None
@@ -2,6 +2,7 @@ import logging
 from decimal import Decimal
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.config_helpers import get_connector_class
@@ -10,7 +11,9 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import LazyDict, PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
+from hummingbot.data_feed.market_data_capture import MarketDataCapture
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
 # Set up logging
@@ -25,8 +28,18 @@ class BacktestingDataProvider(MarketDataProvider):
                            "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid", "injective_v2_perpetual", "injective_v2"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 candles_store: Optional[CandlesStore] = None,
+                 market_data_capture: Optional[MarketDataCapture] = None):
+        """
+        :param connectors: connectors used to get the trading rules
+        :param candles_store: local store of the historical candles, by default the one in the data path
+        :param market_data_capture: files of captured order books and trades, by default the ones in the data path
+        """
         super().__init__(connectors)
+        self.candles_store = candles_store if candles_store is not None else CandlesStore()
+        self.market_data_capture = market_data_capture if market_data_capture is not None else MarketDataCapture()
         self.start_time = None
         self.end_time = None
         self.prices = {}
@@ -95,10 +108,13 @@ class BacktestingDataProvider(MarketDataProvider):
         if not existing_feed.empty:
             existing_feed_start_time = existing_feed["timestamp"].min()
             existing_feed_end_time = existing_feed["timestamp"].max()
-            if existing_feed_start_time <= self.start_time and existing_feed_end_time >= self.end_time:
+            # The last candle starts up to one interval before the end time, when the end time is not a multiple of it
+            interval_in_seconds = CandlesBase.interval_to_seconds[config.interval]
+            if existing_feed_start_time <= self.start_time and existing_feed_end_time > self.end_time - interval_in_seconds:
                 return existing_feed
         # Create a new feed or restart the existing one with updated max_records
         candle_feed = CandlesFactory.get_candle(config)
+        candle_feed.candles_store = self.candles_store
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
         candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
             connector_name=config.connector,
@@ -124,6 +140,37 @@ class BacktestingDataProvider(MarketDataProvider):
         candles_df = self.candles_feeds.get(f"{connector_name}_{trading_pair}_{interval}")
         return candles_df[(candles_df["timestamp"] >= self.start_time) & (candles_df["timestamp"] <= self.end_time)]
 
+    def get_order_book_snapshots(self, connector_name: str, trading_pair: str) -> Dict[str, np.ndarray]:
+        """
+        Retrieves the captured order book top levels of the trading pair in the backtesting time range.
+        :param connector_name: str
+        :param trading_pair: str
+        :return: timestamp, bid_price, bid_amount, ask_price and ask_amount columns, with one row per snapshot.
+        """
+        return self.market_data_capture.read_order_book_snapshots(connector_name, trading_pair,
+                                                                  self.start_time, self.end_time)
+
+    def get_order_book_diffs(self, connector_name: str, trading_pair: str) -> Dict[str, np.ndarray]:
+        """
+        Retrieves the captured order book diffs of the trading pair in the backtesting time range.
+        :param connector_name: str
+        :param trading_pair: str
+        :return: timestamp, bid_price, bid_amount, ask_price and ask_amount columns, with the levels changed by each
+        diff.
+        """
+        return self.market_data_capture.read_order_book_diffs(connector_name, trading_pair,
+                                                              self.start_time, self.end_time)
+
+    def get_trades_df(self, connector_name: str, trading_pair: str) -> pd.DataFrame:
+        """
+        Retrieves the captured public trades of the trading pair in the backtesting time range.
+        :param connector_name: str
+        :param trading_pair: str
+        :return: Trades dataframe with timestamp, price, amount and trade_type (TradeType value) columns.
+        """
+        return pd.DataFrame(self.market_data_capture.read_trades(connector_name, trading_pair,
+                                                                 self.start_time, self.end_time))
+
     def get_price_by_type(self, connector_name: str, trading_pair: str, price_type: PriceType):
         """
         Retrieves the price for a trading pair from the specified connector based on the price type.
@@ -83,7 +83,8 @@ class BacktestingEngineBase:
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
-                              trade_cost=0.0006):
+                              trade_cost=0.0006,
+                              vectorized: bool = False):
         controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
         # controller_class = controller_config.get_controller_class()
         # Load historical candles
@@ -94,7 +95,7 @@ class BacktestingEngineBase:
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
         await self.controller.update_processed_data()
-        executors_info = await self.simulate_execution(trade_cost=trade_cost)
+        executors_info = await self.simulate_execution(trade_cost=trade_cost, vectorized=vectorized)
         results = self.summarize_results(executors_info, controller_config.total_amount_quote)
         return {
             "executors": executors_info,
@@ -112,12 +113,14 @@ class BacktestingEngineBase:
         for config in self.controller.config.candles_config:
             await self.controller.market_data_provider.initialize_candles_feed(config)
 
-    async def simulate_execution(self, trade_cost: float) -> list:
+    async def simulate_execution(self, trade_cost: float, vectorized: bool = False) -> list:
         """
         Simulates market making strategy over historical data, considering trading costs.
 
         Args:
             trade_cost (float): The cost per trade.
+            vectorized (bool): Reads the market data rows from a NumPy array and only builds the info of an executor
+                when it starts or closes, instead of on every row. Produces the same executors info.
 
         Returns:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
@@ -125,6 +128,8 @@ class BacktestingEngineBase:
         processed_features = self.prepare_market_data()
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
+        if vectorized:
+            return await self._simulate_execution_vectorized(processed_features, trade_cost)
         for i, row in processed_features.iterrows():
             await self.update_state(row)
             for action in self.controller.determine_executor_actions():
@@ -137,6 +142,55 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    async def _simulate_execution_vectorized(self, processed_features: pd.DataFrame, trade_cost: float) -> list:
+        columns = processed_features.columns.tolist()
+        # iterrows builds each row from DataFrame.values, so reading the rows from it keeps the same value types
+        rows = processed_features.values
+        timestamp_column = columns.index("timestamp")
+        close_column = columns.index("close_bt")
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        market_data_provider = self.controller.market_data_provider
+        processed_data = self.controller.processed_data
+        for i, values in zip(processed_features.index, rows):
+            timestamp = values[timestamp_column]
+            market_data_provider.prices = {key: Decimal(values[close_column])}
+            market_data_provider._time = timestamp
+            processed_data.update(zip(columns, self._to_native_values(values)))
+            self.refresh_executors_info(timestamp)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
+                    if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, timestamp)
+
+        return self.controller.executors_info
+
+    @staticmethod
+    def _to_native_values(values: np.ndarray) -> list:
+        # Same conversion Series.to_dict applies to the row values
+        if values.dtype != object:
+            return values.tolist()
+        return [value.item() if isinstance(value, (np.number, np.bool_)) else value for value in values]
+
+    def refresh_executors_info(self, timestamp: float):
+        """
+        Same as update_executors_info, reusing the info of the executors that are still active while their simulation
+        row does not change.
+        """
+        active_executor_simulations = []
+        active_executors_info = []
+        for executor in self.active_executor_simulations:
+            executor_info = executor.refresh_executor_info(timestamp)
+            if executor_info.status == RunnableStatus.TERMINATED:
+                self.stopped_executors_info.append(executor_info)
+            else:
+                active_executor_simulations.append(executor)
+                active_executors_info.append(executor_info)
+        self.active_executor_simulations = active_executor_simulations
+        self.controller.executors_info = active_executors_info + self.stopped_executors_info
+
     async def update_state(self, row):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
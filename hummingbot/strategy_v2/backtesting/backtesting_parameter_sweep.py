@@ -0,0 +1,159 @@
+import asyncio
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Type
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+# Candles and trading rules loaded by the parent process, set once per worker by the pool initializer
+_worker_candles_feeds: Dict[str, pd.DataFrame] = {}
+_worker_trading_rules: Dict[str, Dict] = {}
+
+
+def _initialize_worker(candles_feeds: Dict[str, pd.DataFrame], trading_rules: Dict[str, Dict]):
+    global _worker_candles_feeds, _worker_trading_rules
+    _worker_candles_feeds = candles_feeds
+    _worker_trading_rules = trading_rules
+
+
+def _run_backtesting(backtesting_engine_class: Type[BacktestingEngineBase],
+                     controller_config: ControllerConfigBase,
+                     start: int,
+                     end: int,
+                     backtesting_resolution: str,
+                     trade_cost: float,
+                     vectorized: bool) -> Dict:
+    backtesting_engine = backtesting_engine_class()
+    data_provider = backtesting_engine.backtesting_data_provider
+    # The engine finds the candles and trading rules already loaded, so nothing is fetched by the workers
+    data_provider.candles_feeds = dict(_worker_candles_feeds)
+    data_provider.trading_rules = _worker_trading_rules
+    backtesting_result = asyncio.run(backtesting_engine.run_backtesting(
+        controller_config=controller_config,
+        start=start,
+        end=end,
+        backtesting_resolution=backtesting_resolution,
+        trade_cost=trade_cost,
+        vectorized=vectorized,
+    ))
+    return backtesting_result["results"]
+
+
+class BacktestingParameterSweep:
+    """
+    Runs the backtesting of a controller for every combination of a parameter grid in a pool of processes.
+    The candles needed by all the configurations are loaded once in the main process, fetching each connector, trading
+    pair and interval only once, and handed to every worker when it starts, so the workers only run simulations.
+    """
+
+    def __init__(self,
+                 backtesting_engine_class: Type[BacktestingEngineBase] = BacktestingEngineBase,
+                 max_workers: Optional[int] = None,
+                 candles_store: Optional[CandlesStore] = None):
+        """
+        :param backtesting_engine_class: engine used to run each backtesting, it has to be importable by the workers
+        :param max_workers: number of worker processes, by default the number of CPUs
+        :param candles_store: local store of the historical candles, by default the one in the data path
+        """
+        self.backtesting_engine_class = backtesting_engine_class
+        self.max_workers = max_workers
+        self.backtesting_data_provider = BacktestingDataProvider(connectors={}, candles_store=candles_store)
+
+    @staticmethod
+    def build_controller_configs(base_config: ControllerConfigBase,
+                                 parameter_grid: Dict[str, List[Any]]) -> List[ControllerConfigBase]:
+        """
+        Returns a copy of the base configuration for every combination of the parameter grid values.
+        The copies are validated again, so fields derived from the updated parameters are computed for each of them.
+        """
+        # Passing the id as None generates a new one for each configuration
+        base_config_data = {**base_config.model_dump(), "id": None}
+        parameter_names = list(parameter_grid.keys())
+        return [
+            base_config.__class__(**{**base_config_data, **dict(zip(parameter_names, values))})
+            for values in itertools.product(*[parameter_grid[name] for name in parameter_names])
+        ]
+
+    async def run(self,
+                  base_config: ControllerConfigBase,
+                  parameter_grid: Dict[str, List[Any]],
+                  start: int,
+                  end: int,
+                  backtesting_resolution: str = "1m",
+                  trade_cost: float = 0.0006,
+                  vectorized: bool = False) -> pd.DataFrame:
+        """
+        Backtests every combination of the parameter grid applied to the base configuration.
+
+        Args:
+            base_config (ControllerConfigBase): Configuration with the values of the parameters not in the grid.
+            parameter_grid (Dict[str, List[Any]]): Values to test for each parameter.
+            start (int): Start timestamp of the backtesting.
+            end (int): End timestamp of the backtesting.
+            backtesting_resolution (str): Interval of the candles used to simulate the executors.
+            trade_cost (float): The cost per trade.
+            vectorized (bool): Uses the vectorized simulation loop of the backtesting engine.
+
+        Returns:
+            pd.DataFrame: One row per configuration, with the parameter values and the summarize_results metrics.
+        """
+        controller_configs = self.build_controller_configs(base_config, parameter_grid)
+        await self.load_market_data(controller_configs, start, end, backtesting_resolution)
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_initialize_worker,
+                                 initargs=(self.backtesting_data_provider.candles_feeds,
+                                           self.backtesting_data_provider.trading_rules)) as executor:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(executor, _run_backtesting, self.backtesting_engine_class, controller_config,
+                                     start, end, backtesting_resolution, trade_cost, vectorized)
+                for controller_config in controller_configs
+            ])
+
+        parameter_names = list(parameter_grid.keys())
+        return pd.DataFrame([
+            {**{name: getattr(controller_config, name) for name in parameter_names}, **result}
+            for controller_config, result in zip(controller_configs, results)
+        ])
+
+    async def load_market_data(self,
+                               controller_configs: List[ControllerConfigBase],
+                               start: int,
+                               end: int,
+                               backtesting_resolution: str):
+        """
+        Loads the trading rules and the candles required by all the configurations. Configurations sharing connector,
+        trading pair and interval share the candles, fetched once with the largest number of records they need.
+        """
+        self.backtesting_data_provider.update_backtesting_time(start, end)
+        candles_configs: Dict[str, CandlesConfig] = {}
+        for controller_config in controller_configs:
+            await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+            for candles_config in self.get_candles_configs(controller_config, backtesting_resolution):
+                key = self.backtesting_data_provider._generate_candle_feed_key(candles_config)
+                if key not in candles_configs or candles_configs[key].max_records < candles_config.max_records:
+                    candles_configs[key] = candles_config
+        for candles_config in candles_configs.values():
+            await self.backtesting_data_provider.initialize_candles_feed(candles_config)
+
+    def get_candles_configs(self,
+                            controller_config: ControllerConfigBase,
+                            backtesting_resolution: str) -> List[CandlesConfig]:
+        """
+        Returns the candles the backtesting engine loads for the configuration. Controllers can complete their candles
+        configuration when they are created, so it is read from a controller built the same way the engine does.
+        """
+        controller_class = controller_config.get_controller_class()
+        controller = controller_class(config=controller_config,
+                                      market_data_provider=self.backtesting_data_provider,
+                                      actions_queue=None)
+        return [CandlesConfig(connector=controller.config.connector_name,
+                              trading_pair=controller.config.trading_pair,
+                              interval=backtesting_resolution)] + list(controller.config.candles_config)
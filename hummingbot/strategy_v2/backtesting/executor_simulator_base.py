@@ -1,8 +1,9 @@
 from decimal import Decimal
-from typing import Union
+from typing import Any, Dict, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
@@ -11,11 +12,29 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
+class ExecutorSimulationState:
+    """
+    NumPy arrays of the simulation columns and the last executor info built from them. Kept out of the model fields so
+    simulations are still compared by their fields.
+    """
+    __slots__ = ("timestamps", "last_timestamp", "columns", "executor_info", "position")
+
+    def __init__(self, executor_simulation: pd.DataFrame):
+        self.timestamps: np.ndarray = executor_simulation.index.values
+        self.last_timestamp: float = executor_simulation.index.max()
+        self.columns: Dict[str, np.ndarray] = {
+            column: executor_simulation[column].values for column in executor_simulation.columns
+        }
+        self.executor_info: Optional[ExecutorInfo] = None
+        self.position: int = -1
+
+
 class ExecutorSimulation(BaseModel):
     config: Union[PositionExecutorConfig, DCAExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    _state: Optional[ExecutorSimulationState] = PrivateAttr(default=None)
 
     @field_validator('executor_simulation', mode="before")
     @classmethod
@@ -53,6 +72,31 @@ class ExecutorSimulation(BaseModel):
             custom_info=self.get_custom_info(last_entry)
         )
 
+    def refresh_executor_info(self, timestamp: float) -> ExecutorInfo:
+        """
+        Returns the same executor info as get_executor_info_at_timestamp. While the executor is active, the info built
+        on the first call is copied with the values read from NumPy arrays of the simulation columns, so an
+        ExecutorInfo is only validated when the executor starts and when it closes.
+        """
+        state = self._state
+        if state is None:
+            state = self._state = ExecutorSimulationState(self.executor_simulation)
+        position = np.searchsorted(state.timestamps, timestamp, side="right") - 1
+        if state.executor_info is None or position < 0 or state.timestamps[position] >= state.last_timestamp:
+            state.executor_info = self.get_executor_info_at_timestamp(timestamp)
+        elif position != state.position:
+            entry = {column: values[position] for column, values in state.columns.items()}
+            state.executor_info = state.executor_info.model_copy(update={
+                "net_pnl_pct": Decimal(entry["net_pnl_pct"]),
+                "net_pnl_quote": Decimal(entry["net_pnl_quote"]),
+                "cum_fees_quote": Decimal(entry["cum_fees_quote"]),
+                "filled_amount_quote": Decimal(entry["filled_amount_quote"]),
+                "is_trading": bool(entry["filled_amount_quote"] > 0),
+                "custom_info": self.get_custom_info(entry),
+            })
+        state.position = position
+        return state.executor_info
+
     def _empty_executor_info(self):
         # Helper method to create an empty ExecutorInfo
         return ExecutorInfo(
@@ -70,7 +114,11 @@ class ExecutorSimulation(BaseModel):
             custom_info={}
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def get_custom_info(self, last_entry: Union[pd.Series, Dict[str, Any]]) -> dict:
+        """
+        Custom info of the executor at a simulation row. refresh_executor_info passes the row as a dict of the column
+        values, so overrides should only read the row by column name.
+        """
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
@@ -0,0 +1,249 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of the replayed order books. The books are only updated by the replay, so it never connects.
+    """
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+    async def listen_for_subscriptions(self):
+        pass
+
+    async def subscribe_to_trading_pair(self, trading_pair: str) -> bool:
+        return True
+
+    async def unsubscribe_from_trading_pair(self, trading_pair: str) -> bool:
+        return True
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker holding one empty composite order book per trading pair, filled by an `OrderBookReplay`.
+    """
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(ReplayOrderBookTrackerDataSource(trading_pairs), trading_pairs)
+        self._order_books.update({trading_pair: CompositeOrderBook() for trading_pair in trading_pairs})
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _ReplayStream:
+    """
+    Recorded events of one kind for one order book, applied in timestamp order.
+    """
+    # Breaks the ties between the timestamps of the streams, lowest first
+    priority = 0
+
+    def __init__(self, order_book: OrderBook, columns: Mapping[str, np.ndarray]):
+        self.order_book = order_book
+        self.timestamps: List[float] = np.asarray(columns["timestamp"], dtype=np.float64).tolist()
+        self.cursor = 0
+
+    def apply(self, index: int, update_id: int):
+        raise NotImplementedError
+
+
+class _LevelsStream(_ReplayStream):
+    def __init__(self, order_book: OrderBook, columns: Mapping[str, np.ndarray], is_snapshot: bool):
+        super().__init__(order_book, columns)
+        self.is_snapshot = is_snapshot
+        self.priority = 0 if is_snapshot else 1
+        self.bid_price = np.asarray(columns["bid_price"], dtype=np.float64)
+        self.bid_amount = np.asarray(columns["bid_amount"], dtype=np.float64)
+        self.ask_price = np.asarray(columns["ask_price"], dtype=np.float64)
+        self.ask_amount = np.asarray(columns["ask_amount"], dtype=np.float64)
+
+    @staticmethod
+    def _levels(prices: np.ndarray, amounts: np.ndarray, update_id: int) -> np.ndarray:
+        # Levels are NaN padded up to the recorded depth
+        present = ~np.isnan(prices)
+        levels = np.empty((np.count_nonzero(present), 3), dtype=np.float64)
+        levels[:, 0] = prices[present]
+        levels[:, 1] = amounts[present]
+        levels[:, 2] = update_id
+        return levels
+
+    def apply(self, index: int, update_id: int):
+        bids = self._levels(self.bid_price[index], self.bid_amount[index], update_id)
+        asks = self._levels(self.ask_price[index], self.ask_amount[index], update_id)
+        if self.is_snapshot:
+            self.order_book.apply_numpy_snapshot(bids, asks)
+        else:
+            self.order_book.apply_numpy_diffs(bids, asks)
+
+
+class _TradesStream(_ReplayStream):
+    priority = 2
+
+    def __init__(self, order_book: OrderBook, columns: Mapping[str, np.ndarray], trading_pair: str):
+        super().__init__(order_book, columns)
+        self.trading_pair = trading_pair
+        self.price: List[float] = np.asarray(columns["price"], dtype=np.float64).tolist()
+        self.amount: List[float] = np.asarray(columns["amount"], dtype=np.float64).tolist()
+        self.trade_type: List[int] = np.asarray(columns["trade_type"]).tolist()
+
+    def apply(self, index: int, update_id: int):
+        self.order_book.apply_trade(OrderBookTradeEvent(trading_pair=self.trading_pair,
+                                                        timestamp=self.timestamps[index],
+                                                        type=TradeType(self.trade_type[index]),
+                                                        price=Decimal(repr(self.price[index])),
+                                                        amount=Decimal(repr(self.amount[index]))))
+
+
+class OrderBookReplay(PyTimeIterator):
+    """
+    Replays recorded order book snapshots, diffs and public trades into order books as the clock ticks.
+
+    On every tick, the events recorded up to the tick timestamp are applied to the books in timestamp order (snapshots
+    first, then diffs, then trades for events with the same timestamp). Applied trades trigger the order book trade
+    events, so a paper trade exchange over the books fills its limit orders crossed by them.
+
+    Snapshots and diffs are given as the columns written by `MarketDataCapture`: `timestamp`, and `bid_price`,
+    `bid_amount`, `ask_price` and `ask_amount` with one value per level, NaN padded. A diff level with a zero amount
+    removes the price level. Trades are given as the `timestamp`, `price`, `amount` and `trade_type` (TradeType value)
+    columns.
+    """
+
+    def __init__(self, order_books: Dict[str, OrderBook]):
+        super().__init__()
+        self._order_books = order_books
+        self._streams: Dict[str, List[_ReplayStream]] = {trading_pair: [] for trading_pair in order_books}
+        self._update_id = 0
+
+    def add_snapshots(self, trading_pair: str, columns: Mapping[str, np.ndarray]):
+        self._add_stream(trading_pair, _LevelsStream(self._order_book(trading_pair), columns, is_snapshot=True))
+
+    def add_diffs(self, trading_pair: str, columns: Mapping[str, np.ndarray]):
+        self._add_stream(trading_pair, _LevelsStream(self._order_book(trading_pair), columns, is_snapshot=False))
+
+    def add_trades(self, trading_pair: str, columns: Mapping[str, np.ndarray]):
+        self._add_stream(trading_pair, _TradesStream(self._order_book(trading_pair), columns, trading_pair))
+
+    @property
+    def pending_events(self) -> int:
+        return sum(len(stream.timestamps) - stream.cursor
+                   for streams in self._streams.values() for stream in streams)
+
+    def tick(self, timestamp: float):
+        for streams in self._streams.values():
+            ends = [bisect_right(stream.timestamps, timestamp, lo=stream.cursor) for stream in streams]
+            while True:
+                next_stream = None
+                next_timestamp = 0.0
+                for stream, end in zip(streams, ends):
+                    if stream.cursor < end and (next_stream is None
+                                                or stream.timestamps[stream.cursor] < next_timestamp):
+                        next_stream = stream
+                        next_timestamp = stream.timestamps[stream.cursor]
+                if next_stream is None:
+                    break
+                self._update_id += 1
+                next_stream.apply(next_stream.cursor, self._update_id)
+                next_stream.cursor += 1
+
+    def _order_book(self, trading_pair: str) -> OrderBook:
+        if trading_pair not in self._order_books:
+            raise ValueError(f"No order book exists for '{trading_pair}'.")
+        return self._order_books[trading_pair]
+
+    def _add_stream(self, trading_pair: str, stream: _ReplayStream):
+        self._streams[trading_pair].append(stream)
+        self._streams[trading_pair].sort(key=lambda s: s.priority)
+
+
+class OrderBookReplayBacktester:
+    """
+    Backtests clock driven strategies against recorded order books, filling their orders with the paper trade exchange
+    matching instead of simulating them on candles, so the results account for the spread and the depth of the books.
+
+    The clock runs in backtest mode from start_time to end_time. On every tick the paper trade exchange first processes
+    the orders queued or crossed at the previous tick, then the market data recorded up to the tick is replayed, its
+    trades filling the crossed limit orders at the tick timestamp, then the strategies added with `add_strategy` run.
+    """
+
+    def __init__(self,
+                 connector_name: str,
+                 trading_pairs: List[str],
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 queue_position_fills: bool = False):
+        """
+        :param connector_name: name of the replayed connector, used for its trade fees
+        :param trading_pairs: replayed trading pairs
+        :param start_time: timestamp of the first tick
+        :param end_time: timestamp of the last tick
+        :param tick_size: seconds between ticks
+        :param queue_position_fills: fill the limit orders only once the recorded volume ahead of them is exhausted
+        """
+        self.connector_name = connector_name
+        self.trading_pairs = trading_pairs
+        self.start_time = start_time
+        self.end_time = end_time
+        self.order_book_tracker = ReplayOrderBookTracker(trading_pairs)
+        # The recorded trading pairs are already in Hummingbot format, so no conversion is needed
+        self.exchange = PaperTradeExchange(self.order_book_tracker,
+                                           ExchangeBase,
+                                           exchange_name=connector_name,
+                                           queue_position_fills=queue_position_fills)
+        self.replay = OrderBookReplay(self.order_book_tracker.order_books)
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=tick_size, start_time=start_time, end_time=end_time)
+        self.clock.add_iterator(self.exchange)
+        self.clock.add_iterator(self.replay)
+        # The paper trade market listens to the trades of the replayed books
+        self.exchange.init_paper_trade_market()
+
+    def load_market_data(self, data_provider: BacktestingDataProvider):
+        """
+        Loads the order book snapshots, the diffs and the trades captured for the trading pairs between start_time and
+        end_time.
+        """
+        data_provider.start_time = self.start_time
+        data_provider.end_time = self.end_time
+        for trading_pair in self.trading_pairs:
+            self.replay.add_snapshots(trading_pair,
+                                      data_provider.get_order_book_snapshots(self.connector_name, trading_pair))
+            self.replay.add_diffs(trading_pair, data_provider.get_order_book_diffs(self.connector_name, trading_pair))
+            self.replay.add_trades(trading_pair, data_provider.get_trades_df(self.connector_name, trading_pair))
+
+    def set_balance(self, asset: str, amount: Decimal):
+        self.exchange.set_balance(asset, amount)
+
+    def add_strategy(self, strategy: TimeIterator):
+        self.clock.add_iterator(strategy)
+
+    def run(self):
+        with self.clock:
+            self.clock.backtest_til(self.end_time)
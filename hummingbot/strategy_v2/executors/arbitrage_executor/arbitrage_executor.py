@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
 
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -318,6 +318,10 @@ class ArbitrageExecutor(ExecutorBase):
             self.place_sell_arbitrage_order()
             self._cumulative_failures += 1
 
+    def get_scheduled_markets(self) -> List[Tuple[str, str]]:
+        return [(self.config.buying_market.connector_name, self.config.buying_market.trading_pair),
+                (self.config.selling_market.connector_name, self.config.selling_market.trading_pair)]
+
     def get_custom_info(self) -> Dict:
         return {
             "buy_connector": self.buying_market.connector_name,
@@ -123,6 +123,12 @@ class DCAExecutor(ExecutorBase):
             return None
         return self.config.timestamp + self.config.time_limit
 
+    def get_next_wake_up_timestamp(self) -> Optional[float]:
+        """
+        The executor has to be run at its time limit.
+        """
+        return self.end_time
+
     @property
     def is_expired(self):
         return self.end_time and self.end_time <= self._strategy.current_timestamp
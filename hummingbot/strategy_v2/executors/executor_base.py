@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,6 +25,9 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+
 
 class ExecutorBase(RunnableBase):
     """
@@ -45,6 +48,7 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp: Optional[float] = None
         self._strategy: ScriptStrategyBase = strategy
         self._held_position_orders = []  # Keep track of orders that become held positions
+        self._scheduler: Optional["ExecutorScheduler"] = None
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
@@ -155,11 +159,43 @@ class ExecutorBase(RunnableBase):
             AllConnectorSettings.get_gateway_amm_connector_names()
         )
 
+    def set_scheduler(self, scheduler: "ExecutorScheduler"):
+        """
+        Runs the control task from the scheduler instead of the executor's own control loop. It has to be set before
+        the executor is started.
+
+        :param scheduler: The scheduler that runs the executor.
+        """
+        self._scheduler = scheduler
+
+    def get_scheduled_markets(self) -> List[Tuple[str, str]]:
+        """
+        Returns the markets whose mid price moves wake up the executor when it's run by a scheduler. Can be
+        reimplemented by subclasses that don't trade a single connector_name and trading_pair.
+        """
+        connector_name = getattr(self.config, "connector_name", None)
+        trading_pair = getattr(self.config, "trading_pair", None)
+        if connector_name is None or trading_pair is None:
+            return []
+        return [(connector_name, trading_pair)]
+
+    def get_next_wake_up_timestamp(self) -> Optional[float]:
+        """
+        Returns the next timestamp at which the executor has to be run regardless of its inputs, like its time
+        limit, when it's run by a scheduler. Returns None by default, and can be reimplemented by subclasses.
+        """
+        return None
+
     def start(self):
         """
         Starts the executor and registers the events.
         """
-        super().start()
+        if self._scheduler is None:
+            super().start()
+        elif self._status == RunnableStatus.NOT_STARTED:
+            self.terminated.clear()
+            self._status = RunnableStatus.RUNNING
+            self._scheduler.add_executor(self)
         self.register_events()
 
     def stop(self):
@@ -169,6 +205,8 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        if self._scheduler is not None:
+            self._scheduler.wake_up(self)
 
     async def on_start(self):
         """
@@ -287,9 +325,12 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        if self._scheduler is not None:
+            self._scheduler.track_order(order_id, self)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
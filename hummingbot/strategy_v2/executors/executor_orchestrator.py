@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorCpuUsage, ExecutorScheduler
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -157,10 +158,16 @@ class ExecutorOrchestrator:
                  strategy: "StrategyV2Base",
                  executors_update_interval: float = 1.0,
                  executors_max_retries: int = 10,
-                 initial_positions_by_controller: Optional[dict] = None):
+                 initial_positions_by_controller: Optional[dict] = None,
+                 event_driven_scheduling: bool = False,
+                 executors_fallback_interval: float = 10.0):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors_max_retries = executors_max_retries
+        # When enabled, a single scheduler runs the executors when their orders, prices or deadlines change instead
+        # of each executor running its own control loop every update interval
+        self.scheduler: Optional[ExecutorScheduler] = ExecutorScheduler(
+            strategy, fallback_interval=executors_fallback_interval) if event_driven_scheduling else None
         self.active_executors = {}
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
@@ -301,6 +308,8 @@ class ExecutorOrchestrator:
                     for executor in executors_list]):
                 continue
             await asyncio.sleep(2.0)
+        if self.scheduler is not None:
+            self.scheduler.stop()
         # Store all positions
         self.store_all_positions()
         # Clear executors and trigger garbage collection
@@ -397,6 +406,8 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        if self.scheduler is not None:
+            executor.set_scheduler(self.scheduler)
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -525,6 +536,15 @@ class ExecutorOrchestrator:
         del executor
         # Trigger garbage collection after executor cleanup
 
+    def get_executors_cpu_usage(self) -> Dict[str, ExecutorCpuUsage]:
+        """
+        Get the control task runs and CPU time of each executor by executor id. Only executors run by the scheduler
+        are accounted.
+        """
+        if self.scheduler is None:
+            return {}
+        return self.scheduler.get_cpu_usage()
+
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
         Generate a report of all executors.
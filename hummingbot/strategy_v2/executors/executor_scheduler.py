@@ -0,0 +1,308 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.models.base import RunnableStatus
+
+if TYPE_CHECKING:
+    from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+    from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class ExecutorCpuUsage(NamedTuple):
+    runs: int
+    cpu_time: float
+
+
+class ScheduledExecutor:
+    """
+    Scheduling state of an executor driven by the ExecutorScheduler.
+    """
+    __slots__ = ("executor", "started", "running", "woken_up", "last_run_timestamp", "next_run_timestamp",
+                 "reference_prices", "order_ids", "runs", "cpu_time")
+
+    def __init__(self, executor: "ExecutorBase"):
+        self.executor = executor
+        self.started = False
+        self.running = False
+        self.woken_up = True
+        self.last_run_timestamp = 0.0
+        self.next_run_timestamp = 0.0
+        self.reference_prices: Dict[Tuple[str, str], float] = {}
+        self.order_ids: List[str] = []
+        self.runs = 0
+        self.cpu_time = 0.0
+
+
+class CpuTimedCoroutine:
+    """
+    Awaitable that adds the CPU time spent in each step of the wrapped coroutine to the scheduled executor, so the
+    time spent by other tasks while the coroutine is suspended is not accounted to it.
+    """
+
+    def __init__(self, coroutine, scheduled_executor: ScheduledExecutor):
+        self._coroutine = coroutine
+        self._scheduled_executor = scheduled_executor
+
+    def __await__(self):
+        value = None
+        error = None
+        while True:
+            start = time.process_time()
+            try:
+                if error is None:
+                    yielded = self._coroutine.send(value)
+                else:
+                    yielded = self._coroutine.throw(error)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self._scheduled_executor.cpu_time += time.process_time() - start
+            value = None
+            error = None
+            try:
+                value = yield yielded
+            except BaseException as e:
+                error = e
+
+
+class ExecutorScheduler:
+    """
+    Runs the control task of many executors from a single coroutine. An executor is run when its inputs change: an
+    order event for one of its orders, a mid price move beyond the threshold on one of its markets or one of its
+    deadlines (like the time limit). The periodic run every fallback interval only catches the inputs that are not
+    tracked, and executors that are shutting down keep running every update interval.
+    """
+    _logger = None
+    _order_events = [
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure,
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+    ]
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 strategy: "ScriptStrategyBase",
+                 fallback_interval: float = 10.0,
+                 price_check_interval: float = 0.1,
+                 price_change_threshold: float = 0.0005):
+        """
+        :param strategy: The strategy the executors trade for.
+        :param fallback_interval: Maximum time between two runs of an executor, in seconds.
+        :param price_check_interval: Interval at which the mid prices of the executors markets are checked.
+        :param price_change_threshold: Relative mid price move since the last run that wakes an executor up.
+        """
+        self._strategy = strategy
+        self.fallback_interval = fallback_interval
+        self.price_check_interval = price_check_interval
+        self.price_change_threshold = price_change_threshold
+        self._scheduled_executors: Dict[str, ScheduledExecutor] = {}
+        self._executors_by_order_id: Dict[str, ScheduledExecutor] = {}
+        self._executors_by_market: Dict[Tuple[str, str], List[ScheduledExecutor]] = {}
+        self._deadlines: List[Tuple[float, int, ScheduledExecutor]] = []
+        self._deadlines_counter = 0
+        self._woken_up_executors: List[ScheduledExecutor] = []
+        self._wake_up_event = asyncio.Event()
+        self._cpu_usage: Dict[str, ExecutorCpuUsage] = {}
+        self._order_event_forwarder = SourceInfoEventForwarder(self._process_order_event)
+        self._listened_connectors = set()
+        self._scheduler_task: Optional[asyncio.Task] = None
+
+    @property
+    def scheduled_executors_count(self) -> int:
+        return len(self._scheduled_executors)
+
+    def start(self):
+        if self._scheduler_task is None:
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop())
+
+    def stop(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+        for connector_name in self._listened_connectors:
+            for event in self._order_events:
+                self._strategy.connectors[connector_name].remove_listener(event, self._order_event_forwarder)
+        self._listened_connectors.clear()
+
+    def add_executor(self, executor: "ExecutorBase"):
+        """
+        Schedules the executor, running its start and first control task as soon as possible.
+        """
+        scheduled_executor = ScheduledExecutor(executor)
+        self._scheduled_executors[executor.config.id] = scheduled_executor
+        for market in executor.get_scheduled_markets():
+            self._executors_by_market.setdefault(market, []).append(scheduled_executor)
+        for connector_name in executor.connectors:
+            if connector_name not in self._listened_connectors:
+                self._listened_connectors.add(connector_name)
+                for event in self._order_events:
+                    self._strategy.connectors[connector_name].add_listener(event, self._order_event_forwarder)
+        self._woken_up_executors.append(scheduled_executor)
+        self._wake_up_event.set()
+        self.start()
+
+    def track_order(self, order_id: str, executor: "ExecutorBase"):
+        """
+        Routes the events of the order to the executor that placed it.
+        """
+        scheduled_executor = self._scheduled_executors.get(executor.config.id)
+        if scheduled_executor is not None:
+            self._executors_by_order_id[order_id] = scheduled_executor
+            scheduled_executor.order_ids.append(order_id)
+
+    def wake_up(self, executor: "ExecutorBase"):
+        scheduled_executor = self._scheduled_executors.get(executor.config.id)
+        if scheduled_executor is not None:
+            self._wake_up(scheduled_executor)
+
+    def get_cpu_usage(self) -> Dict[str, ExecutorCpuUsage]:
+        """
+        Returns the number of control task runs and the CPU time spent in them by executor id, including the
+        executors that already stopped.
+        """
+        usage = dict(self._cpu_usage)
+        for executor_id, scheduled_executor in self._scheduled_executors.items():
+            usage[executor_id] = ExecutorCpuUsage(scheduled_executor.runs, scheduled_executor.cpu_time)
+        return usage
+
+    def _wake_up(self, scheduled_executor: ScheduledExecutor):
+        if not scheduled_executor.woken_up:
+            scheduled_executor.woken_up = True
+            # A running executor runs again once its current run is done
+            if not scheduled_executor.running:
+                self._woken_up_executors.append(scheduled_executor)
+                self._wake_up_event.set()
+
+    def _process_order_event(self, event_tag: int, market, event):
+        scheduled_executor = self._executors_by_order_id.get(getattr(event, "order_id", None))
+        if scheduled_executor is not None:
+            self._wake_up(scheduled_executor)
+
+    def _get_mid_price(self, market: Tuple[str, str]) -> float:
+        connector_name, trading_pair = market
+        try:
+            return float(self._strategy.connectors[connector_name].get_price_by_type(trading_pair,
+                                                                                    PriceType.MidPrice))
+        except Exception:
+            return float("nan")
+
+    def _check_prices(self):
+        """
+        Wakes up the executors whose markets mid price moved beyond the threshold since their last run.
+        """
+        for market, scheduled_executors in self._executors_by_market.items():
+            price = self._get_mid_price(market)
+            if price != price:
+                continue
+            for scheduled_executor in scheduled_executors:
+                reference_price = scheduled_executor.reference_prices.get(market)
+                if (reference_price is not None and not scheduled_executor.woken_up and
+                        abs(price - reference_price) > reference_price * self.price_change_threshold):
+                    self._wake_up(scheduled_executor)
+
+    def _schedule_next_run(self, scheduled_executor: ScheduledExecutor):
+        executor = scheduled_executor.executor
+        last_run_timestamp = scheduled_executor.last_run_timestamp
+        if executor.status == RunnableStatus.RUNNING:
+            next_run_timestamp = last_run_timestamp + self.fallback_interval
+            deadline = executor.get_next_wake_up_timestamp()
+            if deadline is not None and last_run_timestamp < deadline < next_run_timestamp:
+                next_run_timestamp = deadline
+        else:
+            next_run_timestamp = last_run_timestamp + executor.update_interval
+        scheduled_executor.next_run_timestamp = next_run_timestamp
+        self._deadlines_counter += 1
+        heapq.heappush(self._deadlines, (next_run_timestamp, self._deadlines_counter, scheduled_executor))
+
+    def _pop_due_executors(self, timestamp: float) -> List[ScheduledExecutor]:
+        due_executors = self._woken_up_executors
+        self._woken_up_executors = []
+        while self._deadlines and self._deadlines[0][0] <= timestamp:
+            next_run_timestamp, _, scheduled_executor = heapq.heappop(self._deadlines)
+            # Deadlines replaced by a later run and those of removed executors are skipped
+            if (next_run_timestamp == scheduled_executor.next_run_timestamp and
+                    not scheduled_executor.woken_up and not scheduled_executor.running and
+                    scheduled_executor.executor.config.id in self._scheduled_executors):
+                scheduled_executor.woken_up = True
+                due_executors.append(scheduled_executor)
+        return due_executors
+
+    def _remove(self, scheduled_executor: ScheduledExecutor):
+        executor = scheduled_executor.executor
+        self._scheduled_executors.pop(executor.config.id, None)
+        self._cpu_usage[executor.config.id] = ExecutorCpuUsage(scheduled_executor.runs, scheduled_executor.cpu_time)
+        for market in executor.get_scheduled_markets():
+            scheduled_executors = self._executors_by_market.get(market, [])
+            if scheduled_executor in scheduled_executors:
+                scheduled_executors.remove(scheduled_executor)
+            if not scheduled_executors:
+                self._executors_by_market.pop(market, None)
+        for order_id in scheduled_executor.order_ids:
+            self._executors_by_order_id.pop(order_id, None)
+
+    async def _run_executor(self, scheduled_executor: ScheduledExecutor):
+        executor = scheduled_executor.executor
+        try:
+            if not scheduled_executor.started:
+                scheduled_executor.started = True
+                await CpuTimedCoroutine(executor.on_start(), scheduled_executor)
+            if executor.terminated.is_set():
+                executor.on_stop()
+                self._remove(scheduled_executor)
+                return
+            scheduled_executor.reference_prices = {market: self._get_mid_price(market)
+                                                   for market in executor.get_scheduled_markets()}
+            scheduled_executor.runs += 1
+            await CpuTimedCoroutine(executor.control_task(), scheduled_executor)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+        finally:
+            scheduled_executor.running = False
+        scheduled_executor.last_run_timestamp = self._strategy.current_timestamp
+        if scheduled_executor.woken_up or executor.terminated.is_set():
+            scheduled_executor.woken_up = False
+            self._wake_up(scheduled_executor)
+        else:
+            self._schedule_next_run(scheduled_executor)
+
+    async def _scheduler_loop(self):
+        last_price_check = 0.0
+        while True:
+            try:
+                now = time.perf_counter()
+                if now - last_price_check >= self.price_check_interval:
+                    last_price_check = now
+                    self._check_prices()
+                self._wake_up_event.clear()
+                for scheduled_executor in self._pop_due_executors(self._strategy.current_timestamp):
+                    scheduled_executor.woken_up = False
+                    scheduled_executor.running = True
+                    safe_ensure_future(self._run_executor(scheduled_executor))
+                try:
+                    await asyncio.wait_for(self._wake_up_event.wait(), timeout=self.price_check_interval)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger().error(e, exc_info=True)
+                await asyncio.sleep(self.price_check_interval)
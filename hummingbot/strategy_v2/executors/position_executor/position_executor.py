@@ -270,6 +270,12 @@ class PositionExecutor(ExecutorBase):
             return None
         return self.config.timestamp + self.config.triple_barrier_config.time_limit
 
+    def get_next_wake_up_timestamp(self) -> Optional[float]:
+        """
+        The executor has to be run at its time limit.
+        """
+        return self.end_time
+
     @property
     def take_profit_price(self):
         """
@@ -55,6 +55,12 @@ class TWAPExecutor(ExecutorBase):
             order_plan[timestamp] = None  # Initialized with None, to be replaced with a TrackedOrder
         return order_plan
 
+    def get_next_wake_up_timestamp(self) -> Optional[float]:
+        """
+        The executor has to be run when the next order of the plan is due.
+        """
+        return next((timestamp for timestamp, tracked_order in self._order_plan.items() if tracked_order is None), None)
+
     def close_execution_by(self, close_type):
         self.close_type = close_type
         self.close_timestamp = self._strategy.current_timestamp
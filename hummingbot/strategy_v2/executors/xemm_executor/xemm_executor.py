@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from hummingbot.connector.connector_base import ConnectorBase, Union
 from hummingbot.connector.utils import split_hb_trading_pair
@@ -301,6 +301,10 @@ class XEMMExecutor(ExecutorBase):
             self._current_retries += 1
             self.place_taker_order()
 
+    def get_scheduled_markets(self) -> List[Tuple[str, str]]:
+        return [(self.config.buying_market.connector_name, self.config.buying_market.trading_pair),
+                (self.config.selling_market.connector_name, self.config.selling_market.trading_pair)]
+
     def get_custom_info(self) -> Dict:
         # Since we can't make this method async, we'll skip the profitability calculation
         # The profitability will still be shown in the status message which is async
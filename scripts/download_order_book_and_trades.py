@@ -3,6 +3,8 @@ import os
 from datetime import datetime
 from typing import Dict
 
+import numpy as np
+
 from hummingbot import data_path
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -43,11 +45,11 @@ class DownloadTradesAndOrderBookSnapshots(ScriptStrategyBase):
 
     def get_order_book_dict(self, exchange: str, trading_pair: str, depth: int = 50):
         order_book = self.connectors[exchange].get_order_book(trading_pair)
-        snapshot = order_book.snapshot
+        bids, asks = order_book.top_levels(depth)
         return {
             "ts": self.current_timestamp,
-            "bids": snapshot[0].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-            "asks": snapshot[1].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
+            "bids": bids[~np.isnan(bids[:, 0]), :2].tolist(),
+            "asks": asks[~np.isnan(asks[:, 0]), :2].tolist(),
         }
 
     def dump_and_clean_temp_storage(self):
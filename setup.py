@@ -58,6 +58,7 @@ def main():
         "numba>=0.61.2",
         "numpy>=2.2.6",
         "objgraph",
+        "orjson>=3.8",
         "pandas>=2.3.2",
         "pandas-ta>=0.4.71b",
         "prompt_toolkit>=3.0.39",
@@ -0,0 +1,114 @@
+"""
+Measures the time the paper trade exchange spends per tick checking the resting limit orders of grid strategies
+against the order books, and matching the public trades to them, when none of the orders is crossed. Both with the
+orders filled as soon as the book reaches them and filled on their queue position.
+
+Run with:
+    python -m test.hummingbot.connector.exchange.paper_trade.benchmark_paper_trade_matching
+"""
+import asyncio
+import gc
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.strategy_v2.backtesting.order_book_replay import ReplayOrderBookTracker
+
+PAIR_COUNT = 30
+GRID_LEVELS = 200
+MID_PRICE = 100.0
+
+
+def create_exchange(queue_position_fills: bool) -> PaperTradeExchange:
+    trading_pairs = [f"COIN{i}-USDT" for i in range(PAIR_COUNT)]
+    tracker = ReplayOrderBookTracker(trading_pairs)
+    exchange = PaperTradeExchange(tracker,
+                                  ExchangeBase,
+                                  exchange_name="binance",
+                                  queue_position_fills=queue_position_fills)
+    for order_book in tracker.order_books.values():
+        bids = np.array([[MID_PRICE - 0.01 * (i + 1), 10, 1] for i in range(20)], dtype=np.float64)
+        asks = np.array([[MID_PRICE + 0.01 * (i + 1), 10, 1] for i in range(20)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids, asks)
+    exchange.ready
+    for trading_pair in trading_pairs:
+        exchange.set_balance(trading_pair.split("-")[0], Decimal("1e9"))
+        exchange.set_balance("USDT", Decimal("1e12"))
+        for level in range(GRID_LEVELS):
+            exchange.buy(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(str(MID_PRICE - 1 - 0.01 * level)))
+            exchange.sell(trading_pair, Decimal("1"), OrderType.LIMIT, Decimal(str(MID_PRICE + 1 + 0.01 * level)))
+    return exchange
+
+
+class TopOfBookMover(PyTimeIterator):
+    """Moves the best bid of the first pairs up and down by one tick on every tick."""
+
+    def __init__(self, order_books, moving_pairs: int):
+        super().__init__()
+        self._order_books = order_books[:moving_pairs]
+        self._tick = 0
+
+    def tick(self, timestamp: float):
+        self._tick += 1
+        amount = 10 if self._tick % 2 == 0 else 0
+        for order_book in self._order_books:
+            order_book.apply_numpy_diffs(np.array([[MID_PRICE, amount, self._tick]], dtype=np.float64),
+                                         np.empty((0, 3)))
+
+
+def run_clock(iterators, tick_count: int) -> float:
+    clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=1000.0, end_time=1000.0 + tick_count)
+    for iterator in iterators:
+        clock.add_iterator(iterator)
+    gc.disable()
+    start = time.perf_counter()
+    with clock:
+        clock.backtest_til(1000.0 + tick_count)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def measure_ticks(exchange: PaperTradeExchange, tick_count: int, moving_pairs: int) -> float:
+    order_books = list(exchange.order_book_tracker.order_books.values())
+    books_only = run_clock([TopOfBookMover(order_books, moving_pairs)], tick_count)
+    with_exchange = run_clock([TopOfBookMover(order_books, moving_pairs), exchange], tick_count)
+    return (with_exchange - books_only) / tick_count
+
+
+def measure_trades(exchange: PaperTradeExchange, trade_count: int) -> float:
+    trading_pairs = exchange.trading_pairs
+    events = [OrderBookTradeEvent(trading_pair=trading_pairs[i % len(trading_pairs)],
+                                  timestamp=1000.0,
+                                  type=TradeType.SELL if i % 2 == 0 else TradeType.BUY,
+                                  price=MID_PRICE + (-0.01 if i % 2 == 0 else 0.01),
+                                  amount=1.0)
+              for i in range(1000)]
+    start = time.perf_counter()
+    for i in range(trade_count):
+        exchange.match_trade_to_limit_orders(events[i % len(events)])
+    return (time.perf_counter() - start) / trade_count
+
+
+def main():
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    for queue_position_fills in (False, True):
+        exchange = create_exchange(queue_position_fills)
+        fill_model = "queue position" if queue_position_fills else "book reached"
+        for moving_pairs in (0, 3, PAIR_COUNT):
+            elapsed = min(measure_ticks(exchange, 5000, moving_pairs) for _ in range(5))
+            print(f"{fill_model:<14} tick, {PAIR_COUNT} pairs x {2 * GRID_LEVELS} orders, "
+                  f"top moving on {moving_pairs:>2} pairs: {elapsed * 1e6:8.2f} us")
+        print(f"{fill_model:<14} public trade matched against {2 * GRID_LEVELS} orders: "
+              f"{measure_trades(exchange, 100000) * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
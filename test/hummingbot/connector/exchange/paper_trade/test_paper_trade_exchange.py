@@ -1,9 +1,20 @@
+import asyncio
+from decimal import Decimal
 from unittest import TestCase
 
+import numpy as np
+
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
+from hummingbot.strategy_v2.backtesting.order_book_replay import ReplayOrderBookTracker
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -25,3 +36,148 @@ class PaperTradeExchangeTests(TestCase):
             exchange_name="kucoin",
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeExchangeCrossedLimitOrdersTests(TestCase):
+    trading_pair = "BTC-USDT"
+    queue_position_fills = False
+
+    def setUp(self) -> None:
+        super().setUp()
+        # The paper trade exchange schedules its network check when the clock starts
+        self.async_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.async_loop)
+        tracker = ReplayOrderBookTracker([self.trading_pair])
+        self.order_book = tracker.order_books[self.trading_pair]
+        self.update_id = 0
+        self.set_top_of_book(100, 101)
+        self.exchange = PaperTradeExchange(tracker,
+                                           ExchangeBase,
+                                           exchange_name="binance",
+                                           queue_position_fills=self.queue_position_fills)
+        self.exchange.ready
+        self.exchange.set_balance("BTC", Decimal("10"))
+        self.exchange.set_balance("USDT", Decimal("10000"))
+        self.fill_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=1000, end_time=1100)
+        self.clock.add_iterator(self.exchange)
+
+    def tearDown(self) -> None:
+        self.async_loop.close()
+        super().tearDown()
+
+    def set_top_of_book(self, best_bid: float, best_ask: float, best_bid_amount: float = 1):
+        self.update_id += 1
+        self.order_book.apply_numpy_snapshot(np.array([[best_bid, best_bid_amount, self.update_id]], dtype=np.float64),
+                                             np.array([[best_ask, 1, self.update_id]], dtype=np.float64))
+
+    def set_bid_level(self, price: float, amount: float):
+        self.update_id += 1
+        self.order_book.apply_numpy_diffs(np.array([[price, amount, self.update_id]], dtype=np.float64),
+                                          np.empty((0, 3)))
+
+    def apply_sell_trade(self, price: float, amount: float):
+        self.order_book.apply_trade(OrderBookTradeEvent(trading_pair=self.trading_pair,
+                                                        timestamp=1000,
+                                                        type=TradeType.SELL,
+                                                        price=price,
+                                                        amount=amount))
+
+    def test_limit_orders_are_filled_when_the_opposite_side_crosses_them(self):
+        with self.clock:
+            buy_order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+            sell_order_id = self.exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("101.5"))
+            self.clock.backtest_til(1001)
+            # The ask going further away from the buy order doesn't fill it either
+            self.set_top_of_book(100, 101.2)
+            self.clock.backtest_til(1002)
+            self.assertEqual(0, len(self.fill_logger.event_log))
+
+            self.set_top_of_book(99, 99.5)
+            self.clock.backtest_til(1003)
+            self.assertEqual([buy_order_id], [fill.order_id for fill in self.fill_logger.event_log])
+            self.assertEqual(Decimal("99.5"), self.fill_logger.event_log[0].price)
+
+            self.set_top_of_book(101.5, 102)
+            self.clock.backtest_til(1004)
+
+        self.assertEqual([buy_order_id, sell_order_id], [fill.order_id for fill in self.fill_logger.event_log])
+        self.assertEqual(TradeType.SELL, self.fill_logger.event_log[1].trade_type)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+
+    def test_limit_order_placed_on_an_unchanged_order_book_is_checked(self):
+        with self.clock:
+            self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+            self.clock.backtest_til(1001)
+            self.assertEqual(0, len(self.fill_logger.event_log))
+
+            crossing_order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("101"))
+            self.clock.backtest_til(1002)
+
+        self.assertEqual([crossing_order_id], [fill.order_id for fill in self.fill_logger.event_log])
+        self.assertEqual(1, len(self.exchange.limit_orders))
+
+    def test_trade_at_the_limit_order_price_does_not_fill_it(self):
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+
+        self.apply_sell_trade(100, 5)
+
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual({}, self.exchange.queue_positions)
+
+
+class PaperTradeExchangeQueuePositionFillsTests(PaperTradeExchangeCrossedLimitOrdersTests):
+    queue_position_fills = True
+
+    def test_trade_at_the_limit_order_price_does_not_fill_it(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+
+        self.apply_sell_trade(100, 0.5)
+
+        # The order is behind the volume of the best bid
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual({order_id: 0.5}, self.exchange.queue_positions)
+
+    def test_limit_order_fills_once_the_trades_exhaust_the_volume_ahead(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+
+        self.apply_sell_trade(100, 0.6)
+        self.apply_sell_trade(100, 0.4)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.apply_sell_trade(100, 0.1)
+
+        self.assertEqual([order_id], [fill.order_id for fill in self.fill_logger.event_log])
+        self.assertEqual(1, len(self.exchange.queue_positions))
+
+    def test_volume_removed_from_the_level_moves_the_limit_order_up_the_queue(self):
+        self.set_top_of_book(100, 101, best_bid_amount=5)
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        self.assertEqual({order_id: 5}, self.exchange.queue_positions)
+
+        # Cancelled ahead of the order, then new orders queued behind it
+        self.set_bid_level(100, 2)
+        self.set_bid_level(100, 6)
+        self.apply_sell_trade(100, 1.5)
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual({order_id: 0.5}, self.exchange.queue_positions)
+
+        self.apply_sell_trade(100, 1)
+
+        self.assertEqual([order_id], [fill.order_id for fill in self.fill_logger.event_log])
+        self.assertEqual({}, self.exchange.queue_positions)
+
+    def test_touched_limit_order_fills_once_its_level_is_gone(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+        crossed_order_id = self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100.5"))
+        with self.clock:
+            self.set_top_of_book(100, 100)
+            self.clock.backtest_til(1001)
+            self.assertEqual([crossed_order_id], [fill.order_id for fill in self.fill_logger.event_log])
+
+            self.set_top_of_book(99.5, 100)
+            self.clock.backtest_til(1002)
+
+        self.assertEqual([crossed_order_id, order_id], [fill.order_id for fill in self.fill_logger.event_log])
@@ -70,6 +70,7 @@ class XRPLAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
         self.mock_client.__aexit__.return_value = None
         self.mock_client.is_open = Mock(return_value=True)
         self.data_source._get_client = AsyncMock(return_value=self.mock_client)
+        self.data_source._get_subscription_client = AsyncMock(return_value=self.mock_client)
 
     def tearDown(self) -> None:
         # self.listening_task and self.listening_task.cancel()
@@ -258,6 +259,31 @@ class XRPLAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
 
         self.assertTrue("Error fetching order book snapshot" in str(context.exception))
 
+    async def test_request_order_book_snapshots_fetches_the_pairs_concurrently(self):
+        requested_pairs = []
+        release_snapshots = asyncio.Event()
+
+        async def order_book_snapshot(trading_pair):
+            requested_pairs.append(trading_pair)
+            await release_snapshots.wait()
+            if trading_pair == "XRP-USD":
+                raise TimeoutError("Test timeout")
+            return trading_pair
+
+        self.data_source._trading_pairs = ["SOLO-XRP", "XRP-USD", "XRP-RLUSD"]
+        self.data_source._order_book_snapshot = order_book_snapshot
+        output = asyncio.Queue()
+
+        task = asyncio.ensure_future(self.data_source._request_order_book_snapshots(output=output))
+        await asyncio.sleep(0.01)
+        self.assertEqual(["SOLO-XRP", "XRP-USD", "XRP-RLUSD"], requested_pairs)
+
+        release_snapshots.set()
+        with self.assertRaises(TimeoutError):
+            await task
+        self.assertEqual("SOLO-XRP", output.get_nowait())
+        self.assertEqual("XRP-RLUSD", output.get_nowait())
+
     async def test_fetch_order_book_side_exception(self):
         self.mock_client.request.side_effect = TimeoutError
         self.data_source._sleep = AsyncMock()
@@ -111,6 +111,7 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
         self.mock_client.is_open = Mock(return_value=True)
 
         self.data_source._get_client = AsyncMock(return_value=self.mock_client)
+        self.data_source._get_subscription_client = AsyncMock(return_value=self.mock_client)
 
         self.connector._orderbook_ds = self.data_source
         self.connector._set_order_book_tracker(
@@ -5600,12 +5601,10 @@ class XRPLExchangeUnitTests(IsolatedAsyncioTestCase):
         mock_client = AsyncMock()
         self.connector._get_async_client = AsyncMock(return_value=mock_client)
 
-        # Should open and close client properly
+        # Should open a connection of the client pool
         await self.connector._make_network_check_request()
 
-        # Verify client was opened and closed
         mock_client.open.assert_called_once()
-        mock_client.close.assert_called_once()
 
     async def test_make_trading_rules_request_none_trading_pairs(self):
         """Test _make_trading_rules_request with None trading pairs"""
@@ -20,12 +20,12 @@ class TestXRPLSubmitTransaction(IsolatedAsyncioTestCase):
         )
         self.exchange._sleep = AsyncMock()
 
-    @patch("hummingbot.connector.exchange.xrpl.xrpl_exchange.AsyncWebsocketClient")
-    async def test_submit_transaction_success(self, mock_client_class):
+    async def test_submit_transaction_success(self):
         """Test successful transaction submission with proper mocking."""
         # Setup client mock
         mock_client_instance = AsyncMock()
-        mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_client_instance.__aenter__.return_value = mock_client_instance
+        self.exchange._get_async_client = AsyncMock(return_value=mock_client_instance)
 
         # Setup transaction mocks
         mock_transaction = MagicMock(spec=Transaction)
@@ -1,15 +1,17 @@
+import asyncio
 import time
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from xrpl.asyncio.clients import XRPLRequestFailureException
 from xrpl.asyncio.transaction import XRPLReliableSubmissionException
-from xrpl.models import OfferCancel, Response
+from xrpl.models import OfferCancel, Response, ServerInfo
 from xrpl.models.response import ResponseStatus
 
 from hummingbot.connector.exchange.xrpl import xrpl_constants as CONSTANTS
 from hummingbot.connector.exchange.xrpl.xrpl_utils import (
     RateLimiter,
+    XRPLClientPool,
     XRPLConfigMap,
     XRPLNodePool,
     _wait_for_final_transaction_outcome,
@@ -534,6 +536,99 @@ class TestXRPLNodePool(IsolatedAsyncioWrapperTestCase):
         self.assertNotEqual(self.node_pool.current_node, test_node)
 
 
+class TestXRPLClientPool(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        self.node_urls = [
+            "wss://test1.ripple.com/",
+            "wss://test2.ripple.com/",
+            "wss://test3.ripple.com/",
+        ]
+        self.node_pool = XRPLNodePool(node_urls=self.node_urls, proactive_switch_interval=0, cooldown=60)
+        self.node_pool._get_latency_safe = AsyncMock(return_value=0.1)
+        self.client_pool = XRPLClientPool(self.node_pool, max_connections=2)
+        self.clients = {}
+        client_class_patch = patch(
+            "hummingbot.connector.exchange.xrpl.xrpl_utils.AsyncWebsocketClient", side_effect=self._create_client
+        )
+        self.client_class_mock = client_class_patch.start()
+        self.addCleanup(client_class_patch.stop)
+
+    def _create_client(self, url):
+        client = AsyncMock()
+        client.url = url
+        client.is_open = MagicMock(return_value=True)
+        client._websocket = None
+        client._messages = None
+        client._request_impl.return_value = Response(status=ResponseStatus.SUCCESS, result={"node": url})
+        self.clients[url] = client
+        return client
+
+    async def test_concurrent_requests_share_the_connection(self):
+        responses = await asyncio.gather(*[self.client_pool.request(ServerInfo()) for _ in range(5)])
+
+        self.assertEqual(1, self.client_class_mock.call_count)
+        self.assertEqual(5, self.clients[self.node_urls[0]]._request_impl.call_count)
+        self.assertTrue(all(response.result["node"] == self.node_urls[0] for response in responses))
+        self.assertGreater(self.client_pool.health[self.node_urls[0]].latency, 0)
+
+    async def test_failed_request_is_sent_through_another_node(self):
+        await self.client_pool.open()
+        failing_client = self.clients[self.node_urls[0]]
+        failing_client._request_impl.side_effect = TimeoutError("Test timeout")
+
+        response = await self.client_pool.request(ServerInfo())
+
+        self.assertEqual(self.node_urls[1], response.result["node"])
+        self.assertIn(self.node_urls[0], self.node_pool._bad_nodes)
+        self.assertEqual(1, self.client_pool.health[self.node_urls[0]].failures)
+        self.assertEqual(0, self.client_pool.health[self.node_urls[1]].failures)
+        failing_client.close.assert_awaited_once()
+
+    async def test_request_fails_when_all_nodes_fail(self):
+        await self.client_pool.open()
+        self.clients[self.node_urls[0]]._request_impl.side_effect = ConnectionError("Test connection error")
+        self.client_class_mock.side_effect = OSError("Test handshake error")
+
+        with self.assertRaises(OSError):
+            await self.client_pool.request(ServerInfo())
+
+    async def test_timed_out_request_shares_one_deadline_between_the_nodes(self):
+        timeouts = []
+
+        async def request_impl(request, timeout):
+            timeouts.append(timeout)
+            await asyncio.sleep(timeout)
+            raise asyncio.TimeoutError()
+
+        def create_timing_out_client(url):
+            client = self._create_client(url)
+            client._request_impl.side_effect = request_impl
+            return client
+
+        self.client_class_mock.side_effect = create_timing_out_client
+
+        start = time.perf_counter()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.client_pool.request(ServerInfo(), timeout=0.2)
+
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertLessEqual(sum(timeouts), 0.2)
+
+    async def test_pooled_client_does_not_close_the_connections(self):
+        async with self.client_pool.client as client:
+            response = await client.request(ServerInfo())
+        await client.close()
+
+        self.assertEqual(self.node_urls[0], response.result["node"])
+        self.assertTrue(self.client_pool.is_open())
+        self.clients[self.node_urls[0]].close.assert_not_awaited()
+
+        await self.client_pool.close()
+
+        self.clients[self.node_urls[0]].close.assert_awaited_once()
+        self.assertFalse(self.client_pool.is_open())
+
+
 class TestParseOfferCreateTransaction(IsolatedAsyncioWrapperTestCase):
     def test_normal_offer_node(self):
         tx = {
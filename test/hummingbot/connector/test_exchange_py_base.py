@@ -0,0 +1,194 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+
+
+class ExchangePyBaseOrderUpdatesTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = BinanceExchange(binance_api_key="testAPIKey",
+                                        binance_api_secret="testSecret",
+                                        trading_pairs=[self.trading_pair])
+        self.requested_orders: List[str] = []
+        self.requests_in_flight = 0
+        self.max_requests_in_flight = 0
+        for i in range(25):
+            self.exchange.start_tracking_order(order_id=f"OID{i}",
+                                               exchange_order_id=f"EOID{i}",
+                                               trading_pair=self.trading_pair,
+                                               trade_type=TradeType.BUY,
+                                               price=Decimal("10"),
+                                               amount=Decimal("1"),
+                                               order_type=OrderType.LIMIT)
+
+    async def track_request(self, order: InFlightOrder):
+        self.requested_orders.append(order.client_order_id)
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        await asyncio.sleep(0.001)
+        self.requests_in_flight -= 1
+
+    def order_update(self, order: InFlightOrder, new_state: OrderState) -> OrderUpdate:
+        return OrderUpdate(trading_pair=order.trading_pair,
+                           update_timestamp=1,
+                           new_state=new_state,
+                           client_order_id=order.client_order_id,
+                           exchange_order_id=order.exchange_order_id)
+
+    def trade_update(self, order: InFlightOrder) -> TradeUpdate:
+        return TradeUpdate(trade_id=f"T{order.client_order_id}",
+                           client_order_id=order.client_order_id,
+                           exchange_order_id=order.exchange_order_id,
+                           trading_pair=order.trading_pair,
+                           fill_timestamp=1,
+                           fill_price=Decimal("10"),
+                           fill_base_amount=Decimal("0.5"),
+                           fill_quote_amount=Decimal("5"),
+                           fee=AddedToCostTradeFee(flat_fees=[TokenAmount(token="HBOT", amount=Decimal("0.01"))]))
+
+    async def test_order_status_requests_run_with_bounded_concurrency(self):
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            await self.track_request(tracked_order)
+            return self.order_update(tracked_order, OrderState.CANCELED)
+
+        self.exchange._request_order_status = request_order_status
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(sorted(f"OID{i}" for i in range(25)), sorted(self.requested_orders))
+        self.assertEqual(self.exchange.ORDER_UPDATES_MAX_CONCURRENCY, self.max_requests_in_flight)
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+
+    async def test_orders_status_bulk_request_only_requests_missing_orders_one_by_one(self):
+        async def request_orders_status(tracked_orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+            # Open orders endpoint, the first five orders are no longer open
+            return {order.client_order_id: self.order_update(order, OrderState.OPEN) for order in tracked_orders[5:]}
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            await self.track_request(tracked_order)
+            return self.order_update(tracked_order, OrderState.CANCELED)
+
+        self.exchange._request_orders_status = request_orders_status
+        self.exchange._request_order_status = request_order_status
+
+        await self.exchange._update_orders()
+
+        self.assertEqual([f"OID{i}" for i in range(5)], sorted(self.requested_orders))
+        self.assertEqual(sorted(f"OID{i}" for i in range(5, 25)), sorted(self.exchange.in_flight_orders.keys()))
+        self.assertTrue(all(order.current_state == OrderState.OPEN
+                            for order in self.exchange.in_flight_orders.values()))
+
+    async def test_failed_orders_status_bulk_request_requests_every_order(self):
+        async def request_orders_status(tracked_orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+            raise IOError("Test error")
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            await self.track_request(tracked_order)
+            return self.order_update(tracked_order, OrderState.OPEN)
+
+        self.exchange._request_orders_status = request_orders_status
+        self.exchange._request_order_status = request_order_status
+
+        await self.exchange._update_orders()
+
+        self.assertEqual(25, len(self.requested_orders))
+
+    async def test_order_failing_to_process_its_bulk_status_is_requested_alone(self):
+        async def request_orders_status(tracked_orders: List[InFlightOrder]) -> Dict[str, OrderUpdate]:
+            return {order.client_order_id: self.order_update(order, OrderState.OPEN) for order in tracked_orders}
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            await self.track_request(tracked_order)
+            return self.order_update(tracked_order, OrderState.CANCELED)
+
+        process_order_update = self.exchange._order_tracker.process_order_update
+
+        def failing_process_order_update(order_update: OrderUpdate):
+            if order_update.client_order_id == "OID3" and order_update.new_state == OrderState.OPEN:
+                raise ValueError("Test error")
+            return process_order_update(order_update)
+
+        self.exchange._request_orders_status = request_orders_status
+        self.exchange._request_order_status = request_order_status
+        self.exchange._order_tracker.process_order_update = failing_process_order_update
+
+        await self.exchange._update_orders()
+        await asyncio.sleep(0)
+
+        self.assertEqual(["OID3"], self.requested_orders)
+        self.assertNotIn("OID3", self.exchange.in_flight_orders)
+        self.assertEqual(24, len(self.exchange.in_flight_orders))
+
+    async def test_orders_fills_requests_run_with_bounded_concurrency(self):
+        async def all_trade_updates_for_order(order: InFlightOrder) -> List[TradeUpdate]:
+            await self.track_request(order)
+            return [self.trade_update(order)]
+
+        self.exchange._all_trade_updates_for_order = all_trade_updates_for_order
+
+        await self.exchange._update_orders_fills(orders=list(self.exchange.in_flight_orders.values()))
+
+        self.assertEqual(25, len(self.requested_orders))
+        self.assertEqual(self.exchange.ORDER_UPDATES_MAX_CONCURRENCY, self.max_requests_in_flight)
+        self.assertTrue(all(order.executed_amount_base == Decimal("0.5")
+                            for order in self.exchange.in_flight_orders.values()))
+
+    async def test_orders_fills_bulk_request_only_requests_missing_orders_one_by_one(self):
+        async def all_trade_updates_for_orders(orders: List[InFlightOrder]) -> Dict[str, List[TradeUpdate]]:
+            return {order.client_order_id: [self.trade_update(order)] if i % 2 == 0 else []
+                    for i, order in enumerate(orders[:20])}
+
+        async def all_trade_updates_for_order(order: InFlightOrder) -> List[TradeUpdate]:
+            await self.track_request(order)
+            return []
+
+        self.exchange._all_trade_updates_for_orders = all_trade_updates_for_orders
+        self.exchange._all_trade_updates_for_order = all_trade_updates_for_order
+
+        await self.exchange._update_orders_fills(orders=list(self.exchange.in_flight_orders.values()))
+
+        self.assertEqual([f"OID{i}" for i in range(20, 25)], sorted(self.requested_orders))
+        filled_orders = [order.client_order_id for order in self.exchange.in_flight_orders.values()
+                         if order.executed_amount_base > 0]
+        self.assertEqual([f"OID{i}" for i in range(0, 20, 2)], filled_orders)
+
+    def test_tracking_states_for_orders_serializes_only_the_given_active_orders(self):
+        states = self.exchange.tracking_states_for_orders(["OID3", "OID7", "UNKNOWN"])
+
+        self.assertEqual(["OID3", "OID7"], sorted(states.keys()))
+        self.assertEqual(self.exchange.tracking_states["OID3"], states["OID3"])
+
+    async def test_order_failing_to_process_its_bulk_trade_updates_is_requested_alone(self):
+        async def all_trade_updates_for_orders(orders: List[InFlightOrder]) -> Dict[str, List[TradeUpdate]]:
+            return {order.client_order_id: [self.trade_update(order)] for order in orders}
+
+        async def all_trade_updates_for_order(order: InFlightOrder) -> List[TradeUpdate]:
+            await self.track_request(order)
+            return [self.trade_update(order)]
+
+        process_trade_update = self.exchange._order_tracker.process_trade_update
+        failed_orders = []
+
+        def failing_process_trade_update(trade_update: TradeUpdate):
+            if trade_update.client_order_id == "OID3" and not failed_orders:
+                failed_orders.append(trade_update.client_order_id)
+                raise ValueError("Test error")
+            return process_trade_update(trade_update)
+
+        self.exchange._all_trade_updates_for_orders = all_trade_updates_for_orders
+        self.exchange._all_trade_updates_for_order = all_trade_updates_for_order
+        self.exchange._order_tracker.process_trade_update = failing_process_trade_update
+
+        await self.exchange._update_orders_fills(orders=list(self.exchange.in_flight_orders.values()))
+
+        self.assertEqual(["OID3"], self.requested_orders)
+        self.assertTrue(all(order.executed_amount_base == Decimal("0.5")
+                            for order in self.exchange.in_flight_orders.values()))
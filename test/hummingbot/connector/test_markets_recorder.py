@@ -1,4 +1,7 @@
 import asyncio
+import os
+import tempfile
+import threading
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -13,20 +16,28 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.market_data_capture import MarketDataCapture
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
@@ -85,6 +96,17 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         )
 
         self.tracking_states = dict()
+        self.serializes_single_orders = False
+        self.restored_states = None
+
+    def tracking_states_for_orders(self, client_order_ids):
+        if not self.serializes_single_orders:
+            return None
+        return {order_id: self.tracking_states[order_id] for order_id in client_order_ids
+                if order_id in self.tracking_states}
+
+    def restore_tracking_states(self, saved_states):
+        self.restored_states = saved_states
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
         pass
@@ -92,6 +114,9 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -970,3 +995,212 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual("integration_test_market", orders[0].market)
         self.assertEqual("BTC-USDT", orders[0].symbol)
         self.assertEqual("NEW_MARKET_OID1", orders[0].id)
+
+    def write_behind_recorder(self, db_path: str) -> MarketsRecorder:
+        # The writer thread needs a database file, an in memory database is not shared between threads
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=db_path
+        )
+        return MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(),
+            write_behind=True,
+        )
+
+    def order_events(self, order_id: str):
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1010.5"),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"T{order_id}",
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642030000,
+            order_id=order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=Decimal(1),
+            quote_asset_amount=Decimal("1010.5"),
+            order_type=OrderType.LIMIT,
+            exchange_order_id=f"E{order_id}",
+        )
+        return create_event, fill_event, complete_event
+
+    def test_write_behind_mode_writes_events_in_background_and_reads_include_pending_writes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = self.write_behind_recorder(os.path.join(directory, "trades.sqlite"))
+            self.tracking_states = {"OID1": {"client_order_id": "OID1"}}
+            create_event, fill_event, complete_event = self.order_events("OID1")
+
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+            trades = recorder.get_trades_for_config(self.config_file_path)
+            orders = recorder.get_orders_for_config_and_market(self.config_file_path, self)
+
+            self.assertEqual(1, len(trades))
+            self.assertEqual(Decimal("1010.5"), Decimal(str(trades[0].price)))
+            self.assertEqual(1, len(orders))
+            self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+            with recorder.sql_manager.get_new_session() as session:
+                statuses = [status.status for status in session.query(Order).one().status]
+                market_states = session.query(MarketState).all()
+                journal_mode = session.connection().exec_driver_sql("PRAGMA journal_mode").scalar()
+            self.assertEqual(["BuyOrderCreated", "OrderFilled", "BuyOrderCompleted"], statuses)
+            # The market states are saved once for the three events
+            self.assertEqual(1, len(market_states))
+            self.assertEqual(self.tracking_states, market_states[0].saved_state)
+            self.assertEqual("wal", journal_mode)
+
+            recorder.stop()
+            self.assertEqual(0, os.path.getsize(os.path.join(directory, "trades.sqlite.pending_writes")))
+
+    def test_write_behind_mode_replays_writes_not_applied_before_stopping(self):
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = os.path.join(directory, "trades.sqlite")
+            recorder = self.write_behind_recorder(db_path)
+            events_recorded = threading.Event()
+
+            def unavailable_database_apply(batch):
+                events_recorded.wait()
+                return False
+
+            # The writer thread never applies the operations, as if the database was unavailable until the bot stopped
+            recorder._write_behind_queue._apply = unavailable_database_apply
+            for order_id in ("OID1", "OID2"):
+                create_event, fill_event, _ = self.order_events(order_id)
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            recorder._put_pending_market_states()
+            events_recorded.set()
+            recorder.stop()
+            # Reads don't wait for the writes the stopped writer thread will never apply
+            self.assertEqual([], recorder.get_trades_for_config(self.config_file_path))
+
+            restarted_recorder = self.write_behind_recorder(db_path)
+
+            trades = restarted_recorder.get_trades_for_config(self.config_file_path)
+            self.assertEqual(["TOID1", "TOID2"], sorted(trade.exchange_trade_id for trade in trades))
+            self.assertEqual(2, len(restarted_recorder.get_orders_for_config_and_market(self.config_file_path, self)))
+            restarted_recorder.stop()
+
+            # Operations already applied are not replayed again
+            recorder_after_restart = self.write_behind_recorder(db_path)
+            self.assertEqual(2, len(recorder_after_restart.get_trades_for_config(self.config_file_path)))
+            with recorder_after_restart.sql_manager.get_new_session() as session:
+                stored_sequence = SQLWriteBehindQueue(recorder_after_restart.sql_manager, {}, "")._get_stored_sequence()
+                self.assertEqual(5, stored_sequence)
+                self.assertEqual(1, session.query(MarketState).count())
+            recorder_after_restart.stop()
+
+    def test_market_states_are_saved_as_deltas_between_full_checkpoints(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(),
+        )
+        recorder.MARKET_STATES_COMPACTION_INTERVAL = 2
+        self.serializes_single_orders = True
+        first_events = self.order_events("OID1")
+        second_events = self.order_events("OID2")
+
+        # The first checkpoint of the session saves all the tracking states
+        self.tracking_states = {"OID1": {"client_order_id": "OID1", "state": "OPEN"}}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, first_events[0])
+        self.tracking_states["OID2"] = {"client_order_id": "OID2", "state": "OPEN"}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, second_events[0])
+        del self.tracking_states["OID1"]
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, first_events[2])
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).one()
+            deltas = recorder.get_market_state_deltas(self.config_file_path, self, session=session)
+            self.assertEqual({"OID1": {"client_order_id": "OID1", "state": "OPEN"}}, market_states.saved_state)
+            self.assertEqual([({"OID2": {"client_order_id": "OID2", "state": "OPEN"}}, []), ({}, ["OID1"])],
+                             [(delta.updated_states, delta.removed_orders) for delta in deltas])
+
+        recorder.restore_market_states(self.config_file_path, self)
+        self.assertEqual({"OID2": {"client_order_id": "OID2", "state": "OPEN"}}, self.restored_states)
+
+        # After two deltas the next checkpoint saves all the tracking states again and removes the deltas
+        self.tracking_states["OID2"] = {"client_order_id": "OID2", "state": "PARTIALLY_FILLED"}
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, second_events[1])
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(self.tracking_states, session.query(MarketState).one().saved_state)
+            self.assertEqual(0, session.query(MarketStateDelta).count())
+
+        recorder.restore_market_states(self.config_file_path, self)
+        self.assertEqual(self.tracking_states, self.restored_states)
+
+    def test_market_data_collection_to_files_captures_order_books_diffs_and_public_trades(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_depth=2,
+                market_data_collection_files=True,
+            ),
+        )
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+        self.order_book_tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        with tempfile.TemporaryDirectory() as directory, patch.object(self, "get_order_book") as get_order_book:
+            get_order_book.return_value = order_book
+            capture = MarketDataCapture(path=directory, depth=2)
+            capture.start()
+            recorder._market_data_capture = capture
+
+            recorder._capture_market_data()
+            # The tracker calls its diff listeners with each diff applied to its books
+            for listener in self.order_book_tracker._diff_listeners:
+                listener(OrderBookMessage(OrderBookMessageType.DIFF,
+                                          {"trading_pair": self.trading_pair, "update_id": 2,
+                                           "bids": [["99", "0"]], "asks": [["100.5", "2"]]},
+                                          timestamp=1640001112.4))
+            order_book.trigger_event(OrderBookEvent.TradeEvent, OrderBookTradeEvent(trading_pair=self.trading_pair,
+                                                                                    timestamp=1640001112.5,
+                                                                                    type=TradeType.SELL,
+                                                                                    price=Decimal("99"),
+                                                                                    amount=Decimal("0.5")))
+            recorder.stop()
+
+            snapshots = capture.read_order_book_snapshots(self.display_name, self.trading_pair)
+            diffs = capture.read_order_book_diffs(self.display_name, self.trading_pair)
+            trades = capture.read_trades(self.display_name, self.trading_pair)
+            np.testing.assert_array_equal([[99, 98]], snapshots["bid_price"])
+            np.testing.assert_array_equal([[99, np.nan]], diffs["bid_price"])
+            np.testing.assert_array_equal([[0, np.nan]], diffs["bid_amount"])
+            np.testing.assert_array_equal([[100.5, np.nan]], diffs["ask_price"])
+            np.testing.assert_array_equal([[1, np.nan]], snapshots["ask_amount"])
+            np.testing.assert_array_equal([1640001112.5], trades["timestamp"])
+            np.testing.assert_array_equal([TradeType.SELL.value], trades["trade_type"])
+            self.assertEqual(0, len(order_book.get_listeners(OrderBookEvent.TradeEvent)))
+            self.assertEqual(0, len(self.order_book_tracker._diff_listeners))
+            with self.manager.get_new_session() as session:
+                self.assertEqual(0, session.query(MarketData).count())
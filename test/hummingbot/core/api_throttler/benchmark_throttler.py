@@ -0,0 +1,52 @@
+"""
+Compares the capacity check cost of AsyncThrottler (task log scan) and SlidingWindowThrottler (rolling windows).
+
+Run with:
+    python -m test.hummingbot.core.api_throttler.benchmark_throttler
+"""
+import asyncio
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+ORDERS = "ORDERS"
+ORDERS_24HR = "ORDERS_24HR"
+ORDER_PATH = "/order"
+TICKER_PATH = "/ticker"
+
+RATE_LIMITS: List[RateLimit] = [
+    RateLimit(limit_id=REQUEST_WEIGHT, limit=12000, time_interval=60),
+    RateLimit(limit_id=ORDERS, limit=5000, time_interval=10),
+    RateLimit(limit_id=ORDERS_24HR, limit=160000, time_interval=86400),
+    RateLimit(limit_id=ORDER_PATH, limit=6000, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 1),
+                             LinkedLimitWeightPair(ORDERS, 1),
+                             LinkedLimitWeightPair(ORDERS_24HR, 1)]),
+    RateLimit(limit_id=TICKER_PATH, limit=6000, time_interval=60,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 2)]),
+]
+
+
+async def run_requests(throttler: AsyncThrottler, request_count: int) -> float:
+    start = time.perf_counter()
+    for i in range(request_count):
+        async with throttler.execute_task(ORDER_PATH if i % 2 == 0 else TICKER_PATH):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    for request_count in (200, 1000, 2000):
+        for throttler_class in (AsyncThrottler, SlidingWindowThrottler):
+            throttler = throttler_class(rate_limits=RATE_LIMITS)
+            elapsed = asyncio.run(run_requests(throttler, request_count))
+            print(f"{throttler_class.__name__:<24} {request_count:>6} requests: "
+                  f"{elapsed * 1e3:9.1f} ms total, {elapsed / request_count * 1e6:8.1f} us per request")
+
+
+if __name__ == "__main__":
+    main()
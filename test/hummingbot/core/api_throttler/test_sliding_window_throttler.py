@@ -0,0 +1,247 @@
+import asyncio
+import random
+import sys
+import time
+import unittest
+from decimal import Decimal
+from typing import Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.sliding_window_throttler import (
+    RateLimitWindow,
+    SlidingWindowRequestContext,
+    SlidingWindowThrottler,
+)
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+        self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
+
+    async def execute_requests(self, no_request: int, limit_id: str, throttler: SlidingWindowThrottler):
+        for _ in range(no_request):
+            async with throttler.execute_task(limit_id=limit_id):
+                self._req_counters[limit_id] += 1
+
+    def test_window_expires_entries_incrementally(self):
+        rate_limit = RateLimit(limit_id="limit", limit=10, time_interval=1)
+        window = RateLimitWindow()
+        window.add(Decimal("100"), rate_limit, 2, 0)
+        window.add(Decimal("100.5"), rate_limit, 3, 0)
+
+        self.assertEqual(5, window.used_capacity(Decimal("101")))
+        self.assertEqual(3, window.used_capacity(Decimal("101.1")))
+        self.assertEqual(1, len(window))
+        self.assertEqual(0, window.used_capacity(Decimal("101.6")))
+        self.assertEqual(0, len(window))
+
+    def test_window_expiry_time_for_capacity_to_free(self):
+        rate_limit = RateLimit(limit_id="limit", limit=10, time_interval=1)
+        window = RateLimitWindow()
+        window.add(Decimal("100"), rate_limit, 2, 0)
+        window.add(Decimal("100.5"), rate_limit, 3, 0)
+
+        self.assertEqual(101, window.expiry_time(1))
+        self.assertEqual(101, window.expiry_time(2))
+        self.assertEqual(101.5, window.expiry_time(3))
+        self.assertIsNone(window.expiry_time(6))
+
+    def test_within_capacity_singular_non_weighted_task(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_PATH_URL, self.throttler))
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.ev_loop.run_until_complete(self.execute_requests(4, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+
+        # 5 + 4 units of the weighted pool are used
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = SlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_PATH_URL, self.throttler))
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.execute_requests(1, TEST_PATH_URL, self.throttler), 1.0)
+            )
+        self.assertEqual(1, self._req_counters[TEST_PATH_URL])
+
+    def test_acquire_wakes_up_when_capacity_frees_without_polling(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)
+        throttler = SlidingWindowThrottler(rate_limits=[rate_limit], retry_interval=10.0)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, throttler))
+
+        start = time.time()
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(self.execute_requests(1, TEST_POOL_ID, throttler), 1.0)
+        )
+
+        self.assertEqual(2, self._req_counters[TEST_POOL_ID])
+        self.assertLess(time.time() - start, 1.0)
+
+    def test_waiting_requests_acquire_in_fifo_order(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.05)
+        throttler = SlidingWindowThrottler(rate_limits=[rate_limit], retry_interval=10.0)
+        acquired = []
+
+        async def request(request_id: int):
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                acquired.append(request_id)
+
+        async def run_requests():
+            tasks = []
+            for request_id in range(5):
+                tasks.append(asyncio.ensure_future(request(request_id)))
+                await asyncio.sleep(0)
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2.0))
+
+        self.assertEqual(list(range(5)), acquired)
+        self.assertEqual(0, len(throttler._waiters[TEST_POOL_ID]))
+
+    def test_cancelled_waiter_wakes_up_next_request(self):
+        rate_limit = RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.1)
+        throttler = SlidingWindowThrottler(rate_limits=[rate_limit], retry_interval=10.0)
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_POOL_ID, throttler))
+
+        async def run_requests():
+            first = asyncio.ensure_future(self.execute_requests(1, TEST_POOL_ID, throttler))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(self.execute_requests(1, TEST_POOL_ID, throttler))
+            await asyncio.sleep(0)
+            first.cancel()
+            await second
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1.0))
+
+        self.assertEqual(2, self._req_counters[TEST_POOL_ID])
+        self.assertEqual(0, len(throttler._waiters[TEST_POOL_ID]))
+
+    @patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext._time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=sys.maxsize, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        windows = {}
+
+        def log(timestamp: float):
+            time_mock.return_value = timestamp
+            SlidingWindowRequestContext(
+                windows=windows,
+                rate_limit=per_millisecond_limit,
+                related_limits=[(per_second_limit, 1)],
+                lock=asyncio.Lock(),
+                safety_margin_pct=0,
+            ).log_task()
+
+        context = SlidingWindowRequestContext(
+            windows=windows,
+            rate_limit=specific_limit,
+            related_limits=[(per_millisecond_limit, 1), (per_second_limit, 1), (specific_limit, 1)],
+            lock=asyncio.Lock(),
+            safety_margin_pct=0,
+        )
+
+        # Scenario where one specific task was executed at 0 milliseconds
+        log(1640000000.0000)
+
+        time_mock.return_value = 1640000000.0100
+        self.assertTrue(context.within_capacity())
+
+        # Add one more occurrence of the same task but at millisecond 1
+        log(1640000000.1000)
+
+        time_mock.return_value = 1640000000.1000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.1900
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2100
+        self.assertTrue(context.within_capacity())
+
+    def test_capacity_matches_task_log_implementation(self):
+        pool = RateLimit(limit_id="pool", limit=20, time_interval=0.7)
+        endpoint_a = RateLimit(limit_id="a", limit=6, time_interval=0.3, weight=2,
+                               linked_limits=[LinkedLimitWeightPair("pool", 3)])
+        endpoint_b = RateLimit(limit_id="b", limit=9, time_interval=1.1,
+                               linked_limits=[LinkedLimitWeightPair("pool", 1)])
+        limits = [(endpoint_a, [(pool, 3)]), (endpoint_b, [(pool, 1)]), (pool, [])]
+        randomizer = random.Random(42)
+        task_logs = []
+        windows = {}
+        now = 1640000000.0
+
+        with patch("hummingbot.core.api_throttler.async_throttler.AsyncRequestContext._time") as log_time_mock, \
+                patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext._time") \
+                as window_time_mock:
+            for _ in range(2000):
+                now = round(now + randomizer.choice([0, 0.001, 0.05, 0.1, 0.3]), 4)
+                log_time_mock.return_value = now
+                window_time_mock.return_value = now
+                rate_limit, related_limits = randomizer.choice(limits)
+                log_context = AsyncRequestContext(task_logs=task_logs,
+                                                  rate_limit=rate_limit,
+                                                  related_limits=related_limits,
+                                                  lock=asyncio.Lock(),
+                                                  safety_margin_pct=0.05)
+                window_context = SlidingWindowRequestContext(windows=windows,
+                                                             rate_limit=rate_limit,
+                                                             related_limits=related_limits,
+                                                             lock=asyncio.Lock(),
+                                                             safety_margin_pct=0.05)
+                within_capacity = log_context.within_capacity()
+                self.assertEqual(within_capacity, window_context.within_capacity())
+                if within_capacity:
+                    task_logs.extend(
+                        [TaskLog(timestamp=now, rate_limit=rate_limit, weight=rate_limit.weight)]
+                        + [TaskLog(timestamp=now, rate_limit=limit, weight=weight) for limit, weight in related_limits]
+                    )
+                    window_context.log_task()
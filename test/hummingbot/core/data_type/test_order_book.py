@@ -5,7 +5,11 @@ import unittest
 
 import numpy as np
 
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.events import OrderFilledEvent
 
 
 class OrderBookUnitTest(unittest.TestCase):
@@ -52,6 +56,260 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries_follow_incremental_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[100 - i, 1 + i * 0.1, 1] for i in range(10)], dtype=np.float64)
+        asks_array = np.array([[101 + i, 2 + i * 0.1, 1] for i in range(10)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        self.assertEqual(102, order_book.get_price_for_volume(True, 3).result_price)
+        self.assertEqual(99, order_book.get_price_for_volume(False, 1.5).result_price)
+
+        # Change a deep ask level and remove a deep bid level
+        order_book.apply_numpy_diffs(np.array([[95, 0, 2]], dtype=np.float64),
+                                     np.array([[105, 10, 2]], dtype=np.float64))
+
+        def walk(entries, volume):
+            cumulative_volume = 0
+            for row in entries:
+                cumulative_volume += row.amount
+                if cumulative_volume >= volume:
+                    return row.price, cumulative_volume
+            return float("nan"), cumulative_volume
+
+        for volume in (0.5, 3, 10, 20, 25.5, 1000):
+            ask_result = order_book.get_price_for_volume(True, volume)
+            bid_result = order_book.get_price_for_volume(False, volume)
+            expected_ask_price, expected_ask_volume = walk(order_book.ask_entries(), volume)
+            expected_bid_price, expected_bid_volume = walk(order_book.bid_entries(), volume)
+            np.testing.assert_equal(expected_ask_price, ask_result.result_price)
+            np.testing.assert_equal(expected_bid_price, bid_result.result_price)
+            self.assertEqual(min(expected_ask_volume, volume), ask_result.result_volume)
+            self.assertEqual(min(expected_bid_volume, volume), bid_result.result_volume)
+
+        volume_result = order_book.get_volume_for_price(True, 105)
+        self.assertEqual(105, volume_result.result_price)
+        self.assertEqual(sum(row.amount for row in order_book.ask_entries() if row.price <= 105),
+                         volume_result.result_volume)
+        quote_result = order_book.get_quote_volume_for_price(False, 96)
+        self.assertEqual(96, quote_result.result_price)
+        self.assertAlmostEqual(sum(row.amount * row.price for row in order_book.bid_entries() if row.price >= 96),
+                               quote_result.result_volume)
+
+        vwap_result = order_book.get_vwap_for_volume(True, 4)
+        self.assertAlmostEqual((101 * 2 + 102 * 2) / 4, vwap_result.result_price)
+
+        # Clearing the whole side invalidates every level
+        order_book.apply_numpy_snapshot(np.empty((0, 3), dtype=np.float64), asks_array)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(False, 1).result_price))
+        self.assertEqual(0, order_book.get_volume_for_price(False, 50).result_volume)
+
+    def test_apply_raw_diffs_matches_order_book_rows(self):
+        raw_bids = [["100.5", "1.25"], ["99.9", "0.5", "extra"], [98, 2.0]]
+        raw_asks = [["101.1", "3"], ["102", "0.000001"]]
+        message = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 7,
+            "bids": raw_bids,
+            "asks": raw_asks,
+        })
+        rows_book = OrderBook()
+        rows_book.apply_diffs(message.bids, message.asks, message.update_id)
+        raw_book = OrderBook()
+        raw_book.apply_raw_diffs(raw_bids, raw_asks, 7)
+
+        self.assertEqual(list(rows_book.bid_entries()), list(raw_book.bid_entries()))
+        self.assertEqual(list(rows_book.ask_entries()), list(raw_book.ask_entries()))
+        self.assertEqual(7, raw_book.last_diff_uid)
+
+        raw_book.apply_raw_diffs([["100.5", "0"]], [[" 101.1 ", "1_0"]], 8)
+        self.assertEqual(99.9, raw_book.get_price(False))
+        self.assertEqual(10.0, next(raw_book.ask_entries()).amount)
+
+        with self.assertRaises(ValueError):
+            raw_book.apply_raw_diffs([["not a price", "1"]], [], 9)
+
+    def test_apply_message_uses_snapshot_and_diff_content(self):
+        order_book = OrderBook()
+        order_book.apply_message(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 10,
+            "bids": [["99", "1"], ["98", "2"]],
+            "asks": [["101", "1"], ["102", "2"]],
+        }))
+        order_book.apply_message(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 11,
+            "bids": [["99", "0"]],
+            "asks": [["100.5", "4"]],
+        }))
+
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(11, order_book.last_diff_uid)
+        self.assertEqual(98, order_book.get_price(False))
+        self.assertEqual(100.5, order_book.get_price(True))
+
+    def test_restore_from_snapshot_only_replays_newer_diffs(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["99", "1"]],
+            "asks": [["101", "1"]],
+        }, timestamp=5)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 1,
+                "bids": [["99.5", "1"]],
+                "asks": [],
+            }, timestamp=1),
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 3,
+                "bids": [],
+                "asks": [["100.5", "2"]],
+            }, timestamp=6),
+        ]
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(100.5, order_book.get_price(True))
+        self.assertEqual(3, order_book.last_diff_uid)
+
+    def test_apply_diff_messages_matches_sequential_diffs(self):
+        messages = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            })
+            for update_id, bids, asks in [
+                (5, [["99", "1"], ["98", "2"]], [["101", "1"]]),
+                (6, [["99", "0"], ["97", "1"]], [["101", "3"], ["102", "1"]]),
+                (7, [["99", "4"]], [["102", "0"]]),
+            ]
+        ]
+        sequential_book = OrderBook()
+        for message in messages:
+            sequential_book.apply_message(message)
+        batch_book = OrderBook()
+        batch_book.apply_diff_messages(messages)
+
+        self.assertEqual(list(sequential_book.bid_entries()), list(batch_book.bid_entries()))
+        self.assertEqual(list(sequential_book.ask_entries()), list(batch_book.ask_entries()))
+        self.assertEqual(7, batch_book.last_diff_uid)
+
+    def test_top_levels(self):
+        order_book = OrderBook()
+        bids_array = np.array([[100 - i, 1 + i, i] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i, 2 + i, i] for i in range(3)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.top_levels(5)
+
+        self.assertEqual((5, 3), bids.shape)
+        np.testing.assert_array_equal([[100, 1, 0], [99, 2, 1], [98, 3, 2], [97, 4, 3], [96, 5, 4]], bids)
+        # The ask side only has three levels
+        np.testing.assert_array_equal([[101, 2, 0], [102, 3, 1], [103, 4, 2]], asks[:3])
+        self.assertTrue(np.isnan(asks[3:]).all())
+        self.assertEqual((0, 3), order_book.top_levels(0)[0].shape)
+
+    def test_composite_top_levels_match_composite_entries(self):
+        order_book = CompositeOrderBook()
+        bids_array = np.array([[100 - i, 1, 1] for i in range(10)], dtype=np.float64)
+        asks_array = np.array([[101 + i, 1, 1] for i in range(10)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        for trade_type, price, amount in [(TradeType.BUY, 101, 1), (TradeType.BUY, 102, 0.4),
+                                          (TradeType.SELL, 99, 0.25), (TradeType.SELL, 100.5, 1)]:
+            order_book.record_filled_order(OrderFilledEvent(timestamp=1, order_id="OID", trading_pair="COINALPHA-HBOT",
+                                                            trade_type=trade_type, order_type=None, price=price,
+                                                            amount=amount, trade_fee=None))
+
+        bids, asks = order_book.top_levels(4)
+
+        np.testing.assert_array_equal([[102, 0.6, 1], [103, 1, 1], [104, 1, 1], [105, 1, 1]], asks)
+        np.testing.assert_array_equal([[100, 1, 1], [99, 0.75, 1], [98, 1, 1], [97, 1, 1]], bids)
+        self.assertEqual([tuple(row) for row in bids], list(order_book.bid_entries())[:4])
+        self.assertEqual([tuple(row) for row in asks], list(order_book.ask_entries())[:4])
+
+    def test_composite_depth_queries_follow_fills_and_diffs(self):
+        order_book = CompositeOrderBook()
+        bids_array = np.array([[100 - i, 1, 1] for i in range(10)], dtype=np.float64)
+        asks_array = np.array([[101 + i, 1, 1] for i in range(10)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        def fill(trade_type, price, amount):
+            order_book.record_filled_order(OrderFilledEvent(timestamp=1, order_id="OID", trading_pair="COINALPHA-HBOT",
+                                                            trade_type=trade_type, order_type=None, price=price,
+                                                            amount=amount, trade_fee=None))
+
+        def assert_queries_match_entries():
+            for is_buy, entries in ((True, list(order_book.ask_entries())), (False, list(order_book.bid_entries()))):
+                self.assertEqual(entries[0].price, order_book.get_price(is_buy))
+                for volume in (0.5, 2, 4.5, 1000):
+                    cumulative_volume, expected_price = 0, float("nan")
+                    for row in entries:
+                        cumulative_volume += row.amount
+                        if cumulative_volume >= volume:
+                            expected_price = row.price
+                            break
+                    result = order_book.get_price_for_volume(is_buy, volume)
+                    np.testing.assert_equal(expected_price, result.result_price)
+
+        assert_queries_match_entries()
+        fill(TradeType.SELL, 98, 2.5)
+        fill(TradeType.BUY, 102, 0.5)
+        assert_queries_match_entries()
+        self.assertNotIn(98, [row.price for row in order_book.bid_entries()])
+        self.assertEqual(3.5, order_book.get_volume_for_price(True, 104).result_volume)
+
+        # A new diff on a level covered by a fill is netted against it
+        order_book.apply_numpy_diffs(np.array([[98, 3, 2]], dtype=np.float64), np.empty((0, 3)))
+        assert_queries_match_entries()
+        self.assertIn((98, 2, 2), list(order_book.bid_entries()))
+        self.assertEqual(4, order_book.get_volume_for_price(False, 98).result_volume)
+
+        # A buy crossing the traded bids truncates them, restoring those composite bid levels
+        fill(TradeType.BUY, 97.5, 0.5)
+        assert_queries_match_entries()
+        self.assertIn((98, 3, 2), list(order_book.bid_entries()))
+
+        order_book.clear_traded_order_book()
+        assert_queries_match_entries()
+        self.assertEqual(101, order_book.get_price(True))
+
+    def test_watched_level_records_its_lowest_amount(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[100, 5, 1], [99, 3, 1]], dtype=np.float64),
+                                        np.array([[101, 2, 1]], dtype=np.float64))
+        order_book.watch_level(True, 100)
+        order_book.watch_level(True, 100)
+
+        order_book.apply_numpy_diffs(np.array([[100, 1, 2]], dtype=np.float64), np.empty((0, 3)))
+        order_book.apply_numpy_diffs(np.array([[100, 8, 3]], dtype=np.float64), np.empty((0, 3)))
+
+        self.assertEqual(8, order_book.get_level_amount(True, 100))
+        self.assertEqual(1, order_book.pop_level_low_amount(True, 100))
+        # Popping the level records again from its current amount
+        self.assertEqual(8, order_book.pop_level_low_amount(True, 100))
+
+        # A snapshot without the level empties it
+        order_book.apply_numpy_snapshot(np.array([[99, 3, 4]], dtype=np.float64),
+                                        np.array([[101, 2, 4]], dtype=np.float64))
+        order_book.apply_numpy_diffs(np.array([[100, 4, 5]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(0, order_book.pop_level_low_amount(True, 100))
+
+        # The level stays watched until all its watchers unwatched it
+        order_book.unwatch_level(True, 100)
+        order_book.apply_numpy_diffs(np.array([[100, 2, 6]], dtype=np.float64), np.empty((0, 3)))
+        order_book.unwatch_level(True, 100)
+        order_book.apply_numpy_diffs(np.array([[100, 4, 7]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(4, order_book.pop_level_low_amount(True, 100))
+        self.assertEqual(0, order_book.get_level_amount(False, 100))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
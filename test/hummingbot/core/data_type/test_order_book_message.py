@@ -1,6 +1,9 @@
+import bisect
 import time
 import unittest
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -247,3 +250,43 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_hash_is_consistent_with_equality(self):
+        diff1 = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1}, timestamp=1)
+        diff2 = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1}, timestamp=2)
+        diff3 = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 2}, timestamp=1)
+        trade = OrderBookMessage(OrderBookMessageType.TRADE, {"trade_id": 1}, timestamp=1)
+
+        self.assertEqual(hash(diff1), hash(diff2))
+        self.assertNotEqual(diff1, diff3)
+        self.assertEqual({diff1, diff3, trade}, {diff2, diff3, trade})
+
+    def test_snapshot_sorts_between_diffs_by_update_id(self):
+        diffs = [OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": update_id}, timestamp=update_id)
+                 for update_id in range(1, 6)]
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 3}, timestamp=10)
+
+        self.assertFalse(snapshot < diffs[2])
+        self.assertFalse(diffs[2] < snapshot)
+        self.assertTrue(snapshot < diffs[3])
+        self.assertEqual(3, bisect.bisect_right(diffs, snapshot))
+
+    def test_parsed_rows_are_cached(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 12,
+                "asks": [["1.5", "2"], ["3", "0"]],
+                "bids": [["1.25", "6", "extra"]],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        np.testing.assert_array_equal(np.array([[1.5, 2, 12], [3, 0, 12]]), msg.asks_array)
+        np.testing.assert_array_equal(np.array([[1.25, 6, 12]]), msg.bids_array)
+        self.assertEqual(np.float64, msg.bids_array.dtype)
+
+        empty_msg = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1, "asks": [], "bids": []})
+        self.assertEqual((0, 3), empty_msg.asks_array.shape)
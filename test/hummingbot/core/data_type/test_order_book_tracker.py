@@ -826,6 +826,99 @@ class OrderBookTrackerDynamicPairTests(IsolatedAsyncioWrapperTestCase):
         self.assertNotIn(pair_to_remove, tracker._past_diffs_windows)
         self.assertNotIn(pair_to_remove, tracker._saved_message_queues)
 
+    def _diff_message(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": "BTC-USDT",
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            },
+            timestamp=time.time(),
+        )
+
+    async def test_track_single_book_coalesces_pending_diffs(self):
+        """Test that pending diffs are merged and applied as a single batch."""
+        tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs,
+            coalesce_diffs=True,
+        )
+        order_book = create_order_book_with_snapshot_uid(100)
+        tracker._order_books["BTC-USDT"] = order_book
+        message_queue = asyncio.Queue()
+        tracker._tracking_message_queues["BTC-USDT"] = message_queue
+        applied_diffs = []
+        tracker.add_diff_listener(applied_diffs.append)
+
+        message_queue.put_nowait(self._diff_message(101, [["99.5", "1"]], [["100.5", "2"]]))
+        message_queue.put_nowait(self._diff_message(102, [["99.5", "3"]], []))
+        message_queue.put_nowait(self._diff_message(103, [["100", "0"]], [["100.5", "0"], ["102", "1"]]))
+
+        track_task = asyncio.create_task(tracker._track_single_book("BTC-USDT"))
+        await asyncio.sleep(0.1)
+        track_task.cancel()
+
+        try:
+            await track_task
+        except asyncio.CancelledError:
+            pass
+
+        self.assertEqual(103, order_book.last_diff_uid)
+        self.assertEqual(99.5, order_book.get_price(False))
+        self.assertEqual(3, next(order_book.bid_entries()).amount)
+        self.assertEqual(101, order_book.get_price(True))
+        self.assertEqual(3, len(tracker._past_diffs_windows["BTC-USDT"]))
+        self.assertEqual([101, 102, 103], [message.update_id for message in applied_diffs])
+
+        pair_metrics = tracker.metrics.per_pair_metrics["BTC-USDT"]
+        self.assertEqual(1, pair_metrics.diff_batches_applied)
+        self.assertEqual(3, pair_metrics.diffs_coalesced)
+        self.assertEqual(3.0, pair_metrics.coalescing_ratio)
+        self.assertEqual(2, pair_metrics.max_queue_depth)
+        self.assertEqual(3.0, tracker.metrics.coalescing_ratio)
+        self.assertEqual(3.0, tracker.metrics.to_dict()["coalescing_ratio"])
+
+    async def test_track_single_book_coalescing_stops_at_snapshot(self):
+        """Test that a snapshot waiting behind diffs is applied after the diff batch."""
+        tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=self.trading_pairs,
+            coalesce_diffs=True,
+        )
+        order_book = create_order_book_with_snapshot_uid(100)
+        tracker._order_books["BTC-USDT"] = order_book
+        message_queue = asyncio.Queue()
+        tracker._tracking_message_queues["BTC-USDT"] = message_queue
+
+        message_queue.put_nowait(self._diff_message(101, [["99.5", "1"]], []))
+        message_queue.put_nowait(OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "trading_pair": "BTC-USDT",
+                "update_id": 101,
+                "bids": [["98", "1"]],
+                "asks": [["103", "1"]],
+            },
+            timestamp=time.time(),
+        ))
+        message_queue.put_nowait(self._diff_message(102, [], [["102", "1"]]))
+
+        track_task = asyncio.create_task(tracker._track_single_book("BTC-USDT"))
+        await asyncio.sleep(0.1)
+        track_task.cancel()
+
+        try:
+            await track_task
+        except asyncio.CancelledError:
+            pass
+
+        self.assertEqual(101, order_book.snapshot_uid)
+        self.assertEqual(98, order_book.get_price(False))
+        self.assertEqual(102, order_book.get_price(True))
+        self.assertEqual(2, tracker.metrics.per_pair_metrics["BTC-USDT"].diff_batches_applied)
+
 
 class LatencyStatsEdgeCasesTests(unittest.TestCase):
     """Edge case tests for LatencyStats."""
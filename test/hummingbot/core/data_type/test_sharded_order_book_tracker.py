@@ -0,0 +1,221 @@
+import asyncio
+import queue
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from hummingbot.connector.test_support.mock_order_tracker import MockOrderTracker
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.sharded_order_book_tracker import (
+    ADD_TRADING_PAIR,
+    RELEASED_SLOT_SEQUENCE,
+    REMOVE_TRADING_PAIR,
+    PublicTradeForwarder,
+    ShardedOrderBookTracker,
+    _order_book_worker_loop,
+)
+from hummingbot.core.data_type.shared_memory_order_book import publish_order_book
+from hummingbot.core.data_type.shared_memory_order_book_tracker import _unlink_shared_memory
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+
+def order_book(best_bid: float, best_ask: float, update_id: int = 1) -> OrderBook:
+    book = OrderBook()
+    book.apply_numpy_snapshot(np.array([[best_bid, 1, update_id], [best_bid - 1, 2, update_id]], dtype=np.float64),
+                              np.array([[best_ask, 1, update_id], [best_ask + 1, 2, update_id]], dtype=np.float64))
+    return book
+
+
+class ShardedOrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
+        self.tracker = ShardedOrderBookTracker(connector_name="binance",
+                                               data_source=MagicMock(),
+                                               trading_pairs=list(self.trading_pairs),
+                                               worker_processes=2,
+                                               depth=5,
+                                               publish_interval=0.001,
+                                               spare_slots=1)
+        self.started_workers = []
+        self.tracker._start_worker = self.start_worker
+        self.tracker._stop_worker = lambda shard: None
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def start_worker(self, shard):
+        shard.commands = queue.Queue()
+        shard.process = MagicMock()
+        shard.process.is_alive.return_value = True
+        self.started_workers.append(shard)
+
+    def publish(self, trading_pair: str, book: OrderBook):
+        shard = next(shard for shard in self.tracker.shards if trading_pair in shard.slots)
+        publish_order_book(shard.rows[shard.slots[trading_pair]], book, 5, 1.0)
+
+    def test_trading_pairs_are_split_between_workers(self):
+        self.assertEqual([{"BTC-USDT": 0, "SOL-USDT": 1}, {"ETH-USDT": 0}],
+                         [shard.slots for shard in self.tracker.shards])
+        self.assertEqual([3, 3], [shard.capacity for shard in self.tracker.shards])
+
+    async def test_order_books_are_ready_once_published_by_the_workers(self):
+        self.tracker.start()
+        self.assertEqual(2, len(self.started_workers))
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+
+        for i, trading_pair in enumerate(self.trading_pairs[:2]):
+            self.publish(trading_pair, order_book(100 + i, 101 + i))
+        await asyncio.sleep(0.01)
+        self.assertFalse(self.tracker.ready)
+
+        self.publish("SOL-USDT", order_book(20, 21))
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+        self.assertEqual(101, self.tracker.order_books["ETH-USDT"].get_price(False))
+        self.assertEqual(21, self.tracker.order_books["SOL-USDT"].get_price(True))
+
+    async def test_dead_worker_is_restarted_and_the_tracker_waits_for_its_books(self):
+        self.tracker._worker_check_interval = 0.001
+        self.tracker.start()
+        for trading_pair in self.trading_pairs:
+            self.publish(trading_pair, order_book(100, 101))
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+        dead_shard = self.tracker.shards[0]
+        dead_shard.process.is_alive.return_value = False
+        await asyncio.sleep(0.02)
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual(3, len(self.started_workers))
+        self.assertIs(dead_shard, self.started_workers[-1])
+
+        self.publish("BTC-USDT", order_book(200, 201))
+        await asyncio.sleep(0.01)
+        self.assertFalse(self.tracker.ready)
+        self.publish("SOL-USDT", order_book(20, 21))
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+        self.assertEqual(200, self.tracker.order_books["BTC-USDT"].get_price(False))
+        self.assertEqual(3, len(self.started_workers))
+
+    async def test_forwarded_trades_are_applied_to_the_order_books(self):
+        self.tracker.start()
+        trade_logger = EventLogger()
+        self.tracker.order_books["ETH-USDT"].add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        trade = OrderBookTradeEvent(trading_pair="ETH-USDT", timestamp=1.0, type=TradeType.BUY,
+                                    price=Decimal("2000"), amount=Decimal("0.5"))
+        self.tracker._trades.put(trade)
+
+        await trade_logger.wait_for(OrderBookTradeEvent, timeout_seconds=1)
+
+        self.assertEqual(trade, trade_logger.event_log[0])
+        self.assertEqual(1, self.tracker.metrics.total_trades_processed)
+
+    async def test_trading_pairs_are_added_to_the_least_used_worker(self):
+        self.tracker.start()
+        for trading_pair in self.trading_pairs:
+            self.publish(trading_pair, order_book(100, 101))
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+        self.assertTrue(await self.tracker.add_trading_pair("XRP-USDT"))
+        shard = self.tracker.shards[1]
+        self.assertEqual((ADD_TRADING_PAIR, "XRP-USDT", 1), shard.commands.get_nowait())
+        self.assertEqual(0, self.tracker.order_books["XRP-USDT"].sequence)
+        self.publish("XRP-USDT", order_book(0.5, 0.6))
+        self.assertEqual(0.5, self.tracker.order_books["XRP-USDT"].get_price(False))
+
+        self.assertTrue(await self.tracker.remove_trading_pair("BTC-USDT"))
+        self.assertEqual((REMOVE_TRADING_PAIR, "BTC-USDT", 0), self.tracker.shards[0].commands.get_nowait())
+        self.assertNotIn("BTC-USDT", self.tracker.order_books)
+
+        # The slot of the removed trading pair is not reused before the worker released it
+        self.assertTrue(await self.tracker.add_trading_pair("ADA-USDT"))
+        self.assertEqual((ADD_TRADING_PAIR, "ADA-USDT", 2), self.tracker.shards[0].commands.get_nowait())
+        self.assertTrue(await self.tracker.add_trading_pair("DOT-USDT"))
+        self.assertFalse(await self.tracker.add_trading_pair("LTC-USDT"))
+
+        self.tracker.shards[0].rows[0, 0] = RELEASED_SLOT_SEQUENCE
+        self.assertTrue(await self.tracker.add_trading_pair("LTC-USDT"))
+        self.assertEqual((ADD_TRADING_PAIR, "LTC-USDT", 0), self.tracker.shards[0].commands.get_nowait())
+        self.assertEqual(0, self.tracker.order_books["LTC-USDT"].sequence)
+        # Both workers are full
+        self.assertFalse(await self.tracker.add_trading_pair("BNB-USDT"))
+
+
+class OrderBookWorkerTests(IsolatedAsyncioWrapperTestCase):
+    def test_trades_dropped_while_the_queue_is_full_are_counted_and_logged(self):
+        trades = queue.Queue(maxsize=1)
+        forwarder = PublicTradeForwarder(trades, log_interval=60)
+        trade = OrderBookTradeEvent(trading_pair="BTC-USDT", timestamp=1.0, type=TradeType.SELL,
+                                    price=Decimal("100"), amount=Decimal("1"))
+
+        with patch.object(ShardedOrderBookTracker, "logger") as logger_mock:
+            for _ in range(4):
+                forwarder(trade)
+
+        self.assertEqual(trade, trades.get_nowait())
+        self.assertEqual(3, forwarder.dropped_trades)
+        logger_mock.return_value.warning.assert_called_once()
+        self.assertIn("Dropped 1 public trades", logger_mock.return_value.warning.call_args[0][0])
+
+    async def test_worker_publishes_the_order_books_and_forwards_trades(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook, shared_row_size
+
+        source_tracker = MockOrderTracker()
+        source_tracker._order_books["BTC-USDT"] = order_book(100, 101)
+        source_tracker.add_trading_pair = MagicMock()
+        connector = MagicMock(order_book_tracker=source_tracker)
+        connector_setting = MagicMock()
+        connector_setting.non_trading_connector_instance_with_default_configuration.return_value = connector
+        shared_memory = SharedMemory(create=True, size=2 * shared_row_size(5) * 8)
+        rows = np.ndarray((2, shared_row_size(5)), dtype=np.float64, buffer=shared_memory.buf)
+        rows[:] = np.nan
+        rows[:, 0] = 0
+        commands = queue.Queue()
+        trades = queue.Queue()
+
+        with patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings",
+                   return_value={"binance": connector_setting}):
+            worker = asyncio.ensure_future(_order_book_worker_loop(
+                "binance", {"BTC-USDT": 0}, shared_memory.name, 2, 5, 0.001, commands, trades))
+            await asyncio.sleep(0.02)
+
+            book = SharedMemoryOrderBook(rows[0], 5)
+            self.assertEqual(2, book.sequence)
+            self.assertEqual(100, book.get_price(False))
+            # Nothing changed, so the book is not published again
+            await asyncio.sleep(0.01)
+            self.assertEqual(2, book.sequence)
+
+            source_tracker._order_books["BTC-USDT"].apply_numpy_diffs(
+                np.array([[100.5, 3, 2]], dtype=np.float64), np.empty((0, 3)))
+            trade = OrderBookTradeEvent(trading_pair="BTC-USDT", timestamp=1.0, type=TradeType.SELL,
+                                        price=Decimal("100"), amount=Decimal("1"))
+            source_tracker._order_books["BTC-USDT"].apply_trade(trade)
+            await asyncio.sleep(0.01)
+            self.assertEqual(100.5, book.get_price(False))
+            self.assertEqual(trade, trades.get_nowait())
+
+            commands.put((ADD_TRADING_PAIR, "ETH-USDT", 1))
+            source_tracker._order_books["ETH-USDT"] = order_book(2000, 2001)
+            await asyncio.sleep(0.01)
+            source_tracker.add_trading_pair.assert_called_once_with("ETH-USDT")
+            self.assertEqual(2001, SharedMemoryOrderBook(rows[1], 5).get_price(True))
+
+            source_tracker.remove_trading_pair = AsyncMock()
+            commands.put((REMOVE_TRADING_PAIR, "ETH-USDT", 1))
+            await asyncio.sleep(0.01)
+            self.assertEqual(RELEASED_SLOT_SEQUENCE, rows[1, 0])
+
+            commands.put(None)
+            await asyncio.wait_for(worker, timeout=1)
+
+        del book, rows
+        shared_memory.close()
+        _unlink_shared_memory(shared_memory)
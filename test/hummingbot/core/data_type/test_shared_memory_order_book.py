@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.shared_memory_order_book import (
+    SharedMemoryOrderBook,
+    publish_order_book,
+    shared_row_size,
+)
+
+
+class SharedMemoryOrderBookTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.depth = 3
+        self.row = np.full(shared_row_size(self.depth), np.nan)
+        self.row[0] = 0
+        self.source = OrderBook()
+        self.order_book = SharedMemoryOrderBook(self.row, self.depth)
+
+    def apply_snapshot(self, bids, asks, update_id: int):
+        self.source.apply_numpy_snapshot(
+            np.array([[price, amount, update_id] for price, amount in bids], dtype=np.float64),
+            np.array([[price, amount, update_id] for price, amount in asks], dtype=np.float64))
+
+    def test_empty_row_has_no_price(self):
+        with self.assertRaises(EnvironmentError):
+            self.order_book.get_price(True)
+        self.assertEqual([], list(self.order_book.bid_entries()))
+
+    def test_published_levels_are_read_from_the_row(self):
+        self.apply_snapshot([(100, 1), (99, 2), (98, 3), (97, 4)], [(101, 1), (102, 2)], update_id=7)
+        self.source.last_trade_price = 100.5
+        publish_order_book(self.row, self.source, self.depth, 1700000000.0)
+
+        self.assertEqual(2, self.order_book.sequence)
+        self.assertEqual(1700000000.0, self.order_book.published_timestamp)
+        self.assertEqual(100, self.order_book.get_price(False))
+        self.assertEqual(101, self.order_book.get_price(True))
+        self.assertEqual(100.5, self.order_book.last_trade_price)
+        # Only the published depth is visible
+        self.assertEqual([(100, 1, 7), (99, 2, 7), (98, 3, 7)],
+                         [tuple(row) for row in self.order_book.bid_entries()])
+        self.assertEqual([(101, 1, 7), (102, 2, 7)], [tuple(row) for row in self.order_book.ask_entries()])
+        self.assertEqual(102, self.order_book.get_price_for_volume(True, 2).result_price)
+        bids, asks = self.order_book.top_levels(4)
+        np.testing.assert_array_equal([100, 99, 98, np.nan], bids[:, 0])
+
+    def test_updates_are_seen_after_each_publication(self):
+        self.apply_snapshot([(100, 1)], [(101, 1)], update_id=1)
+        publish_order_book(self.row, self.source, self.depth, 1.0)
+        self.assertEqual(1, self.order_book.get_vwap_for_volume(False, 1).result_volume)
+
+        self.source.apply_numpy_diffs(np.array([[100, 0, 2], [99.5, 5, 2]], dtype=np.float64), np.empty((0, 3)))
+        publish_order_book(self.row, self.source, self.depth, 2.0)
+
+        self.assertEqual(4, self.order_book.sequence)
+        self.assertEqual(99.5, self.order_book.get_price(False))
+        self.assertEqual([(99.5, 5, 2)], [tuple(row) for row in self.order_book.bid_entries()])
+
+    def test_row_being_written_is_not_read(self):
+        self.apply_snapshot([(100, 1)], [(101, 1)], update_id=1)
+        publish_order_book(self.row, self.source, self.depth, 1.0)
+        self.assertEqual([(100, 1, 1)], [tuple(row) for row in self.order_book.bid_entries()])
+
+        # A writer in another process started to write the row and wrote one level so far
+        self.row[0] += 1
+        self.row[4] = 90
+
+        self.assertEqual([(100, 1, 1)], [tuple(row) for row in self.order_book.bid_entries()])
@@ -0,0 +1,158 @@
+import asyncio
+import time
+import uuid
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
+from hummingbot.core.data_type.shared_memory_order_book import publish_order_book
+from hummingbot.core.data_type.shared_memory_order_book_tracker import OrderBookSegment, SharedMemoryOrderBookTracker
+
+
+def order_book(best_bid: float, best_ask: float) -> OrderBook:
+    book = OrderBook()
+    book.apply_numpy_snapshot(np.array([[best_bid, 1, 1]], dtype=np.float64),
+                              np.array([[best_ask, 1, 1]], dtype=np.float64))
+    return book
+
+
+class OrderBookSegmentTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector_name = f"test_{uuid.uuid4().hex[:8]}"
+        self.segments = []
+
+    def tearDown(self) -> None:
+        for segment in reversed(self.segments):
+            segment.close()
+        super().tearDown()
+
+    def create(self, trading_pairs, depth: int = 3, **kwargs) -> OrderBookSegment:
+        segment = OrderBookSegment.create(self.connector_name, trading_pairs, depth, **kwargs)
+        self.segments.append(segment)
+        return segment
+
+    def attach(self) -> OrderBookSegment:
+        segment = OrderBookSegment.attach(self.connector_name)
+        self.segments.append(segment)
+        return segment
+
+    def test_attached_segment_sees_the_published_order_books(self):
+        segment = self.create(["BTC-USDT", "ETH-USDT"])
+        publish_order_book(segment.rows[1], order_book(2000, 2001), 3, 1.0)
+        segment.beat(123.0)
+
+        attached = self.attach()
+
+        self.assertEqual({"BTC-USDT": 0, "ETH-USDT": 1}, attached.slots)
+        self.assertEqual(3, attached.depth)
+        self.assertEqual(123.0, attached.heartbeat)
+        self.assertEqual(segment.generation, attached.generation)
+        self.assertEqual(0, attached.rows[0, 0])
+        self.assertEqual(2000, attached.rows[1, 4])
+
+    def test_segment_still_published_is_not_replaced(self):
+        segment = self.create(["BTC-USDT"])
+        segment.beat(time.time())
+
+        with self.assertRaises(FileExistsError):
+            self.create(["ETH-USDT"])
+
+    def test_stale_segment_is_replaced(self):
+        segment = self.create(["BTC-USDT"])
+        segment.beat(time.time() - 60)
+
+        self.create(["ETH-USDT"], stale_timeout=10)
+
+        self.assertEqual({"ETH-USDT": 0}, self.attach().slots)
+
+    def test_attaching_to_a_segment_not_published_fails(self):
+        with self.assertRaises(FileNotFoundError):
+            OrderBookSegment.attach(self.connector_name)
+
+    def test_trading_pairs_longer_than_the_directory_names_are_rejected(self):
+        with self.assertRaises(ValueError):
+            OrderBookSegment.create(self.connector_name, ["A" * 40 + "-USDT"], 3)
+
+
+class SharedMemoryOrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector_name = f"test_{uuid.uuid4().hex[:8]}"
+        self.segment = None
+        self.tracker = SharedMemoryOrderBookTracker(connector_name=self.connector_name,
+                                                    data_source=MagicMock(),
+                                                    trading_pairs=["BTC-USDT", "ETH-USDT"],
+                                                    poll_interval=0.001)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        if self.segment is not None:
+            self.segment.close()
+        super().tearDown()
+
+    def publish_segment(self, trading_pairs, best_bid: float = 100):
+        if self.segment is not None:
+            self.segment.close()
+        self.segment = OrderBookSegment.create(self.connector_name, trading_pairs, 3)
+        for slot in range(len(trading_pairs)):
+            publish_order_book(self.segment.rows[slot], order_book(best_bid + slot, best_bid + slot + 1), 3, 1.0)
+        self.segment.beat(time.time())
+
+    def test_data_source_type(self):
+        self.assertEqual(OrderBookTrackerDataSourceType.SHARED_MEMORY, self.tracker.data_source_type)
+
+    async def test_tracker_attaches_once_the_order_books_are_published(self):
+        self.tracker.start()
+        await asyncio.sleep(0.01)
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual({}, self.tracker.order_books)
+
+        self.publish_segment(["ETH-USDT", "BTC-USDT", "SOL-USDT"])
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+        self.assertEqual({"BTC-USDT", "ETH-USDT"}, set(self.tracker.order_books))
+        self.assertEqual(101, self.tracker.order_books["BTC-USDT"].get_price(False))
+        self.assertEqual(101, self.tracker.order_books["ETH-USDT"].get_price(True))
+
+    async def test_tracker_attaches_again_when_the_daemon_restarts(self):
+        self.publish_segment(["BTC-USDT", "ETH-USDT"])
+        self.tracker.start()
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+        self.segment.beat(time.time() - 60)
+        self.publish_segment(["BTC-USDT", "ETH-USDT"], best_bid=200)
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(200, self.tracker.order_books["BTC-USDT"].get_price(False))
+
+    async def test_tracker_is_not_ready_while_the_daemon_does_not_beat(self):
+        self.publish_segment(["BTC-USDT", "ETH-USDT"])
+        self.tracker.start()
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+        self.segment.beat(time.time() - 60)
+        await asyncio.sleep(0.05)
+        self.assertFalse(self.tracker.ready)
+
+        self.segment.beat(time.time())
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(100, self.tracker.order_books["BTC-USDT"].get_price(False))
+
+    async def test_only_published_trading_pairs_can_be_added(self):
+        self.publish_segment(["BTC-USDT", "ETH-USDT", "SOL-USDT"])
+        self.tracker.start()
+        await asyncio.wait_for(self.tracker.wait_ready(), timeout=1)
+
+        self.assertTrue(await self.tracker.add_trading_pair("SOL-USDT"))
+        self.assertEqual(102, self.tracker.order_books["SOL-USDT"].get_price(False))
+        self.assertFalse(await self.tracker.add_trading_pair("XRP-USDT"))
+
+        self.assertTrue(await self.tracker.remove_trading_pair("BTC-USDT"))
+        self.assertNotIn("BTC-USDT", self.tracker.order_books)
+        self.assertFalse(await self.tracker.remove_trading_pair("BTC-USDT"))
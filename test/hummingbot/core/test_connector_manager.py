@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.connector_manager import ConnectorManager
 
 
@@ -72,7 +73,8 @@ class ConnectorManagerTest(IsolatedAsyncioWrapperTestCase):
         # Verify paper trade market was called with correct params
         mock_create_paper_trade.assert_called_once_with(
             "binance",
-            ["BTC-USDT", "ETH-USDT"]
+            ["BTC-USDT", "ETH-USDT"],
+            queue_position_fills=False,
         )
 
         # Verify balances were set
@@ -116,6 +118,59 @@ class ConnectorManagerTest(IsolatedAsyncioWrapperTestCase):
         mock_conn_setting.conn_init_parameters.assert_called_once()
         mock_connector_class.assert_called_once()
 
+    @patch("hummingbot.core.connector_manager.get_connector_class")
+    @patch("hummingbot.core.connector_manager.Security")
+    @patch("hummingbot.core.connector_manager.AllConnectorSettings")
+    def test_create_live_connector_with_order_book_worker_processes(self, mock_settings, mock_security,
+                                                                    mock_get_class):
+        self.client_config.order_book_worker_processes = 3
+        self.client_config.coalesce_order_book_diffs = True
+        mock_security.api_keys.return_value = {"api_key": "test_key", "api_secret": "test_secret"}
+        mock_conn_setting = Mock()
+        mock_conn_setting.conn_init_parameters.return_value = {}
+        mock_settings.get_connector_settings.return_value = {"binance": mock_conn_setting}
+        mock_connector = Mock(spec=ExchangePyBase)
+        mock_get_class.return_value = Mock(return_value=mock_connector)
+
+        self.connector_manager.create_connector("binance", ["BTC-USDT"], trading_required=True)
+
+        mock_connector.use_order_book_worker_processes.assert_called_once_with(3)
+        mock_connector.use_coalesced_order_book_diffs.assert_not_called()
+
+    @patch("hummingbot.core.connector_manager.get_connector_class")
+    @patch("hummingbot.core.connector_manager.Security")
+    @patch("hummingbot.core.connector_manager.AllConnectorSettings")
+    def test_create_live_connector_with_shared_memory_order_books(self, mock_settings, mock_security, mock_get_class):
+        self.client_config.shared_memory_order_books = True
+        self.client_config.order_book_worker_processes = 3
+        mock_security.api_keys.return_value = {"api_key": "test_key", "api_secret": "test_secret"}
+        mock_conn_setting = Mock()
+        mock_conn_setting.conn_init_parameters.return_value = {}
+        mock_settings.get_connector_settings.return_value = {"binance": mock_conn_setting}
+        mock_connector = Mock(spec=ExchangePyBase)
+        mock_get_class.return_value = Mock(return_value=mock_connector)
+
+        self.connector_manager.create_connector("binance", ["BTC-USDT"], trading_required=True)
+
+        mock_connector.use_shared_memory_order_books.assert_called_once()
+        mock_connector.use_order_book_worker_processes.assert_not_called()
+
+    @patch("hummingbot.core.connector_manager.get_connector_class")
+    @patch("hummingbot.core.connector_manager.Security")
+    @patch("hummingbot.core.connector_manager.AllConnectorSettings")
+    def test_create_live_connector_with_coalesced_order_book_diffs(self, mock_settings, mock_security, mock_get_class):
+        self.client_config.coalesce_order_book_diffs = True
+        mock_security.api_keys.return_value = {"api_key": "test_key", "api_secret": "test_secret"}
+        mock_conn_setting = Mock()
+        mock_conn_setting.conn_init_parameters.return_value = {}
+        mock_settings.get_connector_settings.return_value = {"binance": mock_conn_setting}
+        mock_connector = Mock(spec=ExchangePyBase)
+        mock_get_class.return_value = Mock(return_value=mock_connector)
+
+        self.connector_manager.create_connector("binance", ["BTC-USDT"], trading_required=True)
+
+        mock_connector.use_coalesced_order_book_diffs.assert_called_once()
+
     @patch("hummingbot.core.connector_manager.Security")
     def test_create_live_connector_no_api_keys(self, mock_security):
         """Test creating a live connector without API keys raises error"""
@@ -0,0 +1,51 @@
+import asyncio
+import uuid
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from hummingbot.connector.test_support.mock_order_tracker import MockOrderTracker
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.shared_memory_order_book_tracker import SharedMemoryOrderBookTracker
+from hummingbot.core.market_data_daemon import MarketDataDaemon
+
+
+class MarketDataDaemonTests(IsolatedAsyncioWrapperTestCase):
+    async def test_published_order_books_are_read_by_the_bots(self):
+        connector_name = f"test_{uuid.uuid4().hex[:8]}"
+        source_tracker = MockOrderTracker()
+        source_tracker.start = MagicMock()
+        source_tracker.stop = MagicMock()
+        book = OrderBook()
+        book.apply_numpy_snapshot(np.array([[100, 1, 1]], dtype=np.float64), np.array([[101, 1, 1]], dtype=np.float64))
+        source_tracker._order_books["BTC-USDT"] = book
+        connector_setting = MagicMock()
+        connector_setting.non_trading_connector_instance_with_default_configuration.return_value = MagicMock(
+            order_book_tracker=source_tracker)
+        daemon = MarketDataDaemon({connector_name: ["BTC-USDT", "ETH-USDT"]}, depth=5, publish_interval=0.001)
+        bot_tracker = SharedMemoryOrderBookTracker(connector_name=connector_name,
+                                                   data_source=MagicMock(),
+                                                   trading_pairs=["BTC-USDT"],
+                                                   poll_interval=0.001)
+
+        with patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings",
+                   return_value={connector_name: connector_setting}):
+            run_task = asyncio.ensure_future(daemon.run())
+            bot_tracker.start()
+            await asyncio.wait_for(bot_tracker.wait_ready(), timeout=1)
+
+            self.assertEqual(100, bot_tracker.order_books["BTC-USDT"].get_price(False))
+            source_tracker.start.assert_called_once()
+            connector_setting.non_trading_connector_instance_with_default_configuration.assert_called_once_with(
+                trading_pairs=["BTC-USDT", "ETH-USDT"])
+
+            book.apply_numpy_diffs(np.array([[100.5, 2, 2]], dtype=np.float64), np.empty((0, 3)))
+            await asyncio.sleep(0.01)
+            self.assertEqual(100.5, bot_tracker.order_books["BTC-USDT"].get_price(False))
+
+            daemon.stop()
+            await asyncio.wait_for(run_task, timeout=1)
+
+        source_tracker.stop.assert_called_once()
+        bot_tracker.stop()
@@ -0,0 +1,41 @@
+import json
+import math
+import unittest
+
+from hummingbot.core.utils import json_decoder
+from hummingbot.core.utils.json_decoder import JSON_DECODERS, json_decoder_name, json_loads, use_json_decoder
+
+
+class JSONDecoderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.initial_decoder = json_decoder_name()
+
+    def tearDown(self) -> None:
+        use_json_decoder(self.initial_decoder)
+        super().tearDown()
+
+    def test_fast_decoder_is_selected_when_installed(self):
+        self.assertEqual("orjson" if json_decoder.orjson is not None else "json", self.initial_decoder)
+
+    def test_all_decoders_return_the_same_documents(self):
+        document = '{"e":"depthUpdate","E":1700000000123,"s":"BTCUSDT","b":[["36500.10","0.5"]],"a":[],"x":1.5e-3}'
+        for name in JSON_DECODERS:
+            use_json_decoder(name)
+            self.assertEqual(json.loads(document), json_loads(document))
+            self.assertEqual(json.loads(document), json_loads(document.encode()))
+
+    def test_documents_rejected_by_the_fast_decoder_fall_back_to_the_standard_library(self):
+        self.assertTrue(math.isnan(json_loads('{"price": NaN}')["price"]))
+        self.assertEqual(2 ** 70, json_loads(str(2 ** 70)))
+
+    def test_invalid_documents_raise_json_decode_error(self):
+        for name in JSON_DECODERS:
+            use_json_decoder(name)
+            with self.assertRaises(json.JSONDecodeError):
+                json_loads("pong")
+
+    def test_unknown_decoder_is_rejected(self):
+        with self.assertRaises(ValueError):
+            use_json_decoder("simdjson")
+        self.assertEqual(self.initial_decoder, json_decoder_name())
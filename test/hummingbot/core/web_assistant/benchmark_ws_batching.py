@@ -0,0 +1,81 @@
+"""
+Compares routing websocket messages to the data source queues one at a time (`iter_messages`) and in batches
+(`iter_message_batches`), when the messages arrive in bursts of several frames.
+
+Run with:
+    python -m test.hummingbot.core.web_assistant.benchmark_ws_batching
+"""
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import aiohttp
+from aiohttp._websocket.reader import WebSocketDataQueue
+
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+MESSAGE = json.dumps({"e": "trade", "E": 1700000000123, "s": "BTCUSDT", "t": 3263958127, "p": "36512.01000000",
+                      "q": "0.00150000", "T": 1700000000122, "m": False})
+
+
+class BufferedWebSocket:
+    """Stands for the aiohttp websocket, with the frames received from the socket waiting in its aiohttp reader."""
+
+    def __init__(self):
+        self._reader = WebSocketDataQueue(MagicMock(_reading_paused=False), 2 ** 30, loop=asyncio.get_running_loop())
+        self.closed = False
+
+    def feed(self, count: int):
+        for _ in range(count):
+            self._reader.feed_data(aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, MESSAGE, None), len(MESSAGE))
+
+    async def receive(self, timeout=None) -> aiohttp.WSMessage:
+        return await self._reader.read()
+
+
+async def run(message_count: int, burst_size: int, batched: bool) -> float:
+    websocket = BufferedWebSocket()
+    connection = WSConnection(aiohttp_client_session=None)
+    connection._connection = websocket
+    connection._connected = True
+    assistant = WSAssistant(connection)
+    queue = asyncio.Queue()
+
+    async def route():
+        if batched:
+            async for responses in assistant.iter_message_batches():
+                for response in responses:
+                    queue.put_nowait(response.data)
+        else:
+            async for response in assistant.iter_messages():
+                queue.put_nowait(response.data)
+
+    async def consume():
+        for _ in range(message_count):
+            await queue.get()
+
+    router = asyncio.ensure_future(route())
+    consumer = asyncio.ensure_future(consume())
+    start = time.perf_counter()
+    for _ in range(message_count // burst_size):
+        websocket.feed(burst_size)
+        await asyncio.sleep(0)
+    await consumer
+    elapsed = time.perf_counter() - start
+    router.cancel()
+    return elapsed
+
+
+def main():
+    message_count = 50000
+    for burst_size in (1, 5, 20, 100):
+        for batched in (False, True):
+            elapsed = asyncio.run(run(message_count, burst_size, batched))
+            print(f"{'batches' if batched else 'messages':<8} bursts of {burst_size:>3}: "
+                  f"{elapsed / message_count * 1e6:6.2f} us per message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares the cost of decoding exchange payloads with each of the JSON decoders available to `json_loads`.
+
+Run with:
+    python -m test.hummingbot.core.web_assistant.connections.benchmark_json_decoding
+"""
+import json
+import time
+from typing import Dict
+
+from hummingbot.core.utils.json_decoder import JSON_DECODERS, json_loads, use_json_decoder
+
+
+def levels(best_price: float, step: float, count: int) -> str:
+    return json.dumps([[f"{best_price + step * i:.2f}", f"{0.001 * (i % 97 + 1):.8f}"] for i in range(count)])
+
+
+# Payloads shaped like the messages recorded on the exchange streams and REST endpoints
+PAYLOADS: Dict[str, str] = {
+    "binance trade": (
+        '{"e":"trade","E":1700000000123,"s":"BTCUSDT","t":3263958127,"p":"36512.01000000","q":"0.00150000",'
+        '"b":23408563231,"a":23408563129,"T":1700000000122,"m":false,"M":true}'
+    ),
+    "binance depth diff": (
+        '{"e":"depthUpdate","E":1700000000123,"s":"BTCUSDT","U":40121873041,"u":40121873089,'
+        f'"b":{levels(36512.0, -0.01, 20)},"a":{levels(36512.01, 0.01, 20)}}}'
+    ),
+    "okx books": (
+        '{"arg":{"channel":"books","instId":"BTC-USDT"},"action":"update","data":[{'
+        f'"asks":{json.dumps([level + ["0", "3"] for level in json.loads(levels(36512.1, 0.1, 12))])},'
+        f'"bids":{json.dumps([level + ["0", "2"] for level in json.loads(levels(36512.0, -0.1, 12))])},'
+        '"ts":"1700000000123","checksum":-1200119424,"seqId":123456,"prevSeqId":123450}]}'
+    ),
+    "kucoin ticker": (
+        '{"type":"message","topic":"/market/ticker:BTC-USDT","subject":"trade.ticker","data":{"bestAsk":"36512.1",'
+        '"bestAskSize":"0.59468432","bestBid":"36512","bestBidSize":"1.31224158","price":"36512.1",'
+        '"sequence":"7635812094","size":"0.0001","time":1700000000123}}'
+    ),
+    "binance depth snapshot (1000 levels)": (
+        f'{{"lastUpdateId":40121873040,"bids":{levels(36512.0, -0.01, 1000)},"asks":{levels(36512.01, 0.01, 1000)}}}'
+    ),
+}
+
+
+def measure(payload: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        json_loads(payload)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    for payload_name, payload in PAYLOADS.items():
+        iterations = max(200, 2_000_000 // len(payload))
+        for decoder_name in JSON_DECODERS:
+            use_json_decoder(decoder_name)
+            for payload_type, document in (("str", payload), ("bytes", payload.encode())):
+                elapsed = measure(document, iterations)
+                print(f"{payload_name:<38} {len(payload):>7} B {decoder_name:<7} {payload_type:<5}: "
+                      f"{elapsed * 1e6:9.2f} us per message")
+
+
+if __name__ == "__main__":
+    main()
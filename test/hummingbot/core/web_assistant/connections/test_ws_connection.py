@@ -2,10 +2,11 @@ import asyncio
 import json
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from typing import List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 from aiohttp import WebSocketError
+from aiohttp._websocket.reader import WebSocketDataQueue
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
@@ -282,3 +283,72 @@ class WSConnectionTest(IsolatedAsyncioWrapperTestCase):
         await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
 
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_plain_text(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.ws_connection.connect(self.ws_url)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = await self.ws_connection.receive()
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_batch_reads_the_buffered_messages(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        await self.ws_connection.connect(self.ws_url)
+        for message in ({"one": 1}, {"two": 2}, {"three": 3}):
+            self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, json.dumps(message))
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                ws_connect_mock.return_value, message="", message_type=aiohttp.WSMsgType.PONG
+            )
+
+        with patch.object(self.ws_connection, "_buffered_message_count", side_effect=[5, 4, 3]):
+            responses = await self.ws_connection.receive_batch(max_batch_size=2)
+        self.assertEqual([{"one": 1}, {"two": 2}], [response.data for response in responses])
+        self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+        with patch.object(self.ws_connection, "_buffered_message_count", side_effect=[1, 0]):
+            responses = await self.ws_connection.receive_batch()
+        self.assertEqual([{"three": 3}], [response.data for response in responses])
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_batch_counts_the_messages_buffered_by_the_aiohttp_reader(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        reader = WebSocketDataQueue(MagicMock(_reading_paused=False), 2 ** 16, loop=asyncio.get_running_loop())
+        ws_connect_mock.return_value._reader = reader
+
+        async def receive(timeout=None):
+            return await reader.read()
+
+        ws_connect_mock.return_value.receive.side_effect = receive
+        await self.ws_connection.connect(self.ws_url)
+        for message in ({"one": 1}, {"two": 2}, {"three": 3}):
+            data = json.dumps(message)
+            reader.feed_data(aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, data, None), len(data))
+
+        self.assertEqual(3, self.ws_connection._buffered_message_count())
+        responses = await self.ws_connection.receive_batch()
+
+        self.assertEqual([{"one": 1}, {"two": 2}, {"three": 3}], [response.data for response in responses])
+        self.assertEqual(0, self.ws_connection._buffered_message_count())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_receive_batch_returns_the_messages_read_before_the_connection_closed(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        ws_connect_mock.return_value.close_code = 1111
+        await self.ws_connection.connect(self.ws_url)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, json.dumps({"one": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message="", message_type=aiohttp.WSMsgType.CLOSE
+        )
+
+        with patch.object(self.ws_connection, "_buffered_message_count", return_value=1):
+            responses = await self.ws_connection.receive_batch()
+
+        self.assertEqual([{"one": 1}], [response.data for response in responses])
+        self.assertFalse(self.ws_connection.connected)
+        with self.assertRaises(ConnectionError):
+            await self.ws_connection.receive_batch()
+        self.assertEqual([], await self.ws_connection.receive_batch())
@@ -159,6 +159,24 @@ class WSAssistantTest(IsolatedAsyncioWrapperTestCase):
 
         self.assertEqual(data, response.data)
 
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive_batch")
+    async def test_iter_message_batches(self, receive_batch_mock):
+        class SomePostProcessor(WSPostProcessorBase):
+            async def post_process(self, response_: WSResponse) -> WSResponse:
+                response_.data["two"] = 2
+                return response_
+
+        ws_assistant = WSAssistant(
+            connection=self.ws_connection, ws_post_processors=[SomePostProcessor()]
+        )
+        receive_batch_mock.side_effect = [[WSResponse({"one": 1}), WSResponse({"one": 11})], []]
+
+        batches = [batch async for batch in ws_assistant.iter_message_batches(max_batch_size=10)]
+
+        self.assertEqual([[{"one": 1, "two": 2}, {"one": 11, "two": 2}]],
+                         [[response.data for response in batch] for batch in batches])
+        receive_batch_mock.assert_called_with(max_batch_size=10)
+
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive")
     async def test_receive_post_processes(self, receive_mock):
         class SomePostProcessor(WSPostProcessorBase):
@@ -2,6 +2,7 @@ import asyncio
 import json
 import os
 import re
+import tempfile
 import time
 from abc import ABC
 from collections import deque
@@ -14,6 +15,8 @@ from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
@@ -90,6 +93,22 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_rebuilt_only_when_candles_change(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        first_df = self.data_feed.candles_df
+        first_df["indicator"] = 1.0
+
+        cached_df = self.data_feed._candles_df
+        self.assertNotIn("indicator", self.data_feed.candles_df.columns)
+        self.assertIs(cached_df, self.data_feed._candles_df)
+
+        last_candle = self.data_feed._candles[-1]
+        last_candle[4] += 1
+        self.data_feed._candles[-1] = last_candle
+
+        self.assertEqual(last_candle[4], self.data_feed.candles_df["close"].iloc[-1])
+        self.assertIsNot(cached_df, self.data_feed._candles_df)
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -416,3 +435,44 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
             result = await self.data_feed.get_historical_candles(config)
             self.assertIsInstance(result, pd.DataFrame)
             mock_fetch_candles.assert_called_once()
+
+    async def test_get_historical_candles_fetches_only_ranges_missing_in_store(self):
+        interval = self.data_feed.interval_in_seconds
+        first_timestamp = 1622505600 - 1622505600 % interval
+        candles = np.array([[first_timestamp + i * interval, 100, 101, 99, 100.5, 10, 0, 0, 0, 0] for i in range(20)],
+                           dtype=float)
+        requested_ranges = []
+
+        async def fetch_candles(start_time, end_time, limit):
+            requested_ranges.append((start_time, end_time))
+            return candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time)]
+
+        def config(first_index: int, last_index: int) -> HistoricalCandlesConfig:
+            return HistoricalCandlesConfig(connector_name="test",
+                                           trading_pair=self.trading_pair,
+                                           interval=self.data_feed.interval,
+                                           start_time=int(candles[first_index][0]),
+                                           end_time=int(candles[last_index][0]))
+
+        with tempfile.TemporaryDirectory() as store_path, \
+                patch.object(self.data_feed, "initialize_exchange_data", new_callable=AsyncMock), \
+                patch.object(self.data_feed, "fetch_candles", side_effect=fetch_candles), \
+                patch.object(self.data_feed, "_time", return_value=candles[15][0] + 1):
+            self.data_feed.candles_store = CandlesStore(path=store_path)
+
+            result = await self.data_feed.get_historical_candles(config(5, 10))
+            np.testing.assert_array_equal(candles[5:11], result.values)
+
+            requested_ranges.clear()
+            result = await self.data_feed.get_historical_candles(config(0, 15))
+            np.testing.assert_array_equal(candles[0:16], result.values)
+            self.assertTrue(all(end < candles[5][0] or start > candles[10][0] for start, end in requested_ranges))
+
+            # The candle at index 15 was still open, so it was not stored
+            self.assertEqual((candles[0][0], candles[14][0]),
+                             self.data_feed.candles_store.covered_range("test", self.trading_pair, interval))
+
+            requested_ranges.clear()
+            result = await self.data_feed.get_historical_candles(config(2, 12))
+            np.testing.assert_array_equal(candles[2:13], result.values)
+            self.assertEqual([], requested_ranges)
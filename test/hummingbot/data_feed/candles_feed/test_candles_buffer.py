@@ -0,0 +1,86 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+COLUMNS = ["timestamp", "open", "close"]
+
+
+class CandlesBufferTests(unittest.TestCase):
+
+    @staticmethod
+    def candle(timestamp: float):
+        return [timestamp, timestamp + 0.5, timestamp + 0.25]
+
+    def assert_same_as_deque(self, buffer: CandlesBuffer, expected: deque):
+        self.assertEqual(len(expected), len(buffer))
+        self.assertEqual([list(candle) for candle in expected], list(buffer))
+        np.testing.assert_array_equal(np.array(expected, dtype=float).reshape(-1, len(COLUMNS)), buffer.values)
+
+    def test_append_drops_oldest_candles_when_full(self):
+        buffer = CandlesBuffer(columns=COLUMNS, maxlen=3)
+        expected = deque(maxlen=3)
+        for timestamp in range(10):
+            buffer.append(self.candle(timestamp))
+            expected.append(self.candle(timestamp))
+            self.assert_same_as_deque(buffer, expected)
+
+        self.assertEqual(self.candle(7), buffer[0])
+        self.assertEqual(self.candle(9), buffer[-1])
+        with self.assertRaises(IndexError):
+            buffer[3]
+
+    def test_operations_match_deque(self):
+        randomizer = np.random.RandomState(7)
+        buffer = CandlesBuffer(columns=COLUMNS, maxlen=5)
+        expected = deque(maxlen=5)
+        timestamp = 0
+        for _ in range(500):
+            operation = randomizer.randint(6)
+            timestamp += 1
+            if operation == 0:
+                buffer.append(self.candle(timestamp))
+                expected.append(self.candle(timestamp))
+            elif operation == 1:
+                buffer.appendleft(self.candle(timestamp))
+                expected.appendleft(self.candle(timestamp))
+            elif operation == 2:
+                candles = [self.candle(timestamp + i) for i in range(randomizer.randint(8))]
+                buffer.extend(candles)
+                expected.extend(candles)
+            elif operation == 3:
+                candles = [self.candle(timestamp + i) for i in range(randomizer.randint(8))]
+                buffer.extendleft(np.array(candles).reshape(-1, len(COLUMNS)))
+                expected.extendleft(candles)
+            elif operation == 4 and len(expected) > 0:
+                buffer[-1] = self.candle(timestamp)
+                expected[-1] = self.candle(timestamp)
+            elif operation == 5 and randomizer.randint(10) == 0:
+                buffer.clear()
+                expected.clear()
+            self.assert_same_as_deque(buffer, expected)
+
+    def test_version_changes_on_every_update(self):
+        buffer = CandlesBuffer(columns=COLUMNS, maxlen=3)
+        versions = [buffer.version]
+        buffer.append(self.candle(1))
+        versions.append(buffer.version)
+        buffer[-1] = self.candle(2)
+        versions.append(buffer.version)
+        buffer.clear()
+        versions.append(buffer.version)
+
+        self.assertEqual(len(versions), len(set(versions)))
+
+    def test_rows_are_copies_and_column_is_a_view(self):
+        buffer = CandlesBuffer(columns=COLUMNS, maxlen=3)
+        buffer.append(self.candle(1))
+        row = buffer[-1]
+        close = buffer.column("close")
+
+        buffer[-1] = self.candle(2)
+
+        self.assertEqual(self.candle(1), row)
+        self.assertEqual(2.25, close[-1])
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(path=self._temporary_directory.name)
+
+    def tearDown(self) -> None:
+        self._temporary_directory.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def candles(first_timestamp: int, count: int, close: float = 100.0) -> np.ndarray:
+        return np.array([[first_timestamp + i * 60, close, close, close, close, 1, 0, 0, 0, 0] for i in range(count)],
+                        dtype=float)
+
+    def test_empty_store(self):
+        self.assertIsNone(self.store.covered_range("binance", "BTC-USDT", 60))
+        self.assertEqual(0, len(self.store.read("binance", "BTC-USDT", 60, 0, 1000)))
+
+    def test_write_and_read_range(self):
+        candles = self.candles(6000, 10)
+        self.store.write("binance", "BTC-USDT", 60, candles, start_time=6000, end_time=6540)
+
+        self.assertEqual((6000, 6540), self.store.covered_range("binance", "BTC-USDT", 60))
+        np.testing.assert_array_equal(candles[2:5], self.store.read("binance", "BTC-USDT", 60, 6120, 6240))
+        self.assertEqual(0, len(self.store.read("binance_perpetual", "BTC-USDT", 60, 6000, 6540)))
+        self.assertFalse(any(file_name.endswith(".tmp") for file_name in os.listdir(self.store.path)))
+
+    def test_interleaved_writes_of_the_same_file_use_their_own_temporary_files(self):
+        path = os.path.join(self.store.path, "candles.json")
+
+        def write_interrupted_by_another_writer(file):
+            file.write(b"first")
+            CandlesStore._replace_file(path, lambda other_file: other_file.write(b"second"))
+
+        CandlesStore._replace_file(path, write_interrupted_by_another_writer)
+
+        with open(path, "rb") as file:
+            self.assertEqual(b"first", file.read())
+        self.assertEqual(["candles.json"], os.listdir(self.store.path))
+
+    def test_write_extends_range_and_keeps_stored_candles(self):
+        self.store.write("binance", "BTC-USDT", 60, self.candles(6000, 10), start_time=6000, end_time=6540)
+        self.store.write("binance", "BTC-USDT", 60, self.candles(6300, 10, close=200), start_time=6300, end_time=6840)
+        self.store.write("binance", "BTC-USDT", 60, self.candles(5400, 10, close=300), start_time=5400, end_time=5940)
+
+        stored_candles = self.store.read("binance", "BTC-USDT", 60, 0, 10000)
+        self.assertEqual((5400, 6840), self.store.covered_range("binance", "BTC-USDT", 60))
+        np.testing.assert_array_equal(np.arange(5400, 6900, 60), stored_candles[:, 0])
+        self.assertEqual([300] * 10 + [100] * 10 + [200] * 5, stored_candles[:, 4].tolist())
+
+    def test_write_range_without_candles(self):
+        self.store.write("binance", "BTC-USDT", 60, np.empty((0, 10)), start_time=6000, end_time=6540)
+        self.store.write("binance", "BTC-USDT", 60, self.candles(6600, 2), start_time=6600, end_time=6660)
+
+        self.assertEqual((6000, 6660), self.store.covered_range("binance", "BTC-USDT", 60))
+        self.assertEqual(2, len(self.store.read("binance", "BTC-USDT", 60, 0, 10000)))
+
+    def test_write_raises_for_not_contiguous_range(self):
+        self.store.write("binance", "BTC-USDT", 60, self.candles(6000, 10), start_time=6000, end_time=6540)
+
+        with self.assertRaises(ValueError):
+            self.store.write("binance", "BTC-USDT", 60, self.candles(9000, 10), start_time=9000, end_time=9540)
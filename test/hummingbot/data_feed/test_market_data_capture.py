@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.data_feed.market_data_capture import MarketDataCapture
+
+
+class MarketDataCaptureTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._temporary_directory = tempfile.TemporaryDirectory()
+        self.capture = MarketDataCapture(path=self._temporary_directory.name, depth=3, rows_per_file=4,
+                                         max_file_duration=100)
+
+    def tearDown(self) -> None:
+        self._temporary_directory.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def order_book(mid_price: float, levels: int) -> OrderBook:
+        order_book = OrderBook(dex=False)
+        bids = np.array([[mid_price - i - 1, i + 1, 1] for i in range(levels)], dtype=np.float64)
+        asks = np.array([[mid_price + i + 1, i + 1, 1] for i in range(levels)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids, asks)
+        return order_book
+
+    def captured_files(self, connector_name: str):
+        return sorted(os.listdir(os.path.join(self.capture.path, connector_name)))
+
+    def test_order_book_top_levels_are_written_to_rotating_files(self):
+        self.capture.start()
+        for i in range(10):
+            self.capture.record_order_book("binance", "BTC-USDT", 1000 + i, self.order_book(100 + i, 2 + i))
+        self.capture.stop()
+
+        # Four rows per file, the last two rows written when stopping
+        self.assertEqual(["BTC-USDT_order_book_1000000_0.npz", "BTC-USDT_order_book_1004000_0.npz",
+                          "BTC-USDT_order_book_1008000_0.npz"], self.captured_files("binance"))
+        snapshots = self.capture.read_order_book_snapshots("binance", "BTC-USDT")
+        np.testing.assert_array_equal(np.arange(1000, 1010), snapshots["timestamp"])
+        self.assertEqual((10, 3), snapshots["bid_price"].shape)
+        # The first book only has two levels on each side
+        np.testing.assert_array_equal([99, 98, np.nan], snapshots["bid_price"][0])
+        np.testing.assert_array_equal([1, 2, np.nan], snapshots["ask_amount"][0])
+        np.testing.assert_array_equal([110, 111, 112], snapshots["ask_price"][9])
+
+        in_range = self.capture.read_order_book_snapshots("binance", "BTC-USDT", start_time=1005, end_time=1008)
+        np.testing.assert_array_equal([1005, 1006, 1007, 1008], in_range["timestamp"])
+        np.testing.assert_array_equal([106, 107, 108, 109], in_range["ask_price"][:, 0])
+
+    def test_files_rotate_after_max_file_duration(self):
+        self.capture.start()
+        for timestamp in (1000, 1050, 1100, 1120):
+            self.capture.record_order_book("binance", "ETH-USDT", timestamp, self.order_book(100, 3))
+        self.capture.stop()
+
+        self.assertEqual(["ETH-USDT_order_book_1000000_0.npz", "ETH-USDT_order_book_1100000_0.npz"],
+                         self.captured_files("binance"))
+
+    def test_trades_are_written_and_read_by_time_range(self):
+        self.capture.start()
+        for i in range(6):
+            trade = OrderBookTradeEvent(trading_pair="BTC-USDT",
+                                        timestamp=2000 + i,
+                                        type=TradeType.BUY if i % 2 == 0 else TradeType.SELL,
+                                        price=Decimal("100.5") + i,
+                                        amount=Decimal("0.25"))
+            self.capture.record_trade("kucoin", trade)
+        self.capture.stop()
+
+        trades = self.capture.read_trades("kucoin", "BTC-USDT", start_time=2001)
+        np.testing.assert_array_equal([2001, 2002, 2003, 2004, 2005], trades["timestamp"])
+        np.testing.assert_array_equal([101.5, 102.5, 103.5, 104.5, 105.5], trades["price"])
+        np.testing.assert_array_equal([0.25] * 5, trades["amount"])
+        np.testing.assert_array_equal([2, 1, 2, 1, 2], trades["trade_type"])
+        self.assertEqual(0, len(self.capture.read_trades("kucoin", "ETH-USDT")["timestamp"]))
+
+    def test_diffs_are_split_into_rows_of_the_captured_depth(self):
+        self.capture.start()
+        self.capture.record_diff("binance", "BTC-USDT", 1000,
+                                 np.array([[99, 1, 5], [98, 0, 5], [97, 2, 5], [96, 1, 5]]), np.empty((0, 3)))
+        self.capture.record_diff("binance", "BTC-USDT", 1001, np.empty((0, 3)), np.array([[101, 3, 6]]))
+        self.capture.stop()
+
+        diffs = self.capture.read_order_book_diffs("binance", "BTC-USDT")
+        # The first diff changes more bid levels than the depth, so it takes two rows
+        np.testing.assert_array_equal([1000, 1000, 1001], diffs["timestamp"])
+        np.testing.assert_array_equal([[99, 98, 97], [96, np.nan, np.nan], [np.nan] * 3], diffs["bid_price"])
+        np.testing.assert_array_equal([[1, 0, 2], [1, np.nan, np.nan], [np.nan] * 3], diffs["bid_amount"])
+        np.testing.assert_array_equal([[np.nan] * 3, [np.nan] * 3, [101, np.nan, np.nan]], diffs["ask_price"])
+        self.assertEqual(0, len(self.capture.read_order_book_snapshots("binance", "BTC-USDT")["timestamp"]))
+
+    def test_files_starting_in_the_same_millisecond_are_all_kept(self):
+        self.capture.start()
+        for price in range(6):
+            trade = OrderBookTradeEvent(trading_pair="BTC-USDT", timestamp=3000.0001, type=TradeType.BUY,
+                                        price=Decimal(100 + price), amount=Decimal("1"))
+            self.capture.record_trade("kucoin", trade)
+        self.capture.flush()
+        self.capture.record_order_book("kucoin", "BTC-USDT", 3000.0002, self.order_book(100, 3))
+        self.capture.record_order_book("kucoin", "BTC-USDT", 3000.0003, self.order_book(101, 3))
+        self.capture.flush()
+        self.capture.record_order_book("kucoin", "BTC-USDT", 3000.0004, self.order_book(102, 3))
+        self.capture.stop()
+
+        self.assertEqual(["BTC-USDT_order_book_3000000_0.npz", "BTC-USDT_order_book_3000000_1.npz",
+                          "BTC-USDT_trades_3000000_0.npz", "BTC-USDT_trades_3000000_1.npz"],
+                         self.captured_files("kucoin"))
+        np.testing.assert_array_equal(np.arange(100, 106), self.capture.read_trades("kucoin", "BTC-USDT")["price"])
+        snapshots = self.capture.read_order_book_snapshots("kucoin", "BTC-USDT", start_time=3000.0001)
+        np.testing.assert_array_equal([101, 102, 103], snapshots["ask_price"][:, 0])
+
+    def test_rows_are_dropped_when_the_writer_is_behind(self):
+        capture = MarketDataCapture(path=self._temporary_directory.name, depth=3, rows_per_file=2,
+                                    max_pending_files=1)
+        # The writer thread is not started, so the second file can't be queued
+        for i in range(4):
+            capture.record_order_book("binance", "BTC-USDT", 1000 + i, self.order_book(100, 3))
+
+        self.assertEqual(2, capture.dropped_rows)
+        capture.start()
+        capture.stop()
+        np.testing.assert_array_equal([1000, 1001],
+                                      capture.read_order_book_snapshots("binance", "BTC-USDT")["timestamp"])
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from sqlalchemy.exc import OperationalError
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.directory.name, "test.sqlite")
+        self.journal_path = f"{self.db_path}.pending_writes"
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=self.db_path
+        )
+        self.manager.enable_write_ahead_log()
+        self.batches: List[List[str]] = []
+        self.received_payloads: List[Dict[str, Any]] = []
+        self.unavailable_attempts = 0
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def create_queue(self) -> SQLWriteBehindQueue:
+        return SQLWriteBehindQueue(sql=self.manager,
+                                   writers={"set": self.set_value, "fail": self.fail, "unavailable": self.unavailable},
+                                   journal_path=self.journal_path,
+                                   max_batch_size=3,
+                                   retry_interval=0.01)
+
+    def set_value(self, session, payload: Dict[str, Any]):
+        self.received_payloads.append(payload)
+        session.add(Metadata(key=payload["key"], value=str(payload["value"])))
+
+    def fail(self, session, payload: Dict[str, Any]):
+        raise ValueError("Test error")
+
+    def unavailable(self, session, payload: Dict[str, Any]):
+        # The database is unavailable for the first attempts
+        if self.unavailable_attempts < payload["attempts"]:
+            self.unavailable_attempts += 1
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        self.set_value(session, payload)
+
+    def stored_values(self) -> Dict[str, str]:
+        with self.manager.get_new_session() as session:
+            return {metadata.key: metadata.value for metadata in session.query(Metadata).all()
+                    if metadata.key.startswith("key")}
+
+    def test_operations_are_applied_in_order_by_the_writer_thread(self):
+        queue = self.create_queue()
+        queue.start()
+
+        for i in range(10):
+            queue.put("set", {"key": f"key{i}", "value": Decimal(i) / 4})
+
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual({f"key{i}": str(Decimal(i) / 4) for i in range(10)}, self.stored_values())
+        self.assertEqual([f"key{i}" for i in range(10)], [payload["key"] for payload in self.received_payloads])
+        self.assertEqual(0, queue.pending_count)
+        self.assertEqual(0, os.path.getsize(self.journal_path))
+        queue.stop()
+
+    def test_failed_operation_is_discarded_without_losing_the_rest_of_the_batch(self):
+        queue = self.create_queue()
+        queue.start()
+
+        queue.put("set", {"key": "key1", "value": 1})
+        queue.put("fail", {})
+        queue.put("set", {"key": "key2", "value": 2})
+        queue.stop()
+
+        self.assertEqual({"key1": "1", "key2": "2"}, self.stored_values())
+
+    def test_replay_applies_only_operations_not_stored_as_applied(self):
+        queue = self.create_queue()
+        queue.start()
+        queue.put("set", {"key": "key1", "value": 1})
+        queue.stop()
+        # Journal left by a process that stopped before applying the last two operations. The first one was applied.
+        with open(self.journal_path, "w") as journal:
+            journal.write('{"sequence": 1, "operation": "set", "payload": {"key": "key1", "value": 1}}\n')
+            journal.write('{"sequence": 2, "operation": "set", "payload": {"key": "key2", '
+                          '"value": {"__decimal__": "0.25"}}}\n')
+            journal.write('{"sequence": 3, "operation": "set", "payload": {"key": "key3", "value": 3}}\n')
+            journal.write('{"sequence": 4, "operation": "set", "pay')
+
+        restarted_queue = self.create_queue()
+        restarted_queue.start()
+        restarted_queue.put("set", {"key": "key4", "value": 4})
+        restarted_queue.stop()
+
+        self.assertEqual({"key1": "1", "key2": "0.25", "key3": "3", "key4": "4"}, self.stored_values())
+        self.assertEqual(Decimal("0.25"), self.received_payloads[1]["value"])
+        self.assertEqual(4, restarted_queue._get_stored_sequence())
+
+    def test_operation_failing_while_the_database_is_unavailable_is_retried(self):
+        queue = self.create_queue()
+        queue.start()
+
+        queue.put("set", {"key": "key1", "value": 1})
+        queue.put("unavailable", {"key": "key2", "value": 2, "attempts": 3})
+        queue.put("set", {"key": "key3", "value": 3})
+
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertEqual({"key1": "1", "key2": "2", "key3": "3"}, self.stored_values())
+        self.assertEqual(3, self.unavailable_attempts)
+        queue.stop()
+
+    def test_operations_are_kept_in_the_journal_when_stopping_while_the_database_is_unavailable(self):
+        queue = self.create_queue()
+        queue.start()
+
+        queue.put("set", {"key": "key1", "value": 1})
+        queue.put("unavailable", {"key": "key2", "value": 2, "attempts": 1000})
+        queue.stop(timeout=5)
+
+        self.assertNotIn("key2", self.stored_values())
+        self.assertGreater(os.path.getsize(self.journal_path), 0)
+        # The writer thread stopped, flushing returns right away
+        self.assertFalse(queue.flush())
+
+        self.unavailable_attempts = 1000
+        restarted_queue = self.create_queue()
+        restarted_queue.start()
+        restarted_queue.stop()
+
+        self.assertEqual({"key1": "1", "key2": "2"}, self.stored_values())
+        self.assertEqual(0, os.path.getsize(self.journal_path))
+
+    def test_wait_flushed_keeps_the_event_loop_running_while_the_operations_are_applied(self):
+        queue = self.create_queue()
+        queue.start()
+        queue.put("unavailable", {"key": "key1", "value": 1, "attempts": 3})
+
+        async def wait_flushed():
+            iterations = 0
+            flushed = asyncio.ensure_future(queue.wait_flushed(timeout=5))
+            while not flushed.done():
+                iterations += 1
+                await asyncio.sleep(0.001)
+            return iterations, flushed.result()
+
+        ev_loop = asyncio.new_event_loop()
+        try:
+            iterations, flushed = ev_loop.run_until_complete(wait_flushed())
+        finally:
+            ev_loop.close()
+
+        self.assertTrue(flushed)
+        self.assertGreater(iterations, 1)
+        self.assertEqual({"key1": "1"}, self.stored_values())
+        queue.stop()
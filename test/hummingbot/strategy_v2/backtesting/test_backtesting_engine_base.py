@@ -0,0 +1,119 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class ControllerMock:
+    """
+    Opens a position every few candles while less than three are active, and stops the first losing one.
+    """
+
+    def __init__(self, candles: pd.DataFrame):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="BTC-USDT")
+        self.market_data_provider = SimpleNamespace(get_candles_df=lambda **kwargs: candles.copy(), prices={}, _time=None)
+        self.processed_data = {}
+        self.executors_info: List[ExecutorInfo] = []
+        self.calls = 0
+
+    def determine_executor_actions(self):
+        self.calls += 1
+        active_executors = [executor for executor in self.executors_info if executor.is_active]
+        actions = []
+        if self.calls % 7 == 0 and len(active_executors) < 3:
+            actions.append(CreateExecutorAction(executor_config=PositionExecutorConfig(
+                id=f"executor_{self.calls}",
+                timestamp=float(self.market_data_provider._time),
+                trading_pair="BTC-USDT",
+                connector_name="binance",
+                side=TradeType.BUY if self.calls % 2 == 0 else TradeType.SELL,
+                entry_price=Decimal(str(self.processed_data["close"])),
+                amount=Decimal("1"),
+                triple_barrier_config=TripleBarrierConfig(stop_loss=Decimal("0.01"),
+                                                          take_profit=Decimal("0.008"),
+                                                          time_limit=60 * 40,
+                                                          open_order_type=OrderType.MARKET),
+            )))
+        losing_executors = [executor for executor in active_executors
+                            if executor.is_trading and executor.net_pnl_pct < Decimal("-0.005")]
+        if len(losing_executors) > 0:
+            actions.append(StopExecutorAction(executor_id=losing_executors[0].id))
+        return actions
+
+
+class SpreadExecutorSimulation(ExecutorSimulation):
+    def get_custom_info(self, last_entry) -> dict:
+        return {**super().get_custom_info(last_entry), "spread": last_entry["spread"]}
+
+
+class BacktestingEngineBaseTests(unittest.TestCase):
+    @staticmethod
+    def candles(rows: int) -> pd.DataFrame:
+        randomizer = np.random.RandomState(3)
+        close = 100 * np.exp(np.cumsum(randomizer.normal(0, 0.002, rows)))
+        return pd.DataFrame({
+            "timestamp": 1700000000 + 60 * np.arange(rows, dtype=float),
+            "open": close,
+            "high": close * (1 + np.abs(randomizer.normal(0, 0.001, rows))),
+            "low": close * (1 - np.abs(randomizer.normal(0, 0.001, rows))),
+            "close": close,
+            "volume": randomizer.uniform(1, 10, rows),
+        })
+
+    def simulate(self, candles: pd.DataFrame, vectorized: bool):
+        engine = BacktestingEngineBase()
+        engine.controller = ControllerMock(candles)
+        engine.backtesting_resolution = "1m"
+        executors_info = asyncio.run(engine.simulate_execution(trade_cost=0.0006, vectorized=vectorized))
+        return executors_info, engine.controller.processed_data
+
+    def test_vectorized_simulation_matches_row_by_row_simulation(self):
+        candles = self.candles(600)
+        executors_info, processed_data = self.simulate(candles, vectorized=False)
+        vectorized_executors_info, vectorized_processed_data = self.simulate(candles, vectorized=True)
+
+        self.assertGreater(len(executors_info), 5)
+        self.assertEqual([info.to_dict() for info in executors_info],
+                         [info.to_dict() for info in vectorized_executors_info])
+        self.assertEqual(BacktestingEngineBase.summarize_results(executors_info),
+                         BacktestingEngineBase.summarize_results(vectorized_executors_info))
+        self.assertEqual({key: value for key, value in processed_data.items() if key != "features"},
+                         {key: value for key, value in vectorized_processed_data.items() if key != "features"})
+
+    def test_refreshed_executor_info_is_a_new_info_built_with_the_custom_info_of_the_simulation(self):
+        simulation = SpreadExecutorSimulation(
+            config=PositionExecutorConfig(id="executor", timestamp=1000.0, trading_pair="BTC-USDT",
+                                          connector_name="binance", side=TradeType.BUY, entry_price=Decimal("100"),
+                                          amount=Decimal("1")),
+            executor_simulation=pd.DataFrame({
+                "net_pnl_pct": [0.0, 0.01, 0.02],
+                "net_pnl_quote": [0.0, 1.0, 2.0],
+                "cum_fees_quote": [0.1, 0.1, 0.1],
+                "filled_amount_quote": [100.0, 100.0, 100.0],
+                "close": [100.0, 101.0, 102.0],
+                "spread": [0.5, 0.6, 0.7],
+            }, index=[1000.0, 1060.0, 1120.0]),
+            close_type=CloseType.TAKE_PROFIT,
+        )
+
+        first_info = simulation.refresh_executor_info(1000.0)
+        second_info = simulation.refresh_executor_info(1060.0)
+
+        self.assertIsNot(first_info, second_info)
+        self.assertEqual(Decimal("0"), first_info.net_pnl_quote)
+        self.assertEqual(0.5, first_info.custom_info["spread"])
+        self.assertEqual(simulation.get_executor_info_at_timestamp(1060.0).to_dict(), second_info.to_dict())
+        self.assertEqual(0.6, second_info.custom_info["spread"])
+        self.assertIs(second_info, simulation.refresh_executor_info(1061.0))
@@ -0,0 +1,136 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.backtesting_parameter_sweep import BacktestingParameterSweep
+from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction
+
+START = 1700000000
+END = 1700000000 + 60 * 600 + 30
+
+
+class SweepControllerConfig(ControllerConfigBase):
+    controller_name: str = "sweep_controller"
+    connector_name: str = "binance"
+    trading_pair: str = "BTC-USDT"
+    interval: str = "3m"
+    entry_every: int = 7
+    take_profit: Decimal = Decimal("0.008")
+
+
+class SweepController(ControllerBase):
+    """
+    Opens a position every few candles while there are less than three active, with a signal from the 3m candles.
+    """
+
+    def __init__(self, config: SweepControllerConfig, *args, **kwargs):
+        self.config = config
+        if len(self.config.candles_config) == 0:
+            self.config.candles_config = [CandlesConfig(connector=config.connector_name,
+                                                        trading_pair=config.trading_pair,
+                                                        interval=config.interval,
+                                                        max_records=config.entry_every * 10)]
+        super().__init__(config, *args, **kwargs)
+        self.calls = 0
+
+    async def update_processed_data(self):
+        candles = self.market_data_provider.get_candles_df(connector_name=self.config.connector_name,
+                                                           trading_pair=self.config.trading_pair,
+                                                           interval=self.config.interval)
+        self.processed_data["features"] = pd.DataFrame({
+            "timestamp": candles["timestamp"],
+            "signal": np.where(candles["close"].diff() > 0, 1, -1),
+        })
+
+    def determine_executor_actions(self) -> List[ExecutorAction]:
+        self.calls += 1
+        active_executors = [executor for executor in self.executors_info if executor.is_active]
+        if self.calls % self.config.entry_every != 0 or len(active_executors) >= 3:
+            return []
+        return [CreateExecutorAction(executor_config=PositionExecutorConfig(
+            id=f"executor_{self.calls}",
+            timestamp=float(self.market_data_provider.time()),
+            trading_pair=self.config.trading_pair,
+            connector_name=self.config.connector_name,
+            side=TradeType.BUY if self.processed_data["signal"] > 0 else TradeType.SELL,
+            entry_price=Decimal(str(self.processed_data["close"])),
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(stop_loss=Decimal("0.01"),
+                                                      take_profit=self.config.take_profit,
+                                                      time_limit=60 * 40,
+                                                      open_order_type=OrderType.MARKET),
+        ))]
+
+    def to_format_status(self) -> List[str]:
+        return []
+
+
+class BacktestingParameterSweepTests(unittest.TestCase):
+    @staticmethod
+    def historical_candles(config: HistoricalCandlesConfig) -> pd.DataFrame:
+        interval_in_seconds = CandlesBase.interval_to_seconds[config.interval]
+        timestamps = np.arange(config.start_time - config.start_time % interval_in_seconds, config.end_time + 1,
+                               interval_in_seconds, dtype=float)
+        close = 100 * np.exp(np.sin(timestamps / 7200) * 0.05 + np.cos(timestamps / 1300) * 0.01)
+        return pd.DataFrame({"timestamp": timestamps, "open": close, "high": close * 1.001, "low": close * 0.999,
+                             "close": close, "volume": np.ones(len(timestamps)), "quote_asset_volume": close,
+                             "n_trades": np.ones(len(timestamps)), "taker_buy_base_volume": np.ones(len(timestamps)),
+                             "taker_buy_quote_volume": close})
+
+    def test_sweep_loads_shared_candles_once_and_returns_the_results_of_each_configuration(self):
+        sweep = BacktestingParameterSweep(max_workers=2)
+        trading_rules = {"binance": {"BTC-USDT": TradingRule("BTC-USDT")}}
+        sweep.backtesting_data_provider.trading_rules = trading_rules
+        parameter_grid = {"entry_every": [5, 9], "take_profit": [Decimal("0.004"), Decimal("0.008")]}
+
+        async def get_historical_candles(candles_feed, config):
+            return self.historical_candles(config)
+
+        with patch.object(CandlesBase, "get_historical_candles", autospec=True,
+                          side_effect=get_historical_candles) as fetch:
+            results = asyncio.run(sweep.run(SweepControllerConfig(), parameter_grid, START, END))
+
+        # 1m candles for the executors and 3m candles for the controller, fetched once for the four configurations
+        self.assertEqual(2, fetch.call_count)
+        fetched_intervals = sorted(call.kwargs["config"].interval for call in fetch.call_args_list)
+        self.assertEqual(["1m", "3m"], fetched_intervals)
+        three_minutes_config = next(call.kwargs["config"] for call in fetch.call_args_list
+                                    if call.kwargs["config"].interval == "3m")
+        self.assertEqual(START - 90 * 180, three_minutes_config.start_time)
+
+        self.assertEqual(4, len(results))
+        self.assertEqual([5, 5, 9, 9], results["entry_every"].tolist())
+        self.assertEqual([Decimal("0.004"), Decimal("0.008")] * 2, results["take_profit"].tolist())
+        self.assertTrue((results["total_executors"] > 0).all())
+
+        for _, row in results.iterrows():
+            engine = BacktestingEngineBase()
+            engine.backtesting_data_provider.candles_feeds = dict(sweep.backtesting_data_provider.candles_feeds)
+            engine.backtesting_data_provider.trading_rules = trading_rules
+            config = SweepControllerConfig(entry_every=row["entry_every"], take_profit=row["take_profit"])
+            expected_results = asyncio.run(engine.run_backtesting(config, START, END))["results"]
+            self.assertEqual(expected_results, row[list(expected_results.keys())].to_dict())
+
+    def test_build_controller_configs_validates_every_combination(self):
+        base_config = SweepControllerConfig(id="base", trading_pair="ETH-USDT")
+
+        configs = BacktestingParameterSweep.build_controller_configs(base_config, {"entry_every": [3, 4],
+                                                                                   "interval": ["1m", "5m"]})
+
+        self.assertEqual([(3, "1m"), (3, "5m"), (4, "1m"), (4, "5m")],
+                         [(config.entry_every, config.interval) for config in configs])
+        self.assertTrue(all(config.trading_pair == "ETH-USDT" for config in configs))
+        self.assertEqual(4, len({config.id for config in configs}))
+        self.assertNotIn("base", {config.id for config in configs})
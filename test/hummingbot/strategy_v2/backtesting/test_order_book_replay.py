@@ -0,0 +1,165 @@
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.data_feed.market_data_capture import MarketDataCapture
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.order_book_replay import OrderBookReplay, OrderBookReplayBacktester
+
+
+def levels_columns(timestamps: List[float], bids: List[List[float]], asks: List[List[float]], depth: int = 3):
+    """
+    Builds the captured order book columns, bids and asks holding [price, amount] rows for each timestamp.
+    """
+    columns = {"timestamp": np.array(timestamps, dtype=np.float64)}
+    for side, levels in (("bid", bids), ("ask", asks)):
+        prices = np.full((len(timestamps), depth), np.nan)
+        amounts = np.full((len(timestamps), depth), np.nan)
+        for row, row_levels in enumerate(levels):
+            for i, (price, amount) in enumerate(row_levels):
+                prices[row, i] = price
+                amounts[row, i] = amount
+        columns[f"{side}_price"] = prices
+        columns[f"{side}_amount"] = amounts
+    return columns
+
+
+def trades_columns(trades: List[tuple]):
+    timestamps, prices, amounts, trade_types = zip(*trades)
+    return {"timestamp": np.array(timestamps, dtype=np.float64),
+            "price": np.array(prices, dtype=np.float64),
+            "amount": np.array(amounts, dtype=np.float64),
+            "trade_type": np.array([trade_type.value for trade_type in trade_types], dtype=np.int8)}
+
+
+class LimitOrderStrategy(PyTimeIterator):
+    def __init__(self, backtester: OrderBookReplayBacktester):
+        super().__init__()
+        self.backtester = backtester
+        self.order_id = None
+        self.best_bids = []
+
+    def tick(self, timestamp: float):
+        self.best_bids.append(self.backtester.exchange.get_price("BTC-USDT", False))
+        if self.order_id is None:
+            self.order_id = self.backtester.exchange.buy("BTC-USDT", Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+
+
+class OrderBookReplayTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # The paper trade exchange schedules its network check when the clock starts
+        self.async_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.async_loop)
+
+    def test_events_are_applied_in_timestamp_order_up_to_each_tick(self):
+        order_book = OrderBook()
+        trade_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        replay = OrderBookReplay({"BTC-USDT": order_book})
+        replay.add_trades("BTC-USDT", trades_columns([(2, 100.5, 0.1, TradeType.BUY), (3, 99.5, 0.2, TradeType.SELL)]))
+        replay.add_diffs("BTC-USDT", levels_columns([2, 3], [[(99, 0)], [(99.5, 4)]], [[(102, 3)], []]))
+        replay.add_snapshots("BTC-USDT", levels_columns([1, 3], [[(100, 1), (99, 2)], [(98, 1)]],
+                                                        [[(101, 1)], [(103, 1), (104, 2)]]))
+        self.assertEqual(6, replay.pending_events)
+
+        replay.tick(1)
+        self.assertEqual([[100, 1], [99, 2]], [[row.price, row.amount] for row in order_book.bid_entries()])
+
+        replay.tick(2.5)
+        # The diff removed the 99 bid level and added the 102 ask level
+        self.assertEqual([[100, 1]], [[row.price, row.amount] for row in order_book.bid_entries()])
+        self.assertEqual([[101, 1], [102, 3]], [[row.price, row.amount] for row in order_book.ask_entries()])
+        self.assertEqual(1, len(trade_logger.event_log))
+        self.assertEqual(Decimal("100.5"), trade_logger.event_log[0].price)
+
+        replay.tick(3)
+        # The snapshot is applied before the diff and the trade with the same timestamp
+        self.assertEqual([[99.5, 4], [98, 1]], [[row.price, row.amount] for row in order_book.bid_entries()])
+        self.assertEqual([[103, 1], [104, 2]], [[row.price, row.amount] for row in order_book.ask_entries()])
+        self.assertEqual(2, len(trade_logger.event_log))
+        self.assertEqual(99.5, order_book.last_trade_price)
+        self.assertEqual(0, replay.pending_events)
+
+    def test_unknown_trading_pair_is_rejected(self):
+        replay = OrderBookReplay({"BTC-USDT": OrderBook()})
+        with self.assertRaises(ValueError):
+            replay.add_trades("ETH-USDT", trades_columns([(1, 100, 1, TradeType.BUY)]))
+
+    def test_backtester_tracks_composite_books_with_an_initialized_tracker(self):
+        backtester = OrderBookReplayBacktester("binance", ["BTC-USDT"], start_time=1000, end_time=1010)
+        tracker = backtester.order_book_tracker
+
+        self.assertIsInstance(tracker.order_books["BTC-USDT"], CompositeOrderBook)
+        self.assertTrue(tracker.ready)
+        # The state set up by OrderBookTracker is available to the paper trade exchange
+        self.assertEqual(0, tracker._order_book_trade_stream.qsize())
+
+    def test_limit_order_is_filled_by_replayed_trades(self):
+        backtester = OrderBookReplayBacktester("binance", ["BTC-USDT"], start_time=1000, end_time=1010)
+        backtester.set_balance("BTC", Decimal("0"))
+        backtester.set_balance("USDT", Decimal("1000"))
+        timestamps = list(range(1000, 1011))
+        backtester.replay.add_snapshots("BTC-USDT", levels_columns(
+            timestamps,
+            [[(99 + i / 10, 1), (98, 2)] for i in range(len(timestamps))],
+            [[(101, 1), (102, 2)]] * len(timestamps)))
+        # A sell above the order price doesn't fill it, the one below does
+        backtester.replay.add_trades("BTC-USDT", trades_columns([(1003, 99.6, 5, TradeType.SELL),
+                                                                 (1005.5, 99.4, 5, TradeType.SELL)]))
+        fill_logger = EventLogger()
+        backtester.exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        strategy = LimitOrderStrategy(backtester)
+        backtester.add_strategy(strategy)
+
+        backtester.run()
+
+        # The clock ticks after start_time, so the first snapshots are applied together
+        self.assertEqual(10, len(strategy.best_bids))
+        self.assertEqual(Decimal("99.1"), strategy.best_bids[0])
+        self.assertEqual(Decimal("100"), strategy.best_bids[-1])
+        self.assertEqual(1, len(fill_logger.event_log))
+        fill = fill_logger.event_log[0]
+        self.assertEqual(strategy.order_id, fill.order_id)
+        self.assertEqual(Decimal("99.5"), fill.price)
+        self.assertEqual(1006, fill.timestamp)
+        # The binance trade fee is deducted from the bought asset
+        self.assertEqual(Decimal("0.999"), backtester.exchange.get_balance("BTC"))
+        self.assertEqual(Decimal("900.5"), backtester.exchange.get_balance("USDT"))
+        self.assertEqual(0, len(backtester.exchange.limit_orders))
+
+    def test_captured_snapshots_diffs_and_trades_are_loaded(self):
+        backtester = OrderBookReplayBacktester("binance", ["BTC-USDT"], start_time=1000, end_time=1004)
+        with tempfile.TemporaryDirectory() as directory:
+            capture = MarketDataCapture(path=directory, depth=2)
+            capture.start()
+            order_book = OrderBook()
+            order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                            np.array([[101, 1, 1]], dtype=np.float64))
+            capture.record_order_book("binance", "BTC-USDT", 1000.5, order_book)
+            capture.record_diff("binance", "BTC-USDT", 1002.5, np.array([[99.5, 2, 2]]), np.array([[101, 0, 2]]))
+            capture.record_trade("binance", OrderBookTradeEvent(trading_pair="BTC-USDT", timestamp=1003.5,
+                                                                type=TradeType.SELL, price=Decimal("99.5"),
+                                                                amount=Decimal("1")))
+            capture.stop()
+            backtester.load_market_data(BacktestingDataProvider(connectors={}, market_data_capture=capture))
+
+        strategy = LimitOrderStrategy(backtester)
+        strategy.order_id = "no order"
+        backtester.add_strategy(strategy)
+        backtester.run()
+
+        self.assertEqual([Decimal("99"), Decimal("99"), Decimal("99.5"), Decimal("99.5")], strategy.best_bids)
+        book = backtester.order_book_tracker.order_books["BTC-USDT"]
+        self.assertEqual(0, len(list(book.ask_entries())))
+        self.assertEqual(99.5, book.last_trade_price)
@@ -106,6 +106,26 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 5)
 
+    @patch.object(PositionExecutor, "start")
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_create_executor_with_event_driven_scheduling(self, markets_recorder_mock, position_start_mock: MagicMock):
+        markets_recorder_mock.return_value = MagicMock(spec=MarketsRecorder)
+        orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy, event_driven_scheduling=True,
+                                            executors_fallback_interval=30.0)
+        self.assertEqual(30.0, orchestrator.scheduler.fallback_interval)
+        self.assertIsNone(self.orchestrator.scheduler)
+        self.assertEqual({}, self.orchestrator.get_executors_cpu_usage())
+
+        position_executor_config = PositionExecutorConfig(
+            timestamp=1234, connector_name="binance",
+            trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(10))
+        orchestrator.execute_action(CreateExecutorAction(executor_config=position_executor_config,
+                                                         controller_id="test"))
+
+        executor = orchestrator.active_executors["test"][0]
+        self.assertIs(orchestrator.scheduler, executor._scheduler)
+        position_start_mock.assert_called_once()
+
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
         position_executor.is_active = True
@@ -0,0 +1,124 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Optional
+from unittest.mock import MagicMock, PropertyMock
+
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import OrderCancelledEvent
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.strategy_v2.models.base import RunnableStatus
+
+
+class ExecutorConfigForTest(ExecutorConfigBase):
+    type: str = "test_executor"
+    connector_name: str = "connector1"
+    trading_pair: str = "ETH-USDT"
+
+
+class ExecutorForTest(ExecutorBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.control_task_runs = 0
+        self.deadline: Optional[float] = None
+        self.stopped = False
+
+    async def on_start(self):
+        pass
+
+    def on_stop(self):
+        self.stopped = True
+
+    async def control_task(self):
+        self.control_task_runs += 1
+
+    def get_next_wake_up_timestamp(self) -> Optional[float]:
+        return self.deadline
+
+
+class ExecutorSchedulerTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.price = Decimal("1000")
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.current_timestamp = 1000.0
+        type(self.strategy).trading_pair = PropertyMock(return_value="ETH-USDT")
+        self.strategy.buy.side_effect = ["OID-BUY-1", "OID-BUY-2"]
+        connector = MagicMock(spec=ExchangePyBase)
+        connector.get_price_by_type.side_effect = lambda trading_pair, price_type: self.price
+        self.strategy.connectors = {"connector1": connector}
+        self.scheduler = ExecutorScheduler(self.strategy, fallback_interval=60, price_check_interval=0.01)
+
+    def tearDown(self):
+        self.scheduler.stop()
+        super().tearDown()
+
+    def create_executor(self, executor_id: str) -> ExecutorForTest:
+        executor = ExecutorForTest(strategy=self.strategy, connectors=["connector1"],
+                                   config=ExecutorConfigForTest(id=executor_id, timestamp=1000), update_interval=0.5)
+        executor.set_scheduler(self.scheduler)
+        executor.start()
+        return executor
+
+    async def test_executor_runs_on_start_and_on_its_order_events(self):
+        executor = self.create_executor("executor_1")
+        other_executor = self.create_executor("executor_2")
+        await asyncio.sleep(0.05)
+        self.assertEqual(RunnableStatus.RUNNING, executor.status)
+        self.assertEqual(1, executor.control_task_runs)
+        self.assertEqual(1, other_executor.control_task_runs)
+
+        order_id = executor.place_order("connector1", "ETH-USDT", OrderType.LIMIT, TradeType.BUY, Decimal("1"),
+                                        price=Decimal("990"))
+        self.scheduler._process_order_event(0, None, OrderCancelledEvent(timestamp=1001, order_id=order_id))
+        self.scheduler._process_order_event(0, None, OrderCancelledEvent(timestamp=1001, order_id="OID-OTHER"))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(2, executor.control_task_runs)
+        self.assertEqual(1, other_executor.control_task_runs)
+
+    async def test_executor_runs_when_price_moves_beyond_threshold(self):
+        executor = self.create_executor("executor_1")
+        await asyncio.sleep(0.05)
+
+        self.price = Decimal("1000.1")
+        await asyncio.sleep(0.05)
+        self.assertEqual(1, executor.control_task_runs)
+
+        self.price = Decimal("1001")
+        await asyncio.sleep(0.05)
+        self.assertEqual(2, executor.control_task_runs)
+
+    async def test_executor_runs_at_its_deadline_and_fallback_interval(self):
+        executor = self.create_executor("executor_1")
+        executor.deadline = 1010.0
+        await asyncio.sleep(0.05)
+
+        self.strategy.current_timestamp = 1009.0
+        await asyncio.sleep(0.05)
+        self.assertEqual(1, executor.control_task_runs)
+
+        self.strategy.current_timestamp = 1010.0
+        await asyncio.sleep(0.05)
+        self.assertEqual(2, executor.control_task_runs)
+
+        self.strategy.current_timestamp = 1070.0
+        await asyncio.sleep(0.05)
+        self.assertEqual(3, executor.control_task_runs)
+
+    async def test_stopped_executor_is_removed_and_keeps_its_cpu_usage(self):
+        executor = self.create_executor("executor_1")
+        await asyncio.sleep(0.05)
+
+        executor.stop()
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(executor.stopped)
+        self.assertEqual(0, self.scheduler.scheduled_executors_count)
+        cpu_usage = self.scheduler.get_cpu_usage()["executor_1"]
+        self.assertEqual(1, cpu_usage.runs)
+        self.assertGreaterEqual(cpu_usage.cpu_time, 0)